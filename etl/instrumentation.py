@@ -0,0 +1,207 @@
+import os
+import sys
+import csv
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from etl.profiling import profile
+from config import RUN_REPORT_DIRECTORY
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Columns of the run report, in order
+REPORT_COLUMNS = ['job', 'stage', 'status', 'started_at', 'wall_time', 'cpu_time', 'peak_rss', 'rows_in', 'rows_out',
+                  'bytes_read', 'bytes_written', 'input_bytes', 'output_bytes']
+
+
+def io_counters():
+    """
+    :return: tuple of the (bytes read, bytes written) by the current process, including sockets (e.g. downloads and
+    database connections), None when unknown. Note: bytes of worker processes are not included.
+    """
+    try:
+        with open('/proc/self/io') as f:
+            counters = dict(line.split(': ') for line in f.read().splitlines())
+    except OSError:
+        return None, None
+
+    return int(counters['rchar']), int(counters['wchar'])
+
+
+def cpu_time():
+    """
+    :return: CPU time in seconds of the current process and its (finished) worker processes, e.g. a process pool.
+    """
+    if resource is None:
+        return time.process_time()
+
+    return sum(usage.ru_utime + usage.ru_stime for usage in [resource.getrusage(resource.RUSAGE_SELF),
+                                                             resource.getrusage(resource.RUSAGE_CHILDREN)])
+
+
+def reset_peak_rss():
+    """
+    Resets the peak resident set size of the current process (Linux only), such that the peak of each stage is
+    measured instead of the peak since the process started.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def peak_rss():
+    """
+    :return: peak resident set size in bytes of the current process, None when unknown.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+
+    # Kilobytes on Linux, bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def directory_size(directory):
+    """
+    :return: total size in bytes of the files within a directory (recursively), None when it doesn't exist.
+    """
+    if directory is None or not Path(directory).is_dir():
+        return None
+
+    return sum(file.stat().st_size for file in Path(directory).rglob('*') if file.is_file())
+
+
+class StageMetrics:
+    """
+    Metrics of one stage (extract, transform or load) of one job. Rows are filled in by the caller when known,
+    e.g. the length of the dataframe handed over by the transformer.
+    """
+
+    def __init__(self, job, stage):
+        self.job = job
+        self.stage = stage
+        self.status = 'running'
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.wall_time = None
+        self.cpu_time = None
+        self.peak_rss = None
+        self.rows_in = None
+        self.rows_out = None
+        self.bytes_read = None
+        self.bytes_written = None
+        self.input_bytes = None
+        self.output_bytes = None
+
+    def to_dict(self):
+        return {column: getattr(self, column) for column in REPORT_COLUMNS}
+
+
+class RunReport:
+    """
+    Machine-readable report of one run, holding the wall time, CPU time, peak memory, rows and bytes of every stage
+    of every job. The report is written (as JSON and CSV) after each stage, such that an aborted run still
+    tells where the time went.
+    """
+
+    def __init__(self, directory=RUN_REPORT_DIRECTORY, run_id=None):
+        """
+        :param directory: directory holding the reports, e.g. 'static/etl/runs'.
+        :param run_id: name of the report files, defaults to the start time of the run.
+        """
+        self._directory = Path(directory)
+        self._run_id = run_id or datetime.now().strftime('%Y%m%dT%H%M%S')
+        self._stages = []
+
+    @property
+    def run_id(self):
+        return self._run_id
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def stages(self):
+        return self._stages
+
+    @contextmanager
+    def stage(self, job, stage, input_directory=None, output_directory=None, profile_modes=()):
+        """
+        Measures the code run within the context, e.g.
+
+            with report.stage(job='BIOCLIM_1', stage='transform') as metrics:
+                dataframe = transform(...)
+                metrics.rows_out = len(dataframe)
+
+        :param job: name of the job.
+        :param stage: name of the stage, e.g. 'transform'.
+        :param input_directory: directory of the files the stage reads, of which the size is reported.
+        :param output_directory: directory of the files the stage writes, of which the size is reported.
+        :param profile_modes: profiling modes of the stage (see 'etl.profiling'), the profiles are written within the
+        directory '<run id>' next to the report.
+        """
+        metrics = StageMetrics(job=job, stage=stage)
+        self._stages.append(metrics)
+
+        reset_peak_rss()
+        bytes_read, bytes_written = io_counters()
+        start_cpu_time = cpu_time()
+        start_time = time.perf_counter()
+
+        try:
+            with profile(directory=self._directory / self._run_id, name=f'{job}-{stage}', modes=profile_modes):
+                yield metrics
+            metrics.status = 'succeeded'
+        except BaseException:
+            metrics.status = 'failed'
+            raise
+        finally:
+            metrics.wall_time = round(time.perf_counter() - start_time, 3)
+            metrics.cpu_time = round(cpu_time() - start_cpu_time, 3)
+            metrics.peak_rss = peak_rss()
+
+            end_bytes_read, end_bytes_written = io_counters()
+            if bytes_read is not None:
+                metrics.bytes_read = end_bytes_read - bytes_read
+                metrics.bytes_written = end_bytes_written - bytes_written
+
+            metrics.input_bytes = directory_size(input_directory)
+            metrics.output_bytes = directory_size(output_directory)
+
+            print(f'{job} {stage} {metrics.status} in {metrics.wall_time}s (cpu {metrics.cpu_time}s, '
+                  f'peak rss {(metrics.peak_rss or 0) / 1024 ** 2:.0f} MB)')
+
+            self.save()
+
+    def save(self):
+        """
+        Writes the report files '<run id>.json' and '<run id>.csv'.
+        """
+        if not self._directory.is_dir():
+            Path.mkdir(self._directory, parents=True, exist_ok=True)
+
+        with open(self._directory / f'{self._run_id}.json', 'w') as f:
+            json.dump({'run_id': self._run_id,
+                       'pid': os.getpid(),
+                       'stages': [metrics.to_dict() for metrics in self._stages]}, f, indent=2)
+
+        with open(self._directory / f'{self._run_id}.csv', 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(metrics.to_dict() for metrics in self._stages)
@@ -11,7 +11,11 @@ from etl.transform.transformers.tree import Amsterdam as TreeAmsterdamTransforme
 from etl.transform.transformers.opm import Amsterdam as OPMAmsterdamTransformer
 from etl.transform.transformers.tree import Gelderland as TreeGelderlandTransformer
 from etl.transform.transformers.opm import Gelderland as OPMGelderlandTransformer
-from etl.transform.transformers.soil import WURAlterra as WURAlterraTransformer
+from etl.transform.transformers.soil import (
+    WURAlterra as WURAlterraTransformer,
+    NeighbourhoodSoil as NeighbourhoodSoilTransformer
+)
+from etl.transform.transformers.great_tit import GreatTit as GreatTitTransformer
 from etl.load.loaders.dummy import Dummy as DummyLoader
 from etl.load.loaders.KNMI import KNMIWeatherStationLocation as KNMIWeatherStationLocationLoader
 from etl.load.loaders.KNMI import KNMIWeatherStationData as KNMIWeatherStationDataLoader
@@ -24,7 +28,10 @@ from etl.load.loaders.tree import Amsterdam as TreeAmsterdamLoader
 from etl.load.loaders.opm import Amsterdam as OPMAmsterdamLoader
 from etl.load.loaders.tree import Gelderland as TreeGelderlandLoader
 from etl.load.loaders.opm import Gelderland as OPMGelderlandLoader
-from etl.load.loaders.soil import WURAlterra as WURAlterraLoader
+from etl.load.loaders.soil import (
+    WURAlterra as WURAlterraLoader,
+    NeighbourhoodSoil as NeighbourhoodSoilLoader
+)
 from etl.load.loaders.geographical_unit import (
     Neighbourhood as NeighbourhoodLoader,
     Township as TownshipLoader,
@@ -106,143 +113,179 @@ ETL_JOBS = [
     ETLJob(name='BIOCLIM_1',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_1),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_1)),
     ETLJob(name='BIOCLIM_2',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_2),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_2)),
     ETLJob(name='BIOCLIM_3',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_3),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_3)),
     ETLJob(name='BIOCLIM_4',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_4),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_4)),
     ETLJob(name='BIOCLIM_5',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_5),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_5)),
     ETLJob(name='BIOCLIM_6',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_6),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_6)),
     ETLJob(name='BIOCLIM_7',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_7),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_7)),
     ETLJob(name='BIOCLIM_8',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_8),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_8)),
     ETLJob(name='BIOCLIM_9',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_9),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_9)),
     ETLJob(name='BIOCLIM_10',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_10),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_10)),
     ETLJob(name='BIOCLIM_11',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_11),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_11)),
     ETLJob(name='BIOCLIM_12',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_12),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_12)),
     ETLJob(name='BIOCLIM_13',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_13),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_13)),
     ETLJob(name='BIOCLIM_14',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_14),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_14)),
     ETLJob(name='BIOCLIM_15',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_15),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_15)),
     ETLJob(name='BIOCLIM_16',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_16),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_16)),
     ETLJob(name='BIOCLIM_17',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_17),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_17)),
     ETLJob(name='BIOCLIM_18',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_18),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_18)),
     ETLJob(name='BIOCLIM_19',
            gs_uris=['gs://vaa-opm/KNMI/station_data.csv',
                     'gs://vaa-opm/KNMI/station_locations.csv',
-                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=BioClimTransformerFactory.get_bioclim(BioClimTransformerEnums.bioclim_19),
            loader=BioClimLoaderFactory.get_bioclim(BioClimLoaderEnums.bioclim_19)),
     # ETLJob(name='Vlinderstichting',
-    #        gs_uris=['gs://vaa-opm/Vlinderstichting/vlinderstichting_2017-2019.csv'],
+    #        gs_uris=['gs://vaa-opm/Vlinderstichting/vlinderstichting_2017-2019.csv',
+    #                 'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+    #                 'gs://vaa-opm/Geographical_units/provinces.csv'],
     #        transformer=VlinderstichtingTransformer(),
     #        loader=VlinderStichtingLoader()),
     ETLJob(name='Amsterdam_trees',
-           gs_uris=['gs://vaa-opm/Local-governments/Amsterdam/bomenbestand.csv'],
+           gs_uris=['gs://vaa-opm/Local-governments/Amsterdam/bomenbestand.csv',
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=TreeAmsterdamTransformer(),
            loader=TreeAmsterdamLoader()),
     ETLJob(name='Amsterdam_OPM',
-           gs_uris=['gs://vaa-opm/Local-governments/Amsterdam/bomenbestand_geinfecteerd.csv'],
+           gs_uris=['gs://vaa-opm/Local-governments/Amsterdam/bomenbestand_geinfecteerd.csv',
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=OPMAmsterdamTransformer(),
            loader=OPMAmsterdamLoader()),
     ETLJob(name='Gelderland_trees',
-           gs_uris=['gs://vaa-opm/Local-governments/Gelderland/bomenbestand.csv'],
+           gs_uris=['gs://vaa-opm/Local-governments/Gelderland/bomenbestand.csv',
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=TreeGelderlandTransformer(),
            loader=TreeGelderlandLoader()),
     ETLJob(name='Gelderland_opm',
-           gs_uris=['gs://vaa-opm/Local-governments/Gelderland/bomenbestand_geinfecteerd.csv'],
+           gs_uris=['gs://vaa-opm/Local-governments/Gelderland/bomenbestand_geinfecteerd.csv',
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
            transformer=OPMGelderlandTransformer(),
            loader=OPMGelderlandLoader()),
     ETLJob(name='Bodemkaart_WUR_Alterra',
            gs_uris=['gs://vaa-opm/Bodem/bodemkaart.csv'],
            transformer=WURAlterraTransformer(),
            loader=WURAlterraLoader()),
+    ETLJob(name='Neighbourhood_soil',
+           gs_uris=['gs://vaa-opm/Bodem/bodemkaart.csv',
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv'],
+           transformer=NeighbourhoodSoilTransformer(),
+           loader=NeighbourhoodSoilLoader()),
     ETLJob(name='Great_tit',
-           gs_uris=['gs://vaa-opm/Predators/great_tit.csv'],
-           transformer=PassthroughTransformer(),
+           gs_uris=['gs://vaa-opm/Predators/great_tit.csv',
+                    'gs://vaa-opm/Geographical_units/neighbourhoods.csv',
+                    'gs://vaa-opm/Geographical_units/provinces.csv'],
+           transformer=GreatTitTransformer(),
            loader=GreatTitLoader())
 ]
@@ -0,0 +1,73 @@
+import io
+from etl.load.partitioning import (
+    is_partitioned,
+    partition_name,
+    check_partitioned,
+    create_partition,
+    truncate_partition,
+    delete_year
+)
+from config import SQLALCHEMY_ENGINE, COPY_CHUNK_SIZE
+
+
+def copy_dataframe(connection, table_name, dataframe, chunk_size=COPY_CHUNK_SIZE):
+    """
+    Streams a dataframe into a table using postgres' COPY, which is considerably faster than (batched) inserts.
+    The dataframe is serialised in chunks, such that only one chunk is held as text in memory.
+
+    Note: geometries are written in their text representation (WKT or hex EWKB), which postgis parses on COPY.
+
+    :param connection: sqlalchemy connection, the COPY is part of its current transaction.
+    :param table_name: name of the table (or partition) to copy into.
+    :param dataframe: dataframe whose column names match the table's column names.
+    :param chunk_size: number of rows per COPY statement.
+    """
+    columns = ', '.join(dataframe.columns)
+    cursor = connection.connection.cursor()
+
+    for start in range(0, len(dataframe), chunk_size):
+        buffer = io.StringIO()
+        dataframe.iloc[start:start + chunk_size].to_csv(buffer, header=False, index=False, na_rep='')
+        buffer.seek(0)
+
+        cursor.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+    cursor.close()
+
+
+def bulk_insert(model, dataframe, years=None, replace=True, engine=SQLALCHEMY_ENGINE):
+    """
+    Streams a dataframe into the table of the given model. When the table is partitioned by year, rows are
+    grouped per year and copied directly into their partition, partitions are created on demand.
+
+    :param model: sqlalchemy model.
+    :param dataframe: dataframe whose column names match the column names of the model.
+    :param years: series holding the year of each row, only required for partitioned tables.
+    :param replace: empty the partition of a year before loading it, such that a reload of a year only
+    rewrites that partition. Tables which are not partitioned have the rows of the loaded years deleted instead,
+    within the same transaction as the COPY.
+    """
+    table = model.__table__
+
+    if not is_partitioned(table):
+        with engine.begin() as connection:
+            if replace and years is not None:
+                for year in sorted(set(years.values)):
+                    delete_year(connection=connection, table=table, year=int(year))
+
+            copy_dataframe(connection=connection, table_name=table.name, dataframe=dataframe)
+        return
+
+    with engine.begin() as connection:
+        check_partitioned(connection=connection, table=table)
+
+    for year, dataframe_year in dataframe.groupby(years.values):
+        year = int(year)
+
+        with engine.begin() as connection:
+            create_partition(connection=connection, table=table, year=year)
+
+            if replace:
+                truncate_partition(connection=connection, table=table, year=year)
+
+            copy_dataframe(connection=connection, table_name=partition_name(table, year), dataframe=dataframe_year)
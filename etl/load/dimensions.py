@@ -0,0 +1,85 @@
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from etl.load.models.geographical_unit import Neighbourhood as NeighbourhoodObject
+from config import SQLALCHEMY_ENGINE
+
+
+def get_dimension_ids(model, values, key='name', insert_missing=True, engine=SQLALCHEMY_ENGINE):
+    """
+    Retrieves the ids of the given values within a dimension table, e.g. 'species' or 'origins'.
+
+    :param model: sqlalchemy model of the dimension table.
+    :param values: values to retrieve the ids for.
+    :param key: (unique) column of the dimension table holding the values.
+    :param insert_missing: add values which are not yet known to the dimension table.
+    :return: dictionary mapping each value to its id.
+    """
+    table = model.__table__
+    values = set(values)
+
+    with engine.begin() as connection:
+        if insert_missing and values:
+            connection.execute(insert(table)
+                               .values([{key: value} for value in values])
+                               .on_conflict_do_nothing(index_elements=[key]))
+
+        rows = connection.execute(select([table.c[key], table.c.id]).where(table.c[key].in_(values)))
+
+        return {value: id for value, id in rows}
+
+
+def get_categorical_ids(model, values, key='name', insert_missing=True, allow_unknown=False,
+                        engine=SQLALCHEMY_ENGINE):
+    """
+    Translates (categorical) values into ids of the given dimension table. Only the distinct values
+    (categories) are looked up, the ids are then taken by category code.
+
+    :param model: sqlalchemy model of the dimension table.
+    :param values: series holding the values.
+    :param key: (unique) column of the dimension table holding the values.
+    :param insert_missing: add values which are not yet known to the dimension table.
+    :param allow_unknown: map values which are not within the dimension table to <NA>, instead of raising a
+    KeyError, only applies when missing values are not inserted.
+    :return: series of (nullable) integer ids, missing values map to <NA>.
+    """
+    # Categories which don't occur need not be known
+    categorical = values.astype('category').cat.remove_unused_categories()
+    categories = categorical.cat.categories
+
+    dimension_ids = get_dimension_ids(model=model, values=categories, key=key, insert_missing=insert_missing,
+                                      engine=engine)
+
+    unknown = [category for category in categories if category not in dimension_ids]
+
+    if unknown and not allow_unknown:
+        raise KeyError(f'Unknown {key}(s) within {model.__table__.name}: {", ".join(map(str, sorted(unknown)[:10]))}'
+                       + (f' and {len(unknown) - 10} more' if len(unknown) > 10 else ''))
+
+    # Last element is taken for code -1 (missing value)
+    ids = pd.array([dimension_ids.get(category) for category in categories] + [None], dtype='Int64')
+
+    return pd.Series(ids[categorical.cat.codes.values], index=values.index)
+
+
+def get_region_ids(dataframe):
+    """
+    Translates the region codes with which a transformer tagged its points (see 'etl.transform.regions')
+    into the foreign keys of the region tables. Regions which have not been tagged are left out.
+
+    :param dataframe: final transformation holding the (categorical) columns 'neighbourhood' and/or 'province'.
+    :return: dictionary mapping the foreign key columns to their values.
+    """
+    region_ids = {}
+
+    if 'neighbourhood' in dataframe:
+        region_ids['neighbourhood_id'] = get_categorical_ids(model=NeighbourhoodObject,
+                                                             values=dataframe['neighbourhood'],
+                                                             key='code',
+                                                             insert_missing=False)
+
+    if 'province' in dataframe:
+        # Provinces are keyed by their code
+        region_ids['province_code'] = dataframe['province'].astype('object')
+
+    return region_ids
@@ -0,0 +1,161 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from sqlalchemy import text
+from etl.load.partitioning import is_partitioned
+from config import (
+    SQLALCHEMY_ENGINE,
+    INDEX_BUILD_WORKERS,
+    INDEX_MAINTENANCE_WORK_MEM,
+    INDEX_PARALLEL_MAINTENANCE_WORKERS,
+    CLUSTER_AFTER_LOAD,
+    ANALYZE_AFTER_LOAD
+)
+
+
+def get_cluster_index(table):
+    """
+    Retrieves the index a table should be physically ordered on, declared in the model by
+    setting info={'cluster': True} on the index.
+    :param table: sqlalchemy table.
+    :return: index or None when no index is marked for clustering.
+    """
+    return next((index for index in table.indexes if index.info.get('cluster')), None)
+
+
+def drop_indexes(table, engine=SQLALCHEMY_ENGINE):
+    """
+    Drops all indexes declared on the model of the given table, such that rows can be bulk inserted
+    without updating the indexes for every row.
+    """
+    with engine.begin() as connection:
+        for index in table.indexes:
+            connection.execute(text(f'DROP INDEX IF EXISTS {index.name}'))
+
+
+def create_index(index, engine=SQLALCHEMY_ENGINE):
+    with engine.begin() as connection:
+        # Settings only apply to the current transaction, the connection is returned clean to the pool
+        connection.execute(text(f"SET LOCAL maintenance_work_mem = '{INDEX_MAINTENANCE_WORK_MEM}'"))
+        connection.execute(text(f'SET LOCAL max_parallel_maintenance_workers = {INDEX_PARALLEL_MAINTENANCE_WORKERS}'))
+        connection.execute(text(f'DROP INDEX IF EXISTS {index.name}'))
+        index.create(bind=connection)
+
+
+def create_indexes(table, engine=SQLALCHEMY_ENGINE, workers=INDEX_BUILD_WORKERS):
+    """
+    (Re)builds all indexes declared on the model of the given table. Indexes are built in parallel,
+    each on its own connection.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume results, such that exceptions raised within a worker are re-raised here
+        list(executor.map(lambda index: create_index(index=index, engine=engine), table.indexes))
+
+
+def cluster(table, engine=SQLALCHEMY_ENGINE):
+    """
+    Physically reorders the table on its cluster index, e.g. the spatial index such that nearby
+    geometries end up on the same pages. Note: postgres can't cluster partitioned tables, these are skipped.
+    """
+    index = get_cluster_index(table)
+
+    if index is None or is_partitioned(table):
+        return
+
+    with engine.begin() as connection:
+        connection.execute(text(f'CLUSTER {table.name} USING {index.name}'))
+
+
+def analyze(table, engine=SQLALCHEMY_ENGINE):
+    with engine.begin() as connection:
+        connection.execute(text(f'ANALYZE {table.name}'))
+
+
+def rebuild(table, engine=SQLALCHEMY_ENGINE, cluster_tables=CLUSTER_AFTER_LOAD, analyze_tables=ANALYZE_AFTER_LOAD):
+    """
+    Rebuilds the indexes of a table after a bulk load, see 'IndexDeferral'.
+    """
+    create_indexes(table=table, engine=engine)
+
+    if cluster_tables:
+        cluster(table=table, engine=engine)
+
+    if analyze_tables:
+        analyze(table=table, engine=engine)
+
+
+class IndexDeferral:
+    """
+    Drops the indexes of tables before a bulk load and rebuilds them afterwards. The rebuild of tables which are
+    loaded by several jobs (e.g. the tree and OPM tables, loaded by the jobs of both Amsterdam and Gelderland) is
+    deferred until the last of these jobs loaded them, instead of rebuilding the whole table after each job.
+
+    Usage:
+        with IndexDeferral(models_per_job=[etl_job.loader.models for etl_job in ETL_JOBS]) as index_deferral:
+            for etl_job in ETL_JOBS:
+                with index_deferral.deferred(models=etl_job.loader.models):
+                    ...
+
+    Indexes of tables which are still dropped when leaving the context (e.g. when a job failed) are rebuilt then.
+    """
+
+    def __init__(self, models_per_job, engine=SQLALCHEMY_ENGINE, cluster_tables=CLUSTER_AFTER_LOAD,
+                 analyze_tables=ANALYZE_AFTER_LOAD):
+        """
+        :param models_per_job: list of the models each job loads, in any order.
+        :param cluster_tables: physically reorder the tables on their cluster index after loading.
+        :param analyze_tables: update the planner statistics after loading.
+        """
+        # Number of jobs which still have to load each table
+        self._pending = Counter(table for models in models_per_job for table in {model.__table__ for model in models})
+        # Tables of which the indexes are dropped, in order of dropping
+        self._dropped = []
+        self._engine = engine
+        self._cluster_tables = cluster_tables
+        self._analyze_tables = analyze_tables
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for table in list(self._dropped):
+            self._rebuild(table)
+
+    def _rebuild(self, table):
+        self._dropped.remove(table)
+        rebuild(table=table, engine=self._engine, cluster_tables=self._cluster_tables,
+                analyze_tables=self._analyze_tables)
+
+    def _release(self, tables):
+        for table in tables:
+            self._pending[table] -= 1
+
+            # Last job loading the table
+            if self._pending[table] <= 0 and table in self._dropped:
+                self._rebuild(table)
+
+    @contextmanager
+    def deferred(self, models):
+        """
+        Drops the indexes of the given models (unless an earlier job dropped these already) before a bulk load, and
+        rebuilds them afterwards when no other job will load the same tables.
+        """
+        tables = list(dict.fromkeys(model.__table__ for model in models))
+
+        for table in tables:
+            if table not in self._dropped:
+                drop_indexes(table=table, engine=self._engine)
+                self._dropped.append(table)
+
+        try:
+            yield
+        finally:
+            # Always rebuild the indexes, also when loading failed halfway
+            self._release(tables)
+
+    def skip(self, models):
+        """
+        Marks the tables of a job which doesn't bulk load them (e.g. an empty load) as loaded, such that their
+        indexes are rebuilt when no other job will load the same tables.
+        """
+        self._release(list(dict.fromkeys(model.__table__ for model in models)))
@@ -1,7 +1,44 @@
+import pandas as pd
+from pathlib import Path
+from etl.load.indexes import IndexDeferral
+from etl.transform.dictionary import dictionary_decode
+from config import FINAL_TRANSFORMATION_ID
 
 
-def load(loader, transform_directory):
-    loader.load(transform_directory=transform_directory)
+def load(loader, transform_directory, dataframe=None, partial=False, index_deferral=None):
+    """
+    :param loader: loader class to use for loading data into database.
+    :param transform_directory: directory in which the final transformation file can be found.
+    :param dataframe: final transformation held in-memory, when given (and supported by the loader) it is
+    loaded directly instead of reading the final transformation file.
+    :param partial: the transformation only holds some years (see 'BioClim' its incremental mode), which replace
+    the rows of these years only. The indexes are then kept, rebuilding these would cost more than the load itself.
+    :param index_deferral: defers the index rebuild of tables which are loaded by several jobs (see 'IndexDeferral'),
+    None to rebuild the indexes right after loading.
+    """
+    if index_deferral is None:
+        index_deferral = IndexDeferral(models_per_job=[loader.models])
+
+    # Nothing to load, e.g. an incremental run of which no year changed
+    if dataframe is not None and len(dataframe) == 0:
+        index_deferral.skip(models=loader.models)
+        return
+
+    if partial:
+        _load(loader=loader, transform_directory=transform_directory, dataframe=dataframe)
+        index_deferral.skip(models=loader.models)
+        return
+
+    # Drop indexes before bulk loading and rebuild them afterwards
+    with index_deferral.deferred(models=loader.models):
+        _load(loader=loader, transform_directory=transform_directory, dataframe=dataframe)
+
+
+def _load(loader, transform_directory, dataframe):
+    if dataframe is not None and loader.supports_dataframe:
+        loader.load_dataframe(dataframe=dataframe)
+    else:
+        loader.load(transform_directory=transform_directory)
 
 
 def final_transformation_file(transform_directory):
@@ -10,10 +47,33 @@ def final_transformation_file(transform_directory):
     :param transform_directory: directory in which final transformation file can be found.
     :return: final transformation file.
     """
-    from pathlib import Path
-    from config import FINAL_TRANSFORMATION_ID
-
     transform_directory_file = [file.name for file in Path(transform_directory).glob(f'*{FINAL_TRANSFORMATION_ID}*')
                                 if file.is_file()][0]
 
     return transform_directory_file
+
+
+def read_final_transformation(transform_directory, dtypes=None, dictionary_columns=()):
+    """
+    Reads the final transformation file into a dataframe, the same dataframe a transformer hands over in-memory.
+    :param transform_directory: directory in which final transformation file can be found.
+    :param dtypes: data types of the columns.
+    :param dictionary_columns: columns which are dictionary encoded, these are decoded into categorical columns.
+    :return: dataframe.
+    """
+    df = pd.read_csv(transform_directory / final_transformation_file(transform_directory=transform_directory),
+                     dtype=dtypes)
+
+    return dictionary_decode(df=df, columns=dictionary_columns, transform_directory=transform_directory)
+
+
+def read_final_transformation_chunks(transform_directory, chunk_size, dtypes=None, dictionary_columns=()):
+    """
+    Reads the final transformation file chunk by chunk, such that a (streamed) transformation which doesn't fit
+    in memory can be loaded, see 'read_final_transformation'.
+    :param chunk_size: number of rows per chunk.
+    :return: iterator of dataframes.
+    """
+    for df in pd.read_csv(transform_directory / final_transformation_file(transform_directory=transform_directory),
+                          dtype=dtypes, chunksize=chunk_size):
+        yield dictionary_decode(df=df, columns=dictionary_columns, transform_directory=transform_directory)
@@ -2,7 +2,28 @@ from abc import ABC, abstractmethod
 
 
 class Base(ABC):
+    # Model(s) which are bulk loaded by this loader, their indexes are rebuilt after loading
+    models = []
+
+    # Whether the loader can load a transformation handed over in-memory, see 'DataframeLoader'
+    supports_dataframe = False
 
     @abstractmethod
     def load(self, transform_directory):
         pass
+
+
+class DataframeLoader(Base, ABC):
+    """
+    Loader which can load the final transformation handed over in-memory by its transformer, instead of reading
+    the final transformation file, see 'etl.load.loader.load'.
+    """
+    supports_dataframe = True
+
+    @abstractmethod
+    def load_dataframe(self, dataframe):
+        """
+        Loads the final transformation of a transformer directly into the database,
+        without reading the final transformation file.
+        """
+        pass
@@ -1,15 +1,14 @@
-import csv
+import pandas as pd
 import etl.load.models.bioclim as bioclim_models
-from etl.load.loaders.base import Base
-from etl.load.loader import final_transformation_file
-from sqlalchemy.orm import sessionmaker
-from decimal import Decimal
-from config import SQLALCHEMY_ENGINE
+from etl.load.loaders.base import DataframeLoader
+from etl.load.loader import read_final_transformation
+from etl.load.bulk import bulk_insert
+from etl.load.dimensions import get_categorical_ids
+from etl.load.models.geographical_unit import Neighbourhood as NeighbourhoodObject
 from enum import Enum
-from datetime import datetime
 
 
-class BioClim(Base):
+class BioClim(DataframeLoader):
 
     def __init__(self, model, interpolated_value_name):
         self._model = model
@@ -19,32 +18,33 @@ class BioClim(Base):
     def model(self):
         return self._model
 
+    @property
+    def models(self):
+        return [self._model]
+
     @property
     def interpolated_value_name(self):
         return self._interpolated_value_name
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
-
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_ALL)
-
-            townships_interpolated = [{
-                "code": row['id'],
-                "name": row['name'],
-                "township": row['township'],
-                "year": datetime.strptime(row['year'], "%Y-%m-%d %H:%M:%S").year,
-                self.interpolated_value_name: Decimal(row['interpolated_values'])
-            } for row in csv_reader]
+        self.load_dataframe(dataframe=read_final_transformation(transform_directory=transform_directory,
+                                                                dictionary_columns=['neighbourhood']))
 
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
+    def load_dataframe(self, dataframe):
+        neighbourhoods_interpolated = pd.DataFrame({
+            # Translate neighbourhood codes into ids of the 'neighbourhoods' table
+            "neighbourhood_id": get_categorical_ids(model=NeighbourhoodObject,
+                                                    values=dataframe['neighbourhood'],
+                                                    key='code',
+                                                    insert_missing=False),
+            "year": pd.to_datetime(dataframe['year']).dt.year,
+            self.interpolated_value_name: dataframe['interpolated_values']
+        })
 
-        session.bulk_insert_mappings(mapper=self.model,
-                                     mappings=townships_interpolated,
-                                     render_nulls=True,
-                                     return_defaults=False)
-        session.commit()
-        session.close()
+        # Route rows to their yearly partition
+        bulk_insert(model=self.model,
+                    dataframe=neighbourhoods_interpolated,
+                    years=neighbourhoods_interpolated['year'])
 
 
 class BioClimEnums(Enum):
@@ -13,6 +13,7 @@ from etl.load.models.geographical_unit import (
 
 
 class Township(Base):
+    models = [TownshipObject]
 
     def load(self, transform_directory):
         file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
@@ -31,6 +32,7 @@ class Township(Base):
 
 
 class Neighbourhood(Base):
+    models = [NeighbourhoodObject]
 
     def load(self, transform_directory):
         file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
@@ -57,6 +59,7 @@ class Neighbourhood(Base):
 
 
 class Province(Base):
+    models = [ProvinceObject]
 
     def load(self, transform_directory):
         file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
@@ -1,31 +1,26 @@
-import csv
-from etl.load.loaders.base import Base
-from etl.load.loader import final_transformation_file
-from sqlalchemy.orm import sessionmaker
+import pandas as pd
+from etl.load.loaders.base import DataframeLoader
+from etl.load.loader import read_final_transformation
+from etl.load.bulk import bulk_insert
+from etl.load.dimensions import get_region_ids
+from etl.transform.regions import REGION_COLUMNS
 from etl.load.models.great_tit import GreatTit as GreatTitObject
-from config import SQLALCHEMY_ENGINE
 
 
-class GreatTit(Base):
+class GreatTit(DataframeLoader):
+    models = [GreatTitObject]
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
-
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_NONE)  # quote non to skip whitespace
-
-            great_tits = [dict(
-                date=row['date'],
-                count=row['count'],
-                geometry=row['geometry']
-
-            ) for row in csv_reader]
-
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=GreatTitObject,
-                                     mappings=great_tits,
-                                     render_nulls=True,
-                                     return_defaults=False)
-
-        session.commit()
-        session.close()
+        self.load_dataframe(dataframe=read_final_transformation(transform_directory=transform_directory,
+                                                                dictionary_columns=REGION_COLUMNS))
+
+    def load_dataframe(self, dataframe):
+        great_tits = pd.DataFrame({
+            'date': dataframe['date'],
+            'count': dataframe['count'],
+            'geometry': dataframe['geometry'],
+            # Translate region codes into foreign keys of the region tables
+            **get_region_ids(dataframe=dataframe)
+        })
+
+        bulk_insert(model=GreatTitObject, dataframe=great_tits)
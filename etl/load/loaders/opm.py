@@ -1,87 +1,75 @@
-import csv
-from etl.load.loaders.base import Base
-from etl.load.loader import final_transformation_file
-from sqlalchemy.orm import sessionmaker
+import pandas as pd
+from etl.load.loaders.base import DataframeLoader
+from etl.load.loader import read_final_transformation_chunks
+from etl.load.bulk import bulk_insert
+from etl.load.dimensions import get_dimension_ids, get_categorical_ids, get_region_ids
+from etl.transform.regions import REGION_COLUMNS
 from etl.load.models.opm import OakProcessionaryMoth as OakProcessionaryMothObject
-from config import SQLALCHEMY_ENGINE
-
-
-class Vlinderstichting(Base):
+from etl.load.models.dimension import (
+    Origin as OriginObject,
+    Granularity as GranularityObject,
+    Stage as StageObject
+)
+from config import COPY_CHUNK_SIZE
+
+
+def load_oak_processionary_moths(dataframe, origin, granularity):
+    """
+    :param dataframe: final transformation of an OPM transformer.
+    :param origin: name of the source of the observations.
+    :param granularity: what has been observed, e.g. a 'nest' or 'moth'.
+    """
+    oak_processionary_moths = pd.DataFrame({
+        'date': dataframe['date'],
+        # Translate stage, origin and granularity into ids of the dimension tables
+        'stage_id': get_categorical_ids(model=StageObject, values=dataframe['stage'])
+        if 'stage' in dataframe else None,
+        'geometry': dataframe['geometry'],
+        'origin_id': get_dimension_ids(model=OriginObject, values=[origin])[origin],
+        'granularity_id': get_dimension_ids(model=GranularityObject, values=[granularity])[granularity],
+        # Translate region codes into foreign keys of the region tables
+        **get_region_ids(dataframe=dataframe)
+    })
+
+    bulk_insert(model=OakProcessionaryMothObject, dataframe=oak_processionary_moths)
+
+
+class Vlinderstichting(DataframeLoader):
+    models = [OakProcessionaryMothObject]
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
-
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_NONE)  # quote non to skip whitespace
-
-            oak_processionary_moths = [dict(
-                date=row['date'],
-                stage=row['stage'],
-                geometry=row['geometry'],
-                origin='vlinderstichting',
-                granularity='moth'
+        # Streamed transformations (see 'STREAM_TRANSFORMATIONS') don't fit in memory, hence these are loaded
+        # chunk by chunk
+        for dataframe in read_final_transformation_chunks(transform_directory=transform_directory,
+                                                          chunk_size=COPY_CHUNK_SIZE,
+                                                          dictionary_columns=['stage'] + REGION_COLUMNS):
+            self.load_dataframe(dataframe=dataframe)
 
-            ) for row in csv_reader]
+    def load_dataframe(self, dataframe):
+        load_oak_processionary_moths(dataframe=dataframe, origin='vlinderstichting', granularity='moth')
 
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=OakProcessionaryMothObject,
-                                     mappings=oak_processionary_moths,
-                                     render_nulls=True,
-                                     return_defaults=False)
 
-        session.commit()
-        session.close()
-
-
-class Amsterdam(Base):
+class Amsterdam(DataframeLoader):
+    models = [OakProcessionaryMothObject]
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
-
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_NONE)  # quote non to skip whitespace
+        for dataframe in read_final_transformation_chunks(transform_directory=transform_directory,
+                                                          chunk_size=COPY_CHUNK_SIZE,
+                                                          dictionary_columns=REGION_COLUMNS):
+            self.load_dataframe(dataframe=dataframe)
 
-            oak_processionary_moths = [dict(
-                date=row['date'],
-                stage=None,
-                geometry=row['geometry'],
-                origin='amsterdam',
-                granularity='nest'
+    def load_dataframe(self, dataframe):
+        load_oak_processionary_moths(dataframe=dataframe, origin='amsterdam', granularity='nest')
 
-            ) for row in csv_reader]
 
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=OakProcessionaryMothObject,
-                                     mappings=oak_processionary_moths,
-                                     render_nulls=True,
-                                     return_defaults=False)
-
-        session.commit()
-        session.close()
-
-
-class Gelderland(Base):
+class Gelderland(DataframeLoader):
+    models = [OakProcessionaryMothObject]
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
-
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_NONE)  # quote non to skip whitespace
-
-            oak_processionary_moths = [dict(
-                date=row['date'],
-                stage=None,
-                geometry=row['geometry'],
-                origin='gelderland',
-                granularity='nest'
-
-            ) for row in csv_reader]
-
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=OakProcessionaryMothObject,
-                                     mappings=oak_processionary_moths,
-                                     render_nulls=True,
-                                     return_defaults=False)
+        for dataframe in read_final_transformation_chunks(transform_directory=transform_directory,
+                                                          chunk_size=COPY_CHUNK_SIZE,
+                                                          dictionary_columns=REGION_COLUMNS):
+            self.load_dataframe(dataframe=dataframe)
 
-        session.commit()
-        session.close()
+    def load_dataframe(self, dataframe):
+        load_oak_processionary_moths(dataframe=dataframe, origin='gelderland', granularity='nest')
@@ -1,31 +1,50 @@
-import csv
-from etl.load.loaders.base import Base
-from etl.load.loader import final_transformation_file
-from sqlalchemy.orm import sessionmaker
-from etl.load.models.soil import Soil as SoilObject
-from config import SQLALCHEMY_ENGINE
+import pandas as pd
+from etl.load.loaders.base import DataframeLoader
+from etl.load.loader import read_final_transformation, read_final_transformation_chunks
+from etl.load.bulk import bulk_insert
+from etl.load.dimensions import get_categorical_ids
+from etl.load.models.soil import Soil as SoilObject, NeighbourhoodSoil as NeighbourhoodSoilObject
+from etl.load.models.geographical_unit import Neighbourhood as NeighbourhoodObject
+from config import COPY_CHUNK_SIZE
 
 
-class WURAlterra(Base):
+class WURAlterra(DataframeLoader):
+    models = [SoilObject]
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
+        # The soil map is streamed (see 'SOIL_STREAMING'), hence it is loaded chunk by chunk as well
+        for dataframe in read_final_transformation_chunks(transform_directory=transform_directory,
+                                                          chunk_size=COPY_CHUNK_SIZE):
+            self.load_dataframe(dataframe=dataframe)
 
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_ALL)
+    def load_dataframe(self, dataframe):
+        bulk_insert(model=SoilObject, dataframe=dataframe[['soil_type', 'geometry']])
 
-            soil = [dict(
-                date=row['date'],
-                soil_type=row['soil_type'],
-                geometry=row['geometry']
 
-            ) for row in csv_reader]
+class NeighbourhoodSoil(DataframeLoader):
+    models = [NeighbourhoodSoilObject]
 
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=SoilObject,
-                                     mappings=soil,
-                                     render_nulls=True,
-                                     return_defaults=False)
-
-        session.commit()
-        session.close()
\ No newline at end of file
+    def load(self, transform_directory):
+        self.load_dataframe(dataframe=read_final_transformation(transform_directory=transform_directory,
+                                                                dictionary_columns=['neighbourhood', 'soil_type']))
+
+    def load_dataframe(self, dataframe):
+        neighbourhood_soil = pd.DataFrame({
+            # Translate neighbourhood codes into ids of the neighbourhoods table
+            'neighbourhood_id': get_categorical_ids(model=NeighbourhoodObject,
+                                                    values=dataframe['neighbourhood'],
+                                                    key='code',
+                                                    insert_missing=False,
+                                                    allow_unknown=True),
+            'soil_type': dataframe['soil_type'],
+            'area': dataframe['area'],
+            'share': dataframe['share']
+        })
+
+        # Neighbourhoods which are not within the neighbourhoods table can't be referenced
+        unknown = neighbourhood_soil['neighbourhood_id'].isna()
+        if unknown.any():
+            print(f'Skipped {unknown.sum()} soil areas of {dataframe["neighbourhood"][unknown].nunique()} '
+                  f'neighbourhoods which are not within the neighbourhoods table')
+
+        bulk_insert(model=NeighbourhoodSoilObject, dataframe=neighbourhood_soil[~unknown])
@@ -1,58 +1,55 @@
-import csv
-from etl.load.loaders.base import Base
-from etl.load.loader import final_transformation_file
-from sqlalchemy.orm import sessionmaker
+import pandas as pd
+from etl.load.loaders.base import DataframeLoader
+from etl.load.loader import read_final_transformation_chunks
+from etl.load.bulk import bulk_insert
+from etl.load.dimensions import get_dimension_ids, get_categorical_ids, get_region_ids
+from etl.transform.regions import REGION_COLUMNS
 from etl.load.models.tree import Tree as TreeObject
-from config import SQLALCHEMY_ENGINE
+from etl.load.models.dimension import Species as SpeciesObject, Origin as OriginObject
+from config import COPY_CHUNK_SIZE
 
 
-class Amsterdam(Base):
+def load_trees(dataframe, origin):
+    """
+    :param dataframe: final transformation of a tree transformer.
+    :param origin: name of the source of the trees.
+    """
+    trees = pd.DataFrame({
+        # Translate species and origin into ids of the dimension tables
+        # species_latin=...
+        'species_id': get_categorical_ids(model=SpeciesObject, values=dataframe['species_dutch']),
+        'geometry': dataframe['geometry'],
+        'origin_id': get_dimension_ids(model=OriginObject, values=[origin])[origin],
+        # Translate region codes into foreign keys of the region tables
+        **get_region_ids(dataframe=dataframe)
+    })
 
-    def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
-
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_NONE)  # quote non to skip whitespace
-
-            trees = [dict(
-                # species_latin=row['species_latin'],
-                species_dutch=row['species_dutch'],
-                geometry=row['geometry'],
-                origin='amsterdam'
-
-            ) for row in csv_reader]
+    bulk_insert(model=TreeObject, dataframe=trees)
 
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=TreeObject,
-                                     mappings=trees,
-                                     render_nulls=True,
-                                     return_defaults=False)
 
-        session.commit()
-        session.close()
-
-
-class Gelderland(Base):
+class Amsterdam(DataframeLoader):
+    models = [TreeObject]
 
     def load(self, transform_directory):
-        file_path = transform_directory / final_transformation_file(transform_directory=transform_directory)
+        # Streamed transformations (see 'STREAM_TRANSFORMATIONS') don't fit in memory, hence these are loaded
+        # chunk by chunk
+        for dataframe in read_final_transformation_chunks(transform_directory=transform_directory,
+                                                          chunk_size=COPY_CHUNK_SIZE,
+                                                          dictionary_columns=['species_dutch'] + REGION_COLUMNS):
+            self.load_dataframe(dataframe=dataframe)
 
-        with open(file_path) as f:
-            csv_reader = csv.DictReader(f, delimiter=',', quoting=csv.QUOTE_ALL)  # quote non to skip whitespace
+    def load_dataframe(self, dataframe):
+        load_trees(dataframe=dataframe, origin='amsterdam')
 
-            trees = [dict(
-                # species_latin=row['species_latin'],
-                species_dutch=row['species_dutch'],
-                geometry=row['geometry'],
-                origin='gelderland'
 
-            ) for row in csv_reader]
+class Gelderland(DataframeLoader):
+    models = [TreeObject]
 
-        session = sessionmaker(bind=SQLALCHEMY_ENGINE)()
-        session.bulk_insert_mappings(mapper=TreeObject,
-                                     mappings=trees,
-                                     render_nulls=True,
-                                     return_defaults=False)
+    def load(self, transform_directory):
+        for dataframe in read_final_transformation_chunks(transform_directory=transform_directory,
+                                                          chunk_size=COPY_CHUNK_SIZE,
+                                                          dictionary_columns=['species_dutch'] + REGION_COLUMNS):
+            self.load_dataframe(dataframe=dataframe)
 
-        session.commit()
-        session.close()
+    def load_dataframe(self, dataframe):
+        load_trees(dataframe=dataframe, origin='gelderland')
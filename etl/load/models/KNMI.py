@@ -1,20 +1,28 @@
-from sqlalchemy import Column, Integer, String, Date, Float
+from sqlalchemy import Column, Integer, String, Date, Float, Index
 from config import SQLALCHEMY_BASE
 from geoalchemy2.types import Geometry
+from etl.load.partitioning import year_partitioned_table_args
 
 
 class WeatherStationLocation(SQLALCHEMY_BASE):
     __tablename__ = 'weather_station_locations'
+    __table_args__ = (
+        Index('ix_weather_station_locations_geometry', 'geometry', postgresql_using='gist'),
+    )
     id = Column(Integer, primary_key=True)
     name = Column(String)
-    geometry = Column(Geometry('POINT'))
+    geometry = Column(Geometry('POINT', spatial_index=False))
 
 
 class WeatherStationData(SQLALCHEMY_BASE):
     __tablename__ = 'weather_station_data'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_weather_station_data_station_id_date', 'station_id', 'date', info={'cluster': True}),
+        partition_column='date'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     station_id = Column(Integer)
-    date = Column(Date)
+    date = Column(Date, primary_key=True)
     temperature_avg = Column(Float(precision=2, asdecimal=True))
     temperature_min = Column(Float(precision=2, asdecimal=True))
     temperature_max = Column(Float(precision=2, asdecimal=True))
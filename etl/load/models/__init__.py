@@ -1 +1 @@
-__all__ = ['geographical_unit', 'KNMI', 'bioclim', 'opm']
+__all__ = ['dimension', 'geographical_unit', 'KNMI', 'bioclim', 'opm']
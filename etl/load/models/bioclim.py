@@ -1,192 +1,231 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, Float, Index, ForeignKey
 from config import SQLALCHEMY_BASE
+from etl.load.partitioning import year_partitioned_table_args
 
 
 class BioClim_1(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_1'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_1_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_avg = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_2(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_2'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_2_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     diurmal_range = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_3(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_3'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_3_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     isothermality = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_4(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_4'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_4_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_std = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_5(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_5'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_5_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_max = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_6(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_6'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_6_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_min = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_7(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_7'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_7_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     diurmal_range = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_8(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_8'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_8_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_avg = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_9(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_9'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_9_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_avg = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_10(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_10'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_10_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_avg = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_11(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_11'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_11_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     temperature_avg = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_12(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_12'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_12_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_13(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_13'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_13_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_14(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_14'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_14_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_15(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_15'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_15_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_16(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_16'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_16_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_17(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_17'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_17_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_18(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_18'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_18_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
 
 
 class BioClim_19(SQLALCHEMY_BASE):
     __tablename__ = 'bioclim_19'
+    __table_args__ = year_partitioned_table_args(
+        Index('ix_bioclim_19_neighbourhood_id_year', 'neighbourhood_id', 'year'),
+        partition_column='year'
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    code = Column(String)
-    name = Column(String)
-    township = Column(String)
-    year = Column(Integer)
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'))
+    year = Column(Integer, primary_key=True)
     rain_sum = Column(Float(precision=2, asdecimal=True))
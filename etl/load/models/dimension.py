@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String
+from config import SQLALCHEMY_BASE
+
+
+class Species(SQLALCHEMY_BASE):
+    __tablename__ = 'species'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True)
+
+
+class Origin(SQLALCHEMY_BASE):
+    __tablename__ = 'origins'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True)
+
+
+class Granularity(SQLALCHEMY_BASE):
+    __tablename__ = 'granularities'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True)
+
+
+class Stage(SQLALCHEMY_BASE):
+    __tablename__ = 'stages'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True)
@@ -1,26 +1,36 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, Index
 from config import SQLALCHEMY_BASE
 from geoalchemy2.types import Geometry
 
 
 class Township(SQLALCHEMY_BASE):
     __tablename__ = 'townships'
+    __table_args__ = (
+        Index('ix_townships_geometry', 'geometry', postgresql_using='gist'),
+    )
     code = Column(Integer, primary_key=True)
     name = Column(String)
-    geometry = Column(Geometry)
+    geometry = Column(Geometry(spatial_index=False))
 
 
 class Neighbourhood(SQLALCHEMY_BASE):
     __tablename__ = 'neighbourhoods'
-    code = Column(String, primary_key=True)
+    __table_args__ = (
+        Index('ix_neighbourhoods_geometry', 'geometry', postgresql_using='gist'),
+    )
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    code = Column(String, unique=True)
     township = Column(String)
     name = Column(String)
     area = Column(Float)
-    geometry = Column(Geometry)
+    geometry = Column(Geometry(spatial_index=False))
 
 
 class Province(SQLALCHEMY_BASE):
     __tablename__ = 'provinces'
+    __table_args__ = (
+        Index('ix_provinces_geometry', 'geometry', postgresql_using='gist'),
+    )
     code = Column(String, primary_key=True)
     name = Column(String)
-    geometry = Column(Geometry)
+    geometry = Column(Geometry(spatial_index=False))
@@ -1,11 +1,19 @@
-from sqlalchemy import Column, Integer, Date
+from sqlalchemy import Column, Integer, String, Date, Index, ForeignKey
 from config import SQLALCHEMY_BASE
 from geoalchemy2.types import Geometry
 
 
 class GreatTit(SQLALCHEMY_BASE):
     __tablename__ = 'great_tit'
+    __table_args__ = (
+        Index('ix_great_tit_geometry', 'geometry', postgresql_using='gist', info={'cluster': True}),
+        Index('ix_great_tit_neighbourhood_id', 'neighbourhood_id'),
+        Index('ix_great_tit_province_code', 'province_code'),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     date = Column(Date)
     count = Column(Integer)
-    geometry = Column(Geometry('POINT'))
\ No newline at end of file
+    # Regions containing the point, tagged during transformation
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'), nullable=True)
+    province_code = Column(String, ForeignKey('provinces.code'), nullable=True)
+    geometry = Column(Geometry('POINT', spatial_index=False))
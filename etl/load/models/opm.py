@@ -1,13 +1,22 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Integer, String, Date, Index, ForeignKey
 from config import SQLALCHEMY_BASE
 from geoalchemy2.types import Geometry
 
 
 class OakProcessionaryMoth(SQLALCHEMY_BASE):
     __tablename__ = 'oak_processionary_moths'
+    __table_args__ = (
+        Index('ix_oak_processionary_moths_geometry', 'geometry', postgresql_using='gist', info={'cluster': True}),
+        Index('ix_oak_processionary_moths_neighbourhood_id', 'neighbourhood_id'),
+        Index('ix_oak_processionary_moths_province_code', 'province_code'),
+        Index('ix_oak_processionary_moths_date', 'date'),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     date = Column(Date)
-    stage = Column(String, nullable=True)
-    origin = Column(String)
-    granularity = Column(String)
-    geometry = Column(Geometry('POINT'))
+    stage_id = Column(Integer, ForeignKey('stages.id'), nullable=True)
+    origin_id = Column(Integer, ForeignKey('origins.id'))
+    granularity_id = Column(Integer, ForeignKey('granularities.id'))
+    # Regions containing the point, tagged during transformation
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'), nullable=True)
+    province_code = Column(String, ForeignKey('provinces.code'), nullable=True)
+    geometry = Column(Geometry('POINT', spatial_index=False))
@@ -1,10 +1,21 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Float, Index, ForeignKey
 from config import SQLALCHEMY_BASE
 from geoalchemy2.types import Geometry
 
 
 class Soil(SQLALCHEMY_BASE):
     __tablename__ = 'soil'
+    __table_args__ = (
+        Index('ix_soil_geometry', 'geometry', postgresql_using='gist', info={'cluster': True}),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     soil_type = Column(String)
-    geometry = Column(Geometry)
\ No newline at end of file
+    geometry = Column(Geometry(spatial_index=False))
+
+
+class NeighbourhoodSoil(SQLALCHEMY_BASE):
+    __tablename__ = 'neighbourhood_soil'
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'), primary_key=True)
+    soil_type = Column(String, primary_key=True)
+    area = Column(Float)  # m2
+    share = Column(Float)  # share of the neighbourhood's area
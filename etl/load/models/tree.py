@@ -1,12 +1,20 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index, ForeignKey
 from config import SQLALCHEMY_BASE
 from geoalchemy2.types import Geometry
 
 
 class Tree(SQLALCHEMY_BASE):
     __tablename__ = 'tree'
+    __table_args__ = (
+        Index('ix_tree_geometry', 'geometry', postgresql_using='gist', info={'cluster': True}),
+        Index('ix_tree_neighbourhood_id', 'neighbourhood_id'),
+        Index('ix_tree_province_code', 'province_code'),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    origin = Column(String)
+    origin_id = Column(Integer, ForeignKey('origins.id'))
     # species_latin = Column(String)
-    species_dutch = Column(String)
-    geometry = Column(Geometry('POINT'))
+    species_id = Column(Integer, ForeignKey('species.id'))
+    # Regions containing the point, tagged during transformation
+    neighbourhood_id = Column(Integer, ForeignKey('neighbourhoods.id'), nullable=True)
+    province_code = Column(String, ForeignKey('provinces.code'), nullable=True)
+    geometry = Column(Geometry('POINT', spatial_index=False))
@@ -0,0 +1,79 @@
+from sqlalchemy import Date, text
+from config import PARTITION_BY_YEAR
+
+
+def year_partitioned_table_args(*table_args, partition_column, partition_by_year=PARTITION_BY_YEAR):
+    """
+    Builds the '__table_args__' of a model which is (optionally) range partitioned by year.
+    Note: postgres requires the partition column to be part of the primary key.
+
+    :param table_args: positional table arguments, e.g. indexes.
+    :param partition_column: name of the 'Date' or 'Integer' (year) column to partition by.
+    :param partition_by_year: map the table onto yearly range partitions, otherwise the column is only used to
+    replace the rows of a year on reload, see 'bulk_insert'.
+    :return: table arguments.
+    """
+    info = {'partition_column': partition_column, 'partitioned': partition_by_year}
+
+    if not partition_by_year:
+        return (*table_args, {'info': info})
+
+    return (*table_args, {'postgresql_partition_by': f'RANGE ({partition_column})', 'info': info})
+
+
+def is_partitioned(table):
+    return table.info.get('partitioned', False)
+
+
+def partition_name(table, year):
+    return f'{table.name}_{year}'
+
+
+def partition_bounds(table, year):
+    """
+    :return: lower (inclusive) and upper (exclusive) bound of the partition holding the given year.
+    """
+    partition_column = table.columns[table.info['partition_column']]
+
+    if isinstance(partition_column.type, Date):
+        return f"'{year}-01-01'", f"'{year + 1}-01-01'"
+
+    return f'{year}', f'{year + 1}'
+
+
+def check_partitioned(connection, table):
+    """
+    Tables are created by 'create_all', which leaves existing tables as they are. A table which was created before
+    'PARTITION_BY_YEAR' was enabled is a plain table, of which no partition can be created.
+    """
+    is_partitioned_table = connection.execute(text('SELECT EXISTS (SELECT 1 FROM pg_partitioned_table '
+                                                   'WHERE partrelid = to_regclass(:table_name))'),
+                                              {'table_name': table.name}).scalar()
+
+    if not is_partitioned_table:
+        raise RuntimeError(f'Table {table.name} is not partitioned by year, drop the table (such that it is '
+                           f'created partitioned) or disable PARTITION_BY_YEAR')
+
+
+def create_partition(connection, table, year):
+    lower_bound, upper_bound = partition_bounds(table=table, year=year)
+
+    connection.execute(text(f'CREATE TABLE IF NOT EXISTS {partition_name(table, year)} '
+                            f'PARTITION OF {table.name} '
+                            f'FOR VALUES FROM ({lower_bound}) TO ({upper_bound})'))
+
+
+def truncate_partition(connection, table, year):
+    connection.execute(text(f'TRUNCATE TABLE {partition_name(table, year)}'))
+
+
+def delete_year(connection, table, year):
+    """
+    Deletes the rows of a year from a table which is not partitioned, the counterpart of 'truncate_partition'.
+    """
+    lower_bound, upper_bound = partition_bounds(table=table, year=year)
+    partition_column = table.info['partition_column']
+
+    connection.execute(text(f'DELETE FROM {table.name} '
+                            f'WHERE {partition_column} >= {lower_bound} AND {partition_column} < {upper_bound}'))
+
@@ -0,0 +1,165 @@
+import io
+import sys
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, ExitStack
+from pathlib import Path
+
+# Profiling modes of a job: 'cpu' (cProfile plus sampled stacks) and 'mem' (tracemalloc)
+PROFILE_MODES = ('cpu', 'mem')
+
+
+def parse_profile_options(options):
+    """
+    :param options: command line options 'JOB=MODES', e.g. ['BIOCLIM_15=cpu,mem', 'Amsterdam_trees=mem'].
+    :return: dictionary of the job name onto its profiling modes.
+    """
+    profiles = {}
+
+    for option in options:
+        job, _, modes = option.partition('=')
+        modes = tuple(mode.strip() for mode in modes.split(',') if mode.strip()) or PROFILE_MODES
+
+        unknown = set(modes) - set(PROFILE_MODES)
+        if unknown:
+            raise ValueError(f'Unknown profiling mode(s) {", ".join(sorted(unknown))} of job {job}, '
+                             f'expected any of {", ".join(PROFILE_MODES)}')
+
+        profiles[job] = profiles.get(job, ()) + tuple(mode for mode in modes if mode not in profiles.get(job, ()))
+
+    return profiles
+
+
+class StackSampler:
+    """
+    Samples the call stack of a thread at a fixed interval, the samples are written as collapsed stacks
+    ('module:function;module:function count' per line) which flamegraph.pl and speedscope read.
+
+    Note: only the sampled thread is profiled, (process pool) workers are not.
+    """
+
+    def __init__(self, thread_id=None, interval=0.005):
+        """
+        :param thread_id: identifier of the thread to sample, defaults to the current thread.
+        :param interval: seconds between samples.
+        """
+        self._thread_id = thread_id or threading.get_ident()
+        self._interval = interval
+        self._samples = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+
+            while frame is not None:
+                stack.append(f'{frame.f_globals.get("__name__", "?")}:{frame.f_code.co_name}')
+                frame = frame.f_back
+
+            if stack:
+                self._samples[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    @property
+    def samples(self):
+        return self._samples
+
+    def save(self, file_path):
+        with open(file_path, 'w') as f:
+            for stack, count in self._samples.most_common():
+                f.write(f'{stack} {count}\n')
+
+
+@contextmanager
+def cpu_profile(file_prefix):
+    """
+    Writes '<prefix>.pstats' (cProfile), '<prefix>.pstats.txt' (functions by cumulative time) and
+    '<prefix>.collapsed' (sampled stacks, see 'StackSampler') of the code run within the context.
+    """
+    sampler = StackSampler()
+    profiler = cProfile.Profile()
+
+    sampler.start()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+
+        profiler.dump_stats(f'{file_prefix}.pstats')
+        sampler.save(f'{file_prefix}.collapsed')
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(50)
+        Path(f'{file_prefix}.pstats.txt').write_text(summary.getvalue())
+
+
+@contextmanager
+def memory_profile(file_prefix, frames=10, top=50):
+    """
+    Writes '<prefix>.tracemalloc' (snapshot, see 'tracemalloc.Snapshot.load') and '<prefix>.allocations.txt' (top
+    allocation sites of the memory still allocated at the end, and the peak) of the code run within the context.
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start(frames)
+
+    # Python 3.9+
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        if not tracing:
+            tracemalloc.stop()
+
+        snapshot.dump(f'{file_prefix}.tracemalloc')
+
+        with open(f'{file_prefix}.allocations.txt', 'w') as f:
+            f.write(f'Allocated at the end: {current / 1024 ** 2:.1f} MB, peak: {peak / 1024 ** 2:.1f} MB\n\n')
+
+            for statistic in snapshot.statistics('lineno')[:top]:
+                f.write(f'{statistic}\n')
+
+
+@contextmanager
+def profile(directory, name, modes):
+    """
+    Profiles the code run within the context, e.g. the transformer of one job.
+
+    :param directory: directory of the profiles, e.g. next to the run report.
+    :param name: prefix of the profile files, e.g. 'BIOCLIM_15-transform'.
+    :param modes: profiling modes, see 'PROFILE_MODES', none skips profiling.
+    """
+    if not modes:
+        yield
+        return
+
+    Path.mkdir(Path(directory), parents=True, exist_ok=True)
+    file_prefix = Path(directory) / name
+
+    with ExitStack() as stack:
+        # Snapshots are taken outside the CPU profile, note that tracing allocations does slow down the profiled code
+        if 'mem' in modes:
+            stack.enter_context(memory_profile(file_prefix))
+        if 'cpu' in modes:
+            stack.enter_context(cpu_profile(file_prefix))
+
+        yield
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+# Statistics accumulated per station, per month, and how partial accumulators (e.g. of two chunks) are combined
+STATISTICS = {
+    'sum': 'sum',
+    'count': 'sum',
+    'min': 'min',
+    'max': 'max',
+    'sum_of_squares': 'sum'
+}
+
+INDEX = ['date', 'station_id']
+
+
+class MonthlyAccumulators:
+    """
+    Per station, per month accumulators (sum, count, min, max and sum of squares) of daily values.
+
+    Daily values are folded into the accumulators chunk by chunk, such that memory depends on the number of
+    stations times months instead of on the number of daily rows. Monthly, quarterly and yearly means and sums
+    of the daily values are then derived from the accumulators, see 'resample'.
+    """
+
+    def __init__(self, columns, max_partials=16):
+        """
+        :param columns: columns holding the daily values.
+        :param max_partials: number of folded chunks after which these are combined, which bounds memory.
+        """
+        self._columns = list(columns)
+        self._max_partials = max_partials
+        self._partials = []
+
+    @classmethod
+    def from_daily(cls, df, columns=None):
+        """
+        :param df: daily values, holding the columns 'date' and 'station_id'.
+        :param columns: columns holding the daily values, None for all numeric columns.
+        """
+        if columns is None:
+            columns = [column for column in df.select_dtypes('number').columns if column not in INDEX]
+
+        accumulators = cls(columns=columns)
+        accumulators.add(df)
+
+        return accumulators
+
+    @classmethod
+    def from_chunks(cls, chunks, columns):
+        """
+        :param chunks: iterator of dataframes holding daily values, e.g. 'read_station_data_chunks'.
+        """
+        accumulators = cls(columns=columns)
+
+        for df in chunks:
+            accumulators.add(df)
+
+        return accumulators
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def add(self, df):
+        """
+        Folds the daily values of a dataframe into the accumulators. A month may be spread over several chunks.
+        """
+        keys = [pd.DatetimeIndex(df['date'].values.astype('datetime64[M]'), name='date'),
+                pd.Index(df['station_id'].values, name='station_id')]
+
+        # Accumulate in double precision, daily values are usually float32
+        values = df[self._columns].astype('float64')
+        grouped = values.groupby(keys)
+
+        self._partials.append({
+            'sum': grouped.sum(),
+            'count': grouped.count(),
+            'min': grouped.min(),
+            'max': grouped.max(),
+            'sum_of_squares': (values ** 2).groupby(keys).sum()
+        })
+
+        if len(self._partials) >= self._max_partials:
+            self._combine()
+
+    def _combine(self):
+        if len(self._partials) > 1:
+            self._partials = [{
+                statistic: pd.concat([partial[statistic] for partial in self._partials])
+                           .groupby(level=INDEX)
+                           .agg(how)
+                for statistic, how in STATISTICS.items()
+            }]
+
+    @property
+    def statistics(self):
+        """
+        :return: dictionary of the statistics onto a dataframe indexed by (date, station_id), the date being the
+        first day of the month, holding one column per value column.
+        """
+        self._combine()
+
+        if not self._partials:
+            index = pd.MultiIndex.from_arrays([pd.DatetimeIndex([]), pd.Index([], dtype='uint16')], names=INDEX)
+            return {statistic: pd.DataFrame(columns=self._columns, index=index, dtype='float64')
+                    for statistic in STATISTICS}
+
+        return self._partials[0]
+
+    def fingerprint(self):
+        """
+        :return: hash of the accumulated statistics, equal for accumulators of the same daily values.
+        """
+        statistics = self.statistics
+
+        return tuple(self._columns) + tuple(int(pd.util.hash_pandas_object(statistics[statistic]).sum())
+                                            for statistic in ('sum', 'count'))
+
+    def select_years(self, years):
+        """
+        :param years: years to select, e.g. the years which have to be recomputed.
+        :return: accumulators holding only the months of the given years.
+        """
+        statistics = self.statistics
+        selected = statistics['sum'].index.get_level_values('date').year.isin(list(years))
+
+        accumulators = MonthlyAccumulators(columns=self._columns, max_partials=self._max_partials)
+        accumulators._partials = [{statistic: df[selected] for statistic, df in statistics.items()}]
+
+        return accumulators
+
+    def resample(self, freq, means=(), sums=(), minima=(), maxima=()):
+        """
+        Aggregates the accumulators into periods, the results equal grouping the daily values by
+        '[pd.Grouper(key='date', freq=freq), 'station_id']'.
+
+        :param freq: period, e.g. 'M' (month), 'Q' (quarter) or 'Y' (year).
+        :param means: columns of which the mean of the daily values is calculated.
+        :param sums: columns of which the sum of the daily values is calculated.
+        :param minima: columns of which the min of the daily values is calculated.
+        :param maxima: columns of which the max of the daily values is calculated.
+        :return: dataframe indexed by (date, station_id).
+        """
+        statistics = self.statistics
+        requested = {
+            'sum': sorted(set(means) | set(sums)),
+            'count': sorted(set(means)),
+            'min': list(minima),
+            'max': list(maxima)
+        }
+
+        # Group all required statistics at once
+        df = pd.concat({statistic: statistics[statistic][columns] for statistic, columns in requested.items()},
+                       axis=1)
+        df.columns = [f'{column}:{statistic}' for statistic, column in df.columns]
+
+        grouped = df.reset_index().groupby([pd.Grouper(key='date', freq=freq), 'station_id'])
+        periods = pd.concat([grouped[[f'{column}:{statistic}' for column in columns]].agg(STATISTICS[statistic])
+                             for statistic, columns in requested.items() if columns], axis=1)
+
+        result = pd.DataFrame(index=periods.index)
+
+        for column in means:
+            # No daily values within a period results in NaN
+            result[column] = periods[f'{column}:sum'] / periods[f'{column}:count'].replace(0, np.nan)
+
+        for column in sums:
+            result[column] = periods[f'{column}:sum']
+
+        for column in minima:
+            result[column] = periods[f'{column}:min']
+
+        for column in maxima:
+            result[column] = periods[f'{column}:max']
+
+        return result
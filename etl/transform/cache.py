@@ -0,0 +1,228 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+import shapely
+from functools import wraps
+from pathlib import Path
+from config import USE_CACHE, CACHE_DIRECTORY, CACHE_MAX_SIZE
+
+META_FILE_NAME = 'meta.json'
+
+
+def file_checksum(file_path, block_size=1 << 20):
+    """
+    :return: hex digest of the content of the file.
+    """
+    checksum = hashlib.blake2b(digest_size=16)
+
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            checksum.update(block)
+
+    return checksum.hexdigest()
+
+
+def cache_key(parser, version, file_path, kwargs):
+    """
+    Entries are keyed by the parser (and its version) and the content of the parsed file, such that
+    a changed source file or parser never returns a stale entry.
+    """
+    key = json.dumps([f'{parser.__module__}.{parser.__qualname__}', version, file_checksum(file_path),
+                      sorted((name, repr(value)) for name, value in kwargs.items())])
+
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def save_objects(directory, name, values):
+    """
+    Saves a column of strings or geometries (as WKB) as one byte buffer plus the offsets of its values.
+
+    :return: kind of the values, either 'str' or 'geometry'.
+    """
+    values = np.asarray(values, dtype=object)
+    missing = pd.isna(values)
+    present = values[~missing]
+
+    encoded = np.full(len(values), b'', dtype=object)
+
+    if len(present) and shapely.is_geometry(present).all():
+        kind = 'geometry'
+        encoded[~missing] = shapely.to_wkb(present)
+    else:
+        kind = 'str'
+        encoded[~missing] = [str(value).encode() for value in present]
+
+    offsets = np.zeros(len(encoded) + 1, dtype='int64')
+    offsets[1:] = np.cumsum([len(value) for value in encoded])
+
+    np.save(directory / f'{name}.bytes.npy', np.frombuffer(b''.join(encoded), dtype='uint8'))
+    np.save(directory / f'{name}.offsets.npy', offsets)
+    np.save(directory / f'{name}.missing.npy', missing)
+
+    return kind
+
+
+def load_objects(directory, name, kind):
+    # Values are sliced from the memory-mapped buffer, such that only each value is copied, not the whole buffer
+    buffer = memoryview(np.load(directory / f'{name}.bytes.npy', mmap_mode='r'))
+    offsets = np.load(directory / f'{name}.offsets.npy')
+    missing = np.load(directory / f'{name}.missing.npy')
+
+    values = np.empty(len(missing), dtype=object)
+    values[:] = [buffer[start:end].tobytes() for start, end in zip(offsets[:-1], offsets[1:])]
+
+    if kind == 'geometry':
+        values[~missing] = shapely.from_wkb(values[~missing])
+    else:
+        values[~missing] = [value.decode() for value in values[~missing]]
+
+    values[missing] = None
+
+    return values
+
+
+def save_dataframe(df, directory):
+    """
+    Saves each column as .npy file, numeric and datetime columns can then be opened with mmap.
+    Categorical columns are saved as codes plus categories, string and geometry columns as byte buffers.
+    """
+    columns = []
+
+    for index, column in enumerate(df.columns):
+        values = df[column]
+        entry = {'name': column, 'file': f'column_{index}'}
+
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            np.save(directory / f'{entry["file"]}.npy', values.cat.codes.values)
+            entry['kind'] = 'category'
+            entry['categories'] = save_objects(directory, f'{entry["file"]}.categories', values.cat.categories.values)
+        elif isinstance(values.dtype, np.dtype) and values.dtype != object:
+            np.save(directory / f'{entry["file"]}.npy', values.values)
+            entry['kind'] = 'array'
+        else:
+            entry['kind'] = save_objects(directory, entry['file'], values.values)
+
+        columns.append(entry)
+
+    with open(directory / META_FILE_NAME, 'w') as f:
+        json.dump({'columns': columns, 'length': len(df)}, f)
+
+
+def load_dataframe(directory):
+    with open(directory / META_FILE_NAME) as f:
+        meta = json.load(f)
+
+    data = {}
+
+    for column in meta['columns']:
+        file_name, kind = column['file'], column['kind']
+
+        if kind == 'array':
+            # Copy on write, such that the dataframe can be changed without touching the cache
+            data[column['name']] = np.load(directory / f'{file_name}.npy', mmap_mode='c')
+        elif kind == 'category':
+            data[column['name']] = pd.Categorical.from_codes(
+                codes=np.load(directory / f'{file_name}.npy'),
+                categories=load_objects(directory, f'{file_name}.categories', column['categories']))
+        else:
+            data[column['name']] = load_objects(directory, file_name, kind)
+
+    # Without copying, otherwise the memory-mapped columns are read into memory (and consolidated) at once
+    return pd.DataFrame(data, index=pd.RangeIndex(meta['length']), copy=False)
+
+
+def entry_size(directory):
+    return sum(file.stat().st_size for file in directory.iterdir())
+
+
+def evict(cache_directory=CACHE_DIRECTORY, max_size=CACHE_MAX_SIZE):
+    """
+    Removes the least recently used entries until the total size of the cache is within 'max_size' bytes.
+    """
+    entries = [directory for directory in Path(cache_directory).iterdir()
+               if (directory / META_FILE_NAME).is_file()]
+
+    # Last use is tracked by the modification time of the meta file
+    entries.sort(key=lambda directory: (directory / META_FILE_NAME).stat().st_mtime, reverse=True)
+    sizes = [entry_size(directory) for directory in entries]
+
+    total_size = 0
+    for directory, size in zip(entries, sizes):
+        total_size += size
+
+        if total_size > max_size:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def use_entry(directory):
+    """
+    :return: whether the entry has been written, it is then marked as recently used.
+    """
+    if not (directory / META_FILE_NAME).is_file():
+        return False
+
+    # Last use is tracked by the modification time of the meta file, see 'evict'
+    os.utime(directory / META_FILE_NAME)
+
+    return True
+
+
+def write_entry(directory, writer, max_size=CACHE_MAX_SIZE):
+    """
+    Writes an entry into a temporary directory first, which is then moved into place, such that (parallel) readers
+    never see a partial entry. Least recently used entries are evicted afterwards.
+
+    :param directory: directory of the entry, within the cache directory.
+    :param writer: function writing the files of the entry (including the meta file) into the directory it is given.
+    :param max_size: max total size in bytes of the cache.
+    """
+    cache_directory = Path(directory).parent
+
+    Path.mkdir(cache_directory, exist_ok=True)
+    temporary_directory = Path(tempfile.mkdtemp(dir=cache_directory))
+
+    try:
+        writer(temporary_directory)
+        os.replace(temporary_directory, directory)
+    except OSError:
+        # Entry has been written in the meantime by another process
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    evict(cache_directory=cache_directory, max_size=max_size)
+
+
+def cached(version, cache_directory=CACHE_DIRECTORY, max_size=CACHE_MAX_SIZE):
+    """
+    Caches the dataframe a parser returns for a source file, such that the file is only parsed again when
+    its content or the parser (version) changes. The cache lives next to the extracted sources (static/etl),
+    it is skipped when that directory doesn't exist, e.g. when parsing test data.
+
+    :param version: version of the parser, increment it whenever the output of the parser changes.
+    :param cache_directory: directory holding one subdirectory per entry.
+    :param max_size: max total size in bytes of the cache, least recently used entries are evicted.
+    """
+    def decorator(parser):
+
+        @wraps(parser)
+        def wrapper(file_path, **kwargs):
+            if not USE_CACHE or not Path(cache_directory).parent.is_dir():
+                return parser(file_path, **kwargs)
+
+            directory = Path(cache_directory) / cache_key(parser, version, file_path, kwargs)
+
+            if use_entry(directory):
+                return load_dataframe(directory)
+
+            df = parser(file_path, **kwargs)
+            write_entry(directory, writer=lambda entry_directory: save_dataframe(df, entry_directory),
+                        max_size=max_size)
+
+            return df
+
+        return wrapper
+
+    return decorator
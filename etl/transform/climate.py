@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from scipy.spatial import cKDTree
+from etl.transform.sampling import inverse_distance_weights, haversine_coordinates
+from etl.transform.transformers.bioclim import BioClimFactory, BioClimEnums, get_training_accumulators, \
+    get_station_coordinates
+from config import STATION_DATA_CHUNK_SIZE
+
+
+def unit_vectors(coordinates):
+    """
+    Points on the unit sphere, of which the chord distances order the points as their haversine distances do.
+
+    :param coordinates: (points x 2) coordinates (longitude, latitude) in EPSG 4326.
+    :return: (points x 3) unit vectors.
+    """
+    latitudes, longitudes = haversine_coordinates(coordinates).T
+
+    return np.column_stack([np.cos(latitudes) * np.cos(longitudes),
+                            np.cos(latitudes) * np.sin(longitudes),
+                            np.sin(latitudes)])
+
+
+class IDWModel:
+    """
+    Inverse distance weighting of the nearest stations, equal to 'interpolate' but answering (batches of) point
+    queries with a KD-tree over the stations instead of fitting a 'KNeighborsRegressor' per query.
+    """
+
+    def __init__(self, training_coordinates, training_values, n_neighbors=5):
+        """
+        :param training_coordinates: coordinates (longitude, latitude) of the stations.
+        :param training_values: values of the stations.
+        :param n_neighbors: number of nearest stations of which a point is interpolated.
+        """
+        if len(training_values) < n_neighbors:
+            raise ValueError(f'Expected at least {n_neighbors} stations, got {len(training_values)}')
+
+        self._tree = cKDTree(unit_vectors(training_coordinates))
+        self._training_values = np.asarray(training_values, dtype='float64')
+        self._n_neighbors = n_neighbors
+
+    def predict(self, coordinates, workers=-1):
+        """
+        :param coordinates: (points x 2) coordinates (longitude, latitude) to interpolate.
+        :param workers: number of threads querying the tree, -1 for all cores.
+        :return: numpy array holding the interpolated value of each point.
+        """
+        chords, indexes = self._tree.query(unit_vectors(coordinates), k=self._n_neighbors, workers=workers)
+
+        # Haversine (great circle) distance of the chord distance
+        distances = 2 * np.arcsin(np.minimum(chords / 2, 1))
+
+        return (inverse_distance_weights(distances) * self._training_values[indexes]).sum(axis=1)
+
+
+class ClimateQuery:
+    """
+    Point queries of the interpolated BioClim variables at arbitrary coordinates, e.g. at every tree or OPM nest,
+    instead of joining the points onto their neighbourhood and taking the value at its centroid.
+
+    The monthly station data and the station locations are read once. Fitted models of (variable, year) are kept
+    within a least recently used cache, such that batches of points of the same variable and year only cost a
+    vectorised tree query, e.g.
+
+        query = ClimateQuery(extract_directory)
+        values = query.climate_at(points, variable='bioclim_1', year=2019)
+    """
+
+    def __init__(self, extract_directory, chunk_size=STATION_DATA_CHUNK_SIZE, max_models=64):
+        """
+        :param extract_directory: directory holding the extracted 'station_data.csv' and 'station_locations.csv'.
+        :param chunk_size: number of daily rows of the station data read at once, None to read all at once.
+        :param max_models: number of fitted (variable, year) models kept in memory.
+        """
+        self._training_data = get_training_accumulators(extract_directory, chunk_size=chunk_size)
+        self._station_coordinates = get_station_coordinates(extract_directory)
+        self._max_models = max_models
+        self._models = OrderedDict()
+
+    def model(self, variable, year):
+        """
+        :param variable: BioClim variable, e.g. 'bioclim_1' or 'BioClimEnums.bioclim_1'.
+        :param year: year, e.g. 2019.
+        :return: fitted model of the variable within the year, see 'IDWModel'.
+        """
+        variable = BioClimEnums(variable)
+        key = (variable, int(year))
+
+        if key in self._models:
+            self._models.move_to_end(key)
+            return self._models[key]
+
+        strategy = BioClimFactory.get_bioclim(variable).time_partition_strategy
+
+        # Only the variable of the requested year is aggregated
+        partitions = strategy.partition(training_data=self._training_data.select_years([int(year)]),
+                                        station_coordinates=self._station_coordinates)
+        training = [(training_coordinates, training_values) for training_coordinates, training_values, partition_year
+                    in partitions if pd.Timestamp(partition_year).year == int(year)]
+
+        if not training:
+            raise KeyError(f'No station data of {variable.value} within {year}')
+
+        model = self._models[key] = IDWModel(*training[0])
+        if len(self._models) > self._max_models:
+            self._models.popitem(last=False)
+
+        return model
+
+    def climate_at(self, points, variable, year):
+        """
+        :param points: (points x 2) coordinates (longitude, latitude) in EPSG 4326, like the neighbourhood centroids.
+        :param variable: BioClim variable, e.g. 'bioclim_1'.
+        :param year: year, e.g. 2019.
+        :return: numpy array holding the interpolated value of the variable at each point.
+        """
+        return self.model(variable=variable, year=year).predict(points)
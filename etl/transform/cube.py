@@ -0,0 +1,287 @@
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from etl.transform.accumulators import MonthlyAccumulators, STATISTICS, INDEX
+
+META_FILE_NAME = 'meta.json'
+PRESENT_FILE_NAME = 'present.u1'
+
+# Value of the cells without any daily value
+EMPTY_VALUES = {
+    'sum': 0,
+    'count': 0,
+    'min': np.nan,
+    'max': np.nan,
+    'sum_of_squares': 0
+}
+
+
+def month_number(dates):
+    """
+    :return: number of months since year 0 of each date, such that consecutive months have consecutive numbers.
+    """
+    dates = pd.DatetimeIndex(dates)
+
+    return dates.year.values * 12 + dates.month.values - 1
+
+
+class ClimateCube:
+    """
+    Persistent, memory-mapped (months x stations x columns) arrays of the monthly statistics of the KNMI station
+    data (sum, count, min, max and sum of squares of e.g. temperature, rain, sunshine and humidity).
+
+    Consumers (the BioClim strategies, analyses, notebooks) read the cube instead of scanning the daily data again.
+    Months are the outer axis, such that new months are appended to the end of the files in place.
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: directory of an existing cube, see 'update'.
+        """
+        self._directory = Path(directory)
+
+        with open(self._directory / META_FILE_NAME) as f:
+            self._meta = json.load(f)
+
+        self._station_ids = np.array(self._meta['station_ids'], dtype='uint16')
+        self._columns = self._meta['columns']
+        self._months = pd.date_range(self._meta['start'], periods=self._meta['months'], freq='MS', name='date')
+
+    @staticmethod
+    def exists(directory):
+        return (Path(directory) / META_FILE_NAME).is_file()
+
+    @property
+    def station_ids(self):
+        return self._station_ids
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def months(self):
+        """
+        :return: first day of each month within the cube.
+        """
+        return self._months
+
+    @property
+    def source(self):
+        """
+        :return: fingerprint of the source the cube has been built from, see 'update'.
+        """
+        return self._meta.get('source')
+
+    @property
+    def shape(self):
+        return len(self._months), len(self._station_ids), len(self._columns)
+
+    def array(self, statistic):
+        """
+        :param statistic: one of 'sum', 'count', 'min', 'max' or 'sum_of_squares'.
+        :return: read-only memory map of shape (months, stations, columns).
+        """
+        return np.memmap(self._directory / f'{statistic}.f8', dtype='float64', mode='r', shape=self.shape)
+
+    def present(self):
+        """
+        :return: read-only memory map of shape (months, stations), whether a station has daily data within a month.
+        """
+        return np.memmap(self._directory / PRESENT_FILE_NAME, dtype='bool', mode='r', shape=self.shape[:2])
+
+    def station_indexes(self, station_ids):
+        """
+        :return: index of each station within the cube.
+        """
+        station_ids = np.asarray(station_ids)
+        unknown = station_ids[~np.isin(station_ids, self._station_ids)]
+
+        if len(unknown):
+            raise KeyError(f'Unknown station id(s) {", ".join(str(station_id) for station_id in unknown)}')
+
+        return np.searchsorted(self._station_ids, station_ids)
+
+    def select(self, column, statistic='mean', station_ids=None, start=None, end=None):
+        """
+        Slices the cube, only the selected months are read from disk.
+
+        :param column: column, e.g. 'temperature_avg'.
+        :param statistic: 'mean' or one of the accumulated statistics, e.g. 'max' or 'sum'.
+        :param station_ids: stations to select, None for all stations, unknown stations raise a KeyError.
+        :param start: first month to select (inclusive), e.g. '2019-01', None to start at the first month.
+        :param end: last month to select (inclusive), None to end at the last month.
+        :return: dataframe indexed by month, holding one column per station.
+        """
+        first = 0 if start is None else max(month_number([start])[0] - month_number(self._months[:1])[0], 0)
+        last = len(self._months) if end is None else month_number([end])[0] - month_number(self._months[:1])[0] + 1
+
+        months = slice(first, max(last, first))
+        stations = slice(None) if station_ids is None else self.station_indexes(station_ids)
+        column_index = self._columns.index(column)
+
+        if statistic == 'mean':
+            counts = self.array('count')[months, stations, column_index]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values = self.array('sum')[months, stations, column_index] / np.where(counts > 0, counts, np.nan)
+        else:
+            values = np.array(self.array(statistic)[months, stations, column_index])
+
+        return pd.DataFrame(values,
+                            index=self._months[months],
+                            columns=pd.Index(self._station_ids[stations], name='station_id'))
+
+    def to_accumulators(self):
+        """
+        :return: accumulators of all station-months holding daily data, see 'MonthlyAccumulators'.
+        """
+        months, stations = np.nonzero(self.present())
+        index = pd.MultiIndex.from_arrays([self._months[months], self._station_ids[stations]], names=INDEX)
+
+        statistics = {statistic: pd.DataFrame(self.array(statistic)[months, stations], index=index,
+                                              columns=self._columns)
+                      for statistic in STATISTICS}
+        # Counts are integers when accumulated from the daily values, which keeps the station-year hashes equal
+        statistics['count'] = statistics['count'].astype('int64')
+
+        accumulators = MonthlyAccumulators(columns=self._columns)
+        accumulators._partials = [statistics]
+
+        return accumulators
+
+    @classmethod
+    def update(cls, directory, accumulators, source=None):
+        """
+        Writes the months of the accumulators into the cube. Months which are already within the cube are overwritten
+        in place, later months are appended. The cube is rewritten when it doesn't hold all stations or columns yet,
+        and is replaced by the accumulators when these stem from another source, such that a cube with a matching
+        source never holds months which are not within that source.
+
+        :param directory: directory of the cube.
+        :param accumulators: per station, per month accumulators, see 'MonthlyAccumulators'.
+        :param source: fingerprint of the source of the accumulators, e.g. the checksum of the daily station data.
+        :return: updated cube.
+        """
+        directory = Path(directory)
+        statistics = accumulators.statistics
+        index = statistics['sum'].index
+
+        if not len(index):
+            return cls(directory) if cls.exists(directory) else None
+
+        station_ids = np.unique(index.get_level_values('station_id').values).astype('uint16')
+        numbers = month_number(index.get_level_values('date'))
+
+        cube = cls(directory) if cls.exists(directory) else None
+
+        if cube is None or cube.columns != accumulators.columns or (source is not None and source != cube.source):
+            return cls._write(directory=directory, accumulators=accumulators, station_ids=station_ids, source=source)
+
+        if not np.isin(station_ids, cube.station_ids).all() or numbers.min() < month_number(cube.months[:1])[0]:
+            # New stations or earlier months, keep the stations and months which are not within the accumulators
+            return cls._write(directory=directory, accumulators=accumulators,
+                              station_ids=np.union1d(station_ids, cube.station_ids), source=source, previous=cube)
+
+        first = month_number(cube.months[:1])[0]
+        n_months = max(len(cube.months), numbers.max() - first + 1)
+
+        cls._write_months(directory=directory, statistics=statistics, station_ids=cube.station_ids,
+                          columns=cube.columns, first=first, n_months=n_months, numbers=numbers)
+
+        cls._write_meta(directory=directory, station_ids=cube.station_ids, columns=cube.columns,
+                        start=cube.months[0], n_months=n_months, source=source)
+
+        return cls(directory)
+
+    @classmethod
+    def _write(cls, directory, accumulators, station_ids, source, previous=None):
+        """
+        (Re)writes the whole cube, within a temporary directory which replaces the cube once complete.
+        """
+        statistics = accumulators.statistics
+        numbers = month_number(statistics['sum'].index.get_level_values('date'))
+
+        first, last = numbers.min(), numbers.max()
+        if previous is not None:
+            first = min(first, month_number(previous.months[:1])[0])
+            last = max(last, month_number(previous.months[-1:])[0])
+
+        temporary_directory = directory.with_name(f'{directory.name}.tmp')
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        Path.mkdir(temporary_directory, parents=True)
+
+        start = pd.Timestamp(year=first // 12, month=first % 12 + 1, day=1)
+        shape = (last - first + 1, len(station_ids), len(accumulators.columns))
+
+        for statistic in STATISTICS:
+            np.full(shape, EMPTY_VALUES[statistic], dtype='float64').tofile(temporary_directory / f'{statistic}.f8')
+        np.zeros(shape[:2], dtype='bool').tofile(temporary_directory / PRESENT_FILE_NAME)
+
+        if previous is not None:
+            cls._write_months(directory=temporary_directory, statistics=previous.to_accumulators().statistics,
+                              station_ids=station_ids, columns=accumulators.columns, first=first,
+                              n_months=shape[0], numbers=[])
+
+        cls._write_months(directory=temporary_directory, statistics=statistics, station_ids=station_ids,
+                          columns=accumulators.columns, first=first, n_months=shape[0], numbers=numbers)
+        cls._write_meta(directory=temporary_directory, station_ids=station_ids, columns=accumulators.columns,
+                        start=start, n_months=shape[0], source=source)
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(temporary_directory, directory)
+
+        return cls(directory)
+
+    @staticmethod
+    def _write_months(directory, statistics, station_ids, columns, first, n_months, numbers):
+        """
+        Overwrites the months (numbers) of the statistics in place, the files are extended up to 'n_months' months.
+        """
+        index = statistics['sum'].index
+        rows = month_number(index.get_level_values('date')) - first
+        stations = np.searchsorted(station_ids, index.get_level_values('station_id').values)
+        shape = (n_months, len(station_ids), len(columns))
+
+        months = np.unique(np.asarray(numbers, dtype='int64')) - first
+
+        for statistic in STATISTICS:
+            file_path = directory / f'{statistic}.f8'
+            ClimateCube._extend(file_path, shape=shape, fill_value=EMPTY_VALUES[statistic], dtype='float64')
+
+            array = np.memmap(file_path, dtype='float64', mode='r+', shape=shape)
+            # Months within the accumulators are replaced as a whole
+            array[months] = EMPTY_VALUES[statistic]
+            array[rows, stations] = statistics[statistic][columns].values
+            array.flush()
+
+        file_path = directory / PRESENT_FILE_NAME
+        ClimateCube._extend(file_path, shape=shape[:2], fill_value=False, dtype='bool')
+
+        present = np.memmap(file_path, dtype='bool', mode='r+', shape=shape[:2])
+        present[months] = False
+        present[rows, stations] = True
+        present.flush()
+
+    @staticmethod
+    def _extend(file_path, shape, fill_value, dtype):
+        """
+        Appends empty months to the end of a file, up to the given shape.
+        """
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        current_size = file_path.stat().st_size
+
+        if current_size < size:
+            with open(file_path, 'ab') as f:
+                np.full((size - current_size) // np.dtype(dtype).itemsize, fill_value, dtype=dtype).tofile(f)
+
+    @staticmethod
+    def _write_meta(directory, station_ids, columns, start, n_months, source):
+        with open(directory / META_FILE_NAME, 'w') as f:
+            json.dump({'station_ids': [int(station_id) for station_id in station_ids],
+                       'columns': list(columns),
+                       'start': pd.Timestamp(start).strftime('%Y-%m-%d'),
+                       'months': int(n_months),
+                       'source': source}, f)
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+DICTIONARY_ID = 'dictionary'
+
+
+def dictionary_file_name(column):
+    return f'{column}_{DICTIONARY_ID}.csv'
+
+
+class DictionaryEncoder:
+    """
+    Dictionary encodes (repeating) string columns chunk by chunk, codes remain stable over all chunks such
+    that the chunks can be appended to one final transformation file.
+    """
+
+    def __init__(self, columns):
+        """
+        :param columns: names of the columns which should be encoded, columns which are not within a chunk are skipped.
+        """
+        self._columns = columns
+        self._dictionaries = {}
+
+    def encode(self, df):
+        """
+        Every column '<column>' is replaced by the integer column '<column>_code', missing values are encoded as -1.
+
+        :param df: dataframe (chunk) to encode, the dataframe itself is left untouched.
+        :return: dataframe holding the encoded columns.
+        """
+        for column in [column for column in self._columns if column in df]:
+            categorical = df[column].astype('category')
+            categories = categorical.cat.categories
+
+            # Extend the dictionary with the values which have not been seen in previous chunks
+            dictionary = self._dictionaries.get(column, pd.Index([], dtype='object'))
+            dictionary = self._dictionaries[column] = dictionary.append(categories[~categories.isin(dictionary)])
+
+            # Translate category codes into dictionary codes, last element is taken for code -1 (missing value)
+            codes = np.append(dictionary.get_indexer(categories), -1)[categorical.cat.codes.values]
+
+            df = df.assign(**{f'{column}_code': codes}).drop(columns=column)
+
+        return df
+
+    def save(self, transform_directory):
+        """
+        Writes the dictionary file '<column>_dictionary.csv' of every encoded column.
+        """
+        # Create local directory if not exists
+        if not Path(transform_directory).is_dir():
+            Path.mkdir(transform_directory, parents=True, exist_ok=True)
+
+        for column, dictionary in self._dictionaries.items():
+            pd.DataFrame({'code': range(len(dictionary)), 'value': dictionary}) \
+                .to_csv(Path(transform_directory) / dictionary_file_name(column), index=False)
+
+
+def dictionary_encode(df, columns, transform_directory):
+    """
+    Dictionary encodes (repeating) string columns, such that the transformation output only holds small integers.
+
+    Every column '<column>' is replaced by the integer column '<column>_code', the codes refer to the values
+    within the dictionary file '<column>_dictionary.csv' which is written next to the final transformation file.
+    Missing values are encoded as -1, columns which are not within the dataframe are skipped.
+
+    :param df: dataframe to encode, the dataframe itself is left untouched.
+    :param columns: names of the columns which should be encoded.
+    :param transform_directory: directory in which the dictionary files will be saved.
+    :return: dataframe holding the encoded columns.
+    """
+    encoder = DictionaryEncoder(columns=columns)
+    df = encoder.encode(df)
+    encoder.save(transform_directory=transform_directory)
+
+    return df
+
+
+def dictionary_decode(df, columns, transform_directory):
+    """
+    Reverse of 'dictionary_encode', every integer column '<column>_code' is replaced by the categorical
+    column '<column>'.
+    """
+    for column in [column for column in columns if f'{column}_code' in df]:
+        dictionary = pd.read_csv(Path(transform_directory) / dictionary_file_name(column), dtype={'value': 'str'})
+        categorical = pd.Categorical.from_codes(codes=df[f'{column}_code'].values,
+                                                categories=dictionary.sort_values('code')['value'].values)
+
+        df = df.assign(**{column: categorical}).drop(columns=f'{column}_code')
+
+    return df
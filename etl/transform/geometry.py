@@ -0,0 +1,128 @@
+import binascii
+import numpy as np
+import pandas as pd
+import shapely
+import geopandas as gpd
+from etl.transform.reprojection import WGS84
+from etl.transform.cache import cached
+from config import GEOMETRY_FORMAT, GEOMETRY_PRECISION
+
+# Extended WKB point: byte order (little endian), geometry type with SRID flag set, SRID, x, y
+EWKB_POINT_DTYPE = np.dtype([
+    ('byte_order', 'u1'),
+    ('geometry_type', '<u4'),
+    ('srid', '<u4'),
+    ('x', '<f8'),
+    ('y', '<f8'),
+])
+EWKB_POINT = 1
+EWKB_SRID_FLAG = 0x20000000
+
+
+@cached(version=1)
+def read_wkt_csv(file_path, usecols=None, dtypes=None, geometry_columns=('geometry',)):
+    """
+    Reads a csv file holding WKT geometries, e.g. 'neighbourhoods.csv', parsing all geometries at once.
+
+    :param file_path: path of the csv file.
+    :param usecols: columns to read, None to read all columns.
+    :param dtypes: data types of the (non geometry) columns.
+    :param geometry_columns: columns holding WKT, these are parsed into shapely geometries.
+    :return: dataframe.
+    """
+    df = pd.read_csv(file_path, usecols=usecols, dtype=dtypes, header=0)
+
+    for column in geometry_columns:
+        df[column] = shapely.from_wkt(df[column].values)
+
+    return df
+
+
+def round_coordinates(geometries, precision):
+    """
+    Snaps the coordinates of all geometries at once to a grid of the given number of decimals.
+
+    :return: numpy array holding the rounded geometries.
+    """
+    return shapely.set_precision(np.asarray(geometries, dtype=object), 10.0 ** -precision)
+
+
+def points_to_ewkb(x, y, srid=WGS84, precision=GEOMETRY_PRECISION, hex=True):
+    """
+    Encodes coordinate arrays as (extended) WKB points, without creating a geometry object per point.
+
+    :param x: array-like holding the x coordinates (longitudes).
+    :param y: array-like holding the y coordinates (latitudes).
+    :param srid: spatial reference id stored within each point.
+    :param precision: number of decimals to round the coordinates to, None to keep full precision.
+    :param hex: return hex encoded strings, as accepted by postgis, instead of raw bytes.
+    :return: numpy array holding one EWKB point per coordinate, None for missing coordinates.
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    missing = np.isnan(x) | np.isnan(y)
+
+    if precision is not None:
+        x, y = np.round(x, precision), np.round(y, precision)
+
+    points = np.empty(len(x), dtype=EWKB_POINT_DTYPE)
+    points['byte_order'] = 1
+    points['geometry_type'] = EWKB_POINT | EWKB_SRID_FLAG
+    points['srid'] = srid
+    points['x'] = x
+    points['y'] = y
+
+    if hex:
+        # Hex encode all points at once, then split the result into one string per point
+        hex_points = binascii.hexlify(points.tobytes()).upper()
+        ewkb_points = np.frombuffer(hex_points, dtype=f'S{2 * EWKB_POINT_DTYPE.itemsize}').astype(str).astype(object)
+    else:
+        ewkb_points = points.view(f'V{EWKB_POINT_DTYPE.itemsize}').astype(object)
+
+    # Missing coordinates are loaded as NULL, instead of as points holding NaN coordinates
+    ewkb_points[missing] = None
+
+    return ewkb_points
+
+
+def geometries_to_ewkb(geometries, srid=WGS84, precision=GEOMETRY_PRECISION, hex=True):
+    """
+    Encodes arbitrary geometries (e.g. polygons) as (extended) WKB.
+
+    :param geometries: iterable of shapely geometries.
+    :return: numpy array holding one EWKB geometry per geometry.
+    """
+    geometries = np.asarray(geometries, dtype=object)
+
+    if precision is not None:
+        geometries = round_coordinates(geometries, precision)
+
+    return shapely.to_wkb(shapely.set_srid(geometries, srid), hex=hex, include_srid=True)
+
+
+def encode_points(x, y, srid=WGS84, geometry_format=GEOMETRY_FORMAT, precision=GEOMETRY_PRECISION):
+    """
+    Builds the geometry column of a point transformation, in the configured output format.
+    """
+    if geometry_format == 'ewkb':
+        return points_to_ewkb(x=x, y=y, srid=srid, precision=precision)
+
+    if precision is not None:
+        x, y = np.round(np.asarray(x, dtype='float64'), precision), np.round(np.asarray(y, dtype='float64'), precision)
+
+    return gpd.points_from_xy(x, y)
+
+
+def encode_geometries(geometries, srid=WGS84, geometry_format=GEOMETRY_FORMAT, precision=GEOMETRY_PRECISION):
+    """
+    Builds the geometry column of a (multi)polygon transformation, in the configured output format.
+    """
+    if geometry_format == 'ewkb':
+        return geometries_to_ewkb(geometries=geometries, srid=srid, precision=precision)
+
+    geometries = np.asarray(geometries, dtype=object)
+
+    if precision is not None:
+        geometries = round_coordinates(geometries, precision)
+
+    return shapely.to_wkt(geometries, rounding_precision=-1)
@@ -0,0 +1,84 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from etl.transform.cache import file_checksum
+
+STATE_DIRECTORY_NAME = 'incremental'
+HASHES_FILE_NAME = 'station_year_hashes.csv'
+SOURCES_FILE_NAME = 'sources.json'
+
+
+def station_year_hashes(accumulators):
+    """
+    Fingerprints the monthly accumulators of every station-year. The BioClim variables of a year only depend on
+    the accumulators of that year, hence a year of which no fingerprint changed doesn't have to be recomputed.
+
+    :param accumulators: per station, per month accumulators, see 'etl.transform.accumulators'.
+    :return: series of (hex) hashes indexed by (year, station_id).
+    """
+    df = pd.concat(accumulators.statistics, axis=1)
+
+    # Each row holds its month and station within the index, hence the row hashes of a station-year can be
+    # combined in any order
+    row_hashes = pd.util.hash_pandas_object(df, index=True).values
+
+    codes, station_years = pd.MultiIndex.from_arrays([df.index.get_level_values('date').year,
+                                                      df.index.get_level_values('station_id')]).factorize(sort=True)
+    hashes = np.zeros(len(station_years), dtype='uint64')
+    np.bitwise_xor.at(hashes, codes, row_hashes)
+
+    return pd.Series([f'{value:016x}' for value in hashes], index=station_years.set_names(['year', 'station_id']),
+                     dtype='object')
+
+
+class IncrementalState:
+    """
+    Fingerprints of the station-years of the previous run, such that only the years whose daily data changed
+    are recomputed (e.g. the current year after KNMI published new daily data).
+
+    All years are dirty when there is no previous run, or when one of the other sources (e.g. the station
+    locations or neighbourhoods) or the version changed. Remove the state directory to force a full rebuild.
+    """
+
+    def __init__(self, directory, sources=(), version=None):
+        """
+        :param directory: directory in which the state is persisted, e.g. within the transform directory.
+        :param sources: paths of the other source files the output depends on.
+        :param version: version of the output, e.g. the name of the BioClim variable.
+        """
+        self._directory = Path(directory)
+        self._sources = {'version': version,
+                         **{Path(file_path).name: file_checksum(file_path)
+                            for file_path in sources if Path(file_path).is_file()}}
+
+    def dirty_years(self, hashes):
+        """
+        :param hashes: fingerprints of the current station-years, see 'station_year_hashes'.
+        :return: set of years which have to be recomputed, None when all years have to be (re)computed.
+        """
+        if not (self._directory / HASHES_FILE_NAME).is_file() or not (self._directory / SOURCES_FILE_NAME).is_file():
+            return None
+
+        with open(self._directory / SOURCES_FILE_NAME) as f:
+            if json.load(f) != self._sources:
+                return None
+
+        previous_hashes = pd.read_csv(self._directory / HASHES_FILE_NAME,
+                                      dtype={'year': 'int64', 'station_id': 'uint16', 'hash': 'str'}) \
+            .set_index(['year', 'station_id'])['hash']
+
+        # New, removed and changed station-years
+        index = previous_hashes.index.union(hashes.index)
+        changed = previous_hashes.reindex(index) != hashes.reindex(index)
+
+        return set(index[changed.values].get_level_values('year'))
+
+    def save(self, hashes):
+        if not self._directory.is_dir():
+            Path.mkdir(self._directory, parents=True, exist_ok=True)
+
+        hashes.rename('hash').reset_index().to_csv(self._directory / HASHES_FILE_NAME, index=False)
+
+        with open(self._directory / SOURCES_FILE_NAME, 'w') as f:
+            json.dump(self._sources, f)
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+from etl.transform.schema import FAST_CSV_ENGINE
+from etl.transform.cache import cached
+
+# KNMI daily station data columns, renamed to more readable names
+KNMI_COLUMNS = {
+    'STN': 'station_id',
+    'YYYYMMDD': 'date',
+    'TG': 'temperature_avg',
+    'TN': 'temperature_min',
+    'TX': 'temperature_max',
+    'SQ': 'sunshine_duration',
+    'Q': 'sunshine_radiation',
+    'DR': 'rain_duration',
+    'RH': 'rain_sum',
+    'UG': 'humidity_avg',
+    'UX': 'humidity_max',
+    'UN': 'humidity_min'
+}
+
+# Columns given in tenths, e.g. 0.1 degrees Celsius
+TENTHS_COLUMNS = ['temperature_avg', 'temperature_min', 'temperature_max', 'sunshine_duration', 'rain_duration',
+                  'rain_sum']
+# Columns in which -1 is the code of a trace amount, e.g. less than 0.05 mm of rain
+TRACE_COLUMNS = ['sunshine_duration', 'rain_sum']
+
+
+def find_header(file_path):
+    """
+    Finds the header line of a KNMI export, which is preceded by a preamble of varying length describing the columns.
+    The header line itself may be commented out, e.g. '# STN,YYYYMMDD,   DDVEC,...'.
+
+    :return: tuple holding the (zero based) line number of the header and its column names.
+    """
+    with open(file_path) as f:
+        for line_number, line in enumerate(f):
+            names = [name.strip() for name in line.lstrip('#').split(',')]
+
+            if names[0] == 'STN' and 'YYYYMMDD' in names:
+                return line_number, names
+
+    raise ValueError(f'No KNMI header line (STN,YYYYMMDD,...) found within {file_path}')
+
+
+def yyyymmdd_to_datetime(values):
+    """
+    Converts integer dates (e.g. 20080101) to datetime64 arithmetically, instead of parsing a string per date.
+    """
+    values = np.asarray(values, dtype='int64')
+    years, months, days = values // 10000, values // 100 % 100, values % 100
+
+    dates = (years - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (months - 1).astype('timedelta64[M]')
+
+    return dates.astype('datetime64[D]') + (days - 1).astype('timedelta64[D]')
+
+
+def get_station_data_dtypes(codes):
+    return {code: 'uint16' if code == 'STN' else 'int32' if code == 'YYYYMMDD' else 'float32' for code in codes}
+
+
+def read_knmi_csv(file_path, skip_rows, names, codes):
+    """
+    Reads only the given columns of a KNMI export, with the multithreaded pyarrow parser if installed.
+    """
+    dtypes = get_station_data_dtypes(codes)
+
+    if FAST_CSV_ENGINE == 'pyarrow':
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        table = pa_csv.read_csv(file_path,
+                                read_options=pa_csv.ReadOptions(skip_rows=skip_rows, column_names=names),
+                                convert_options=pa_csv.ConvertOptions(
+                                    include_columns=codes,
+                                    column_types={code: pa.from_numpy_dtype(np.dtype(dtype))
+                                                  for code, dtype in dtypes.items()},
+                                    # Values are padded with whitespace, hence missing values are whitespace only
+                                    null_values=[' ' * width for width in range(16)]))
+
+        return table.to_pandas()
+
+    return pd.read_csv(file_path,
+                       skiprows=skip_rows,
+                       header=None,
+                       names=names,
+                       usecols=codes,
+                       dtype=dtypes,
+                       skipinitialspace=True)[codes]
+
+
+def get_station_data_codes(names, columns):
+    """
+    :return: tuple holding the mapping of the codes within the header onto readable names, and the codes of the
+    (readable) columns to read, all known columns when 'columns' is None.
+    """
+    readable_names = {code: KNMI_COLUMNS.get(code, code) for code in names}
+
+    columns = columns or [name for code, name in readable_names.items() if code in KNMI_COLUMNS]
+    codes = [code for column in columns for code, name in readable_names.items() if name == column]
+
+    return readable_names, columns, codes
+
+
+def convert_station_data(df, columns, tenths, trace, trace_value):
+    """
+    Converts the dates, tenths and trace amounts of a (renamed) KNMI dataframe, see 'read_station_data'.
+    """
+    if 'date' in df:
+        df['date'] = yyyymmdd_to_datetime(df['date'].values).astype('datetime64[ns]')
+
+    # Locate trace amounts before converting tenths
+    trace_amounts = {column: df[column].values == -1 for column in trace if column in df}
+
+    tenths = [column for column in tenths if column in df]
+    df[tenths] = df[tenths] / 10
+
+    for column, is_trace_amount in trace_amounts.items():
+        df.loc[is_trace_amount, column] = trace_value
+
+    return df[columns]
+
+
+@cached(version=1)
+def read_station_data(file_path, columns=None, tenths=TENTHS_COLUMNS, trace=TRACE_COLUMNS, trace_value=0):
+    """
+    Reads a KNMI daily station data export, e.g. 'station_data.csv'.
+
+    :param file_path: path of the export.
+    :param columns: (readable) names of the columns to read, see 'KNMI_COLUMNS', None to read all of them.
+    :param tenths: columns which are given in tenths, these are converted to decimal values.
+    :param trace: columns in which -1 is the code of a trace amount.
+    :param trace_value: (decimal) value trace amounts are replaced by.
+    :return: dataframe holding the column 'station_id' (uint16), 'date' (datetime64) and the (float32) values.
+    """
+    line_number, names = find_header(file_path)
+    readable_names, columns, codes = get_station_data_codes(names=names, columns=columns)
+
+    df = read_knmi_csv(file_path=file_path, skip_rows=line_number + 1, names=names, codes=codes) \
+        .rename(columns=readable_names)
+
+    return convert_station_data(df, columns=columns, tenths=tenths, trace=trace, trace_value=trace_value)
+
+
+def read_station_data_chunks(file_path, chunk_size, columns=None, tenths=TENTHS_COLUMNS, trace=TRACE_COLUMNS,
+                             trace_value=0):
+    """
+    Reads a KNMI daily station data export in chunks, such that exports which don't fit in memory (e.g. all
+    stations since 1901) can be aggregated, see 'etl.transform.accumulators.MonthlyAccumulators'.
+
+    :param chunk_size: number of rows per chunk.
+    :return: iterator of dataframes, see 'read_station_data'.
+    """
+    line_number, names = find_header(file_path)
+    readable_names, columns, codes = get_station_data_codes(names=names, columns=columns)
+
+    dtypes = get_station_data_dtypes(codes)
+
+    for df in pd.read_csv(file_path,
+                          skiprows=line_number + 1,
+                          header=None,
+                          names=names,
+                          usecols=codes,
+                          dtype=dtypes,
+                          skipinitialspace=True,
+                          chunksize=chunk_size):
+        yield convert_station_data(df[codes].rename(columns=readable_names), columns=columns, tenths=tenths,
+                                   trace=trace, trace_value=trace_value)
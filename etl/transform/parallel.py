@@ -0,0 +1,35 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from config import TRANSFORM_WORKERS
+
+
+def ordered_parallel_map(function, iterable, workers=TRANSFORM_WORKERS, max_pending=None):
+    """
+    Applies a function to every item of an iterable on a process pool, yielding the results in input order.
+
+    Unlike 'ProcessPoolExecutor.map', items are only taken from the iterable when there is room for them,
+    such that at most 'max_pending' items (e.g. chunks of a large file) are held in memory at the same time.
+
+    :param function: module level (picklable) function, called with one item.
+    :param iterable: items to process, e.g. a chunked csv reader.
+    :param workers: number of processes, 1 processes the items within the current process.
+    :param max_pending: max number of items submitted but not yet yielded, defaults to twice the workers.
+    """
+    if workers is None or workers <= 1:
+        for item in iterable:
+            yield function(item)
+        return
+
+    max_pending = max_pending or 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        for item in iterable:
+            pending.append(executor.submit(function, item))
+
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
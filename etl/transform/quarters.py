@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Quarter based BioClim variables: (column, column by which the quarter is selected, extreme)
+QUARTER_VARIABLES = {
+    'BIOCLIM_8': ('temperature_avg', 'rain_sum', 'max'),  # mean temperature of wettest quarter
+    'BIOCLIM_9': ('temperature_avg', 'rain_sum', 'min'),  # mean temperature of driest quarter
+    'BIOCLIM_10': ('temperature_avg', 'temperature_avg', 'max'),  # mean temperature of warmest quarter
+    'BIOCLIM_11': ('temperature_avg', 'temperature_avg', 'min'),  # mean temperature of coldest quarter
+    'BIOCLIM_16': ('rain_sum', 'rain_sum', 'max'),  # precipitation of wettest quarter
+    'BIOCLIM_17': ('rain_sum', 'rain_sum', 'min'),  # precipitation of driest quarter
+    'BIOCLIM_18': ('rain_sum', 'temperature_avg', 'max'),  # precipitation of warmest quarter
+    'BIOCLIM_19': ('rain_sum', 'temperature_avg', 'min')  # precipitation of coldest quarter
+}
+
+# Rolling quarters of the most recent accumulators, keyed by their fingerprint, see 'get_rolling_quarters'
+_rolling_quarters = {}
+
+
+def get_rolling_quarters(accumulators):
+    """
+    BIO 8-11 and 16-19 select from the same rolling quarters, which are therefore calculated once and shared by
+    the jobs of these variables when run in one process (e.g. 'script.py'), instead of once per variable.
+
+    :param accumulators: per station, per month accumulators, see 'etl.transform.accumulators'.
+    :return: rolling quarters of the accumulators, see 'RollingQuarters'.
+    """
+    fingerprint = accumulators.fingerprint()
+
+    if fingerprint not in _rolling_quarters:
+        # Only the quarters of the most recent station data are kept
+        _rolling_quarters.clear()
+        _rolling_quarters[fingerprint] = RollingQuarters(accumulators)
+
+    return _rolling_quarters[fingerprint]
+
+
+class RollingQuarters:
+    """
+    Rolling quarters (any 3 consecutive months, wrapping from December to January) of each station-year, as defined
+    by the BioClim specification (see the USGS link within the 'README.MD' file), instead of calendar quarters.
+
+    Monthly values are laid out as one (station-years x 12) matrix per column, such that the 12 quarters of every
+    station-year are calculated in one strided pass. BIO 8-11 and 16-19 then all select from the same quarters.
+    """
+
+    def __init__(self, accumulators, means=('temperature_avg',), sums=('rain_sum',)):
+        """
+        :param accumulators: per station, per month accumulators, see 'etl.transform.accumulators'.
+        :param means: columns of which the quarterly value is the mean of the monthly means, e.g. temperature.
+        :param sums: columns of which the quarterly value is the sum of the monthly sums, e.g. precipitation.
+        """
+        monthly_means = accumulators.resample(freq='M', means=list(means) + list(sums))
+        monthly_sums = accumulators.resample(freq='M', sums=sums)
+
+        dates = monthly_means.index.get_level_values('date')
+        station_ids = monthly_means.index.get_level_values('station_id')
+
+        # Row of each station-year within the matrices, column of each month
+        rows, station_years = pd.MultiIndex.from_arrays([dates.year, station_ids]).factorize(sort=True)
+        months = dates.month.values - 1
+
+        self._index = pd.MultiIndex.from_arrays([
+            pd.to_datetime({'year': station_years.get_level_values(0), 'month': 12, 'day': 31}),
+            station_years.get_level_values(1)
+        ], names=['date', 'station_id'])
+
+        self._quarters = {}
+
+        for column in list(means) + list(sums):
+            if column in sums:
+                # Months without any daily values are missing, instead of having a sum of 0
+                values = monthly_sums[column].where(monthly_means[column].notna()).values
+            else:
+                values = monthly_means[column].values
+
+            matrix = np.full((len(station_years), 12), np.nan)
+            matrix[rows, months] = values
+
+            self._quarters[column] = self.rolling_sum(matrix) / (3 if column in means else 1)
+
+    @staticmethod
+    def rolling_sum(matrix):
+        """
+        :param matrix: (n x 12) monthly values.
+        :return: (n x 12) sums of 3 consecutive months, the i-th quarter starting at month i. A quarter holding a
+        missing month is missing.
+        """
+        wrapped = np.concatenate([matrix, matrix[:, :2]], axis=1)
+
+        return sliding_window_view(wrapped, 3, axis=1).sum(axis=2)
+
+    def select(self, column, by, extreme='max'):
+        """
+        Selects, per station-year, the value of a column within the quarter in which another column is extreme,
+        e.g. the mean temperature of the wettest quarter (BIO 8) is select('temperature_avg', 'rain_sum', 'max').
+
+        :param column: column of which the quarterly value is returned.
+        :param by: column by which the quarter is selected.
+        :param extreme: either 'max' or 'min'.
+        :return: dataframe indexed by (date, station_id), the date being the last day of the year.
+        """
+        quarters = self._quarters[by]
+        missing = np.isnan(quarters)
+
+        # Skip missing quarters, station-years without any quarter remain missing
+        fill_value = -np.inf if extreme == 'max' else np.inf
+        arg_extreme = np.argmax if extreme == 'max' else np.argmin
+        indexes = arg_extreme(np.where(missing, fill_value, quarters), axis=1)
+
+        values = np.take_along_axis(self._quarters[column], indexes[:, np.newaxis], axis=1)[:, 0]
+        values[missing.all(axis=1)] = np.nan
+
+        return pd.DataFrame({column: values}, index=self._index)
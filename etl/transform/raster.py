@@ -0,0 +1,243 @@
+import os
+import json
+import math
+import numpy as np
+from pathlib import Path
+from etl.transform.parallel import ordered_parallel_map
+from etl.transform.regions import RegionIndex
+from etl.transform.reprojection import reproject_coordinates, RD_NEW, WGS84
+from config import TRANSFORM_WORKERS
+
+META_FILE_NAME = 'meta.json'
+MASK_FILE_NAME = 'mask.npy'
+
+
+class RasterGrid:
+    """
+    Regular, north-up grid of square cells, e.g. 250 m cells over the Netherlands in EPSG 28992.
+    """
+
+    def __init__(self, bounds, resolution, crs=RD_NEW):
+        """
+        :param bounds: (min x, min y, max x, max y) of the grid, in the CRS of the grid.
+        :param resolution: width and height of a cell, in the units of the CRS (meters for EPSG 28992).
+        :param crs: EPSG code of the grid.
+        """
+        self._bounds = tuple(float(bound) for bound in bounds)
+        self._resolution = float(resolution)
+        self._crs = crs
+
+    @property
+    def crs(self):
+        return self._crs
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @property
+    def shape(self):
+        """
+        :return: (rows, columns) of the grid, the last row and column may extend beyond the bounds.
+        """
+        min_x, min_y, max_x, max_y = self._bounds
+
+        return math.ceil((max_y - min_y) / self._resolution), math.ceil((max_x - min_x) / self._resolution)
+
+    @property
+    def transform(self):
+        """
+        :return: affine geotransform (origin x, cell width, 0, origin y, 0, -cell height) of the upper left corner,
+        as used by GDAL.
+        """
+        min_x, _, _, max_y = self._bounds
+
+        return min_x, self._resolution, 0.0, max_y, 0.0, -self._resolution
+
+    def windows(self, tile_size):
+        """
+        :param tile_size: number of rows and columns of a tile.
+        :return: generator of the (row slice, column slice) of each tile.
+        """
+        rows, columns = self.shape
+
+        for row in range(0, rows, tile_size):
+            for column in range(0, columns, tile_size):
+                yield slice(row, min(row + tile_size, rows)), slice(column, min(column + tile_size, columns))
+
+    def window(self, bounds):
+        """
+        :param bounds: (min x, min y, max x, max y), in the CRS of the grid.
+        :return: (row slice, column slice) of the cells which intersect the bounds.
+        """
+        origin_x, _, _, origin_y, _, _ = self.transform
+        rows, columns = self.shape
+        min_x, min_y, max_x, max_y = bounds
+
+        row_start = min(max(math.floor((origin_y - max_y) / self._resolution), 0), rows)
+        row_stop = min(max(math.ceil((origin_y - min_y) / self._resolution), row_start), rows)
+        column_start = min(max(math.floor((min_x - origin_x) / self._resolution), 0), columns)
+        column_stop = min(max(math.ceil((max_x - origin_x) / self._resolution), column_start), columns)
+
+        return slice(row_start, row_stop), slice(column_start, column_stop)
+
+    def cell_centers(self, window=None):
+        """
+        :param window: (row slice, column slice), None for the whole grid.
+        :return: tuple of the (rows x columns) x and y coordinates of the cell centers, in the CRS of the grid.
+        """
+        rows, columns = window or (slice(0, self.shape[0]), slice(0, self.shape[1]))
+        origin_x, _, _, origin_y, _, _ = self.transform
+
+        x = origin_x + (np.arange(columns.start, columns.stop) + 0.5) * self._resolution
+        y = origin_y - (np.arange(rows.start, rows.stop) + 0.5) * self._resolution
+
+        return np.meshgrid(x, y)
+
+    def to_meta(self):
+        """
+        :return: georeferencing of the grid, see 'RasterStore'.
+        """
+        return {'crs': f'EPSG:{self._crs}',
+                'bounds': list(self._bounds),
+                'resolution': self._resolution,
+                'transform': list(self.transform),
+                'shape': list(self.shape)}
+
+    @classmethod
+    def from_meta(cls, meta):
+        return cls(bounds=meta['bounds'], resolution=meta['resolution'], crs=int(meta['crs'].split(':')[1]))
+
+
+def fill_tile(item):
+    """
+    Interpolates the cells of one tile and writes them into the (memory-mapped) raster, tiles are disjoint hence
+    they are written by parallel processes.
+
+    :param item: tuple of (raster file path, mask file path, grid, window, function, keyword arguments), the function
+    being called with the keyword arguments and the WGS 84 coordinates of the cells as 'interpolate_coordinates'.
+    """
+    file_path, mask_file_path, grid, window, function, kwargs = item
+
+    x, y = grid.cell_centers(window)
+    longitudes, latitudes = reproject_coordinates(x=x.ravel(), y=y.ravel(), source_crs=grid.crs, target_crs=WGS84)
+
+    # Cells outside the mask (e.g. sea) are missing
+    mask = np.load(mask_file_path, mmap_mode='r')[window].ravel()
+    values = np.full(len(mask), np.nan, dtype='float32')
+
+    if mask.any():
+        values[mask] = function(**kwargs, interpolate_coordinates=np.column_stack([longitudes[mask], latitudes[mask]]))
+
+    raster = np.load(file_path, mmap_mode='r+')
+    raster[window] = values.reshape(x.shape)
+    raster.flush()
+
+
+class RasterStore:
+    """
+    Directory of rasters of one variable on one grid, one memory-mapped .npy file (float32, NaN for missing cells)
+    per year. 'meta.json' holds the georeferencing of the grid, such that windows of a raster are read without
+    loading the whole raster, e.g.
+
+        store = RasterStore(directory)
+        values = store.read(2019, bounds=(120000, 480000, 130000, 490000))
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: directory of an existing store, see 'create'.
+        """
+        self._directory = Path(directory)
+
+        with open(self._directory / META_FILE_NAME) as f:
+            self._meta = json.load(f)
+
+        self._grid = RasterGrid.from_meta(self._meta)
+
+    @classmethod
+    def create(cls, directory, grid, tile_size, geometries=None):
+        """
+        :param directory: directory of the store, existing rasters on another grid are removed.
+        :param grid: grid of the rasters, see 'RasterGrid'.
+        :param tile_size: number of rows and columns interpolated at once, see 'write'.
+        :param geometries: (multi)polygons (EPSG 4326) outside of which cells are missing, e.g. the neighbourhoods.
+        """
+        directory = Path(directory)
+        Path.mkdir(directory, parents=True, exist_ok=True)
+
+        meta = {**grid.to_meta(), 'tile_size': tile_size, 'dtype': 'float32', 'nodata': 'nan'}
+
+        if (directory / META_FILE_NAME).is_file():
+            with open(directory / META_FILE_NAME) as f:
+                if json.load(f) != meta:
+                    for file_path in directory.glob('*.npy'):
+                        os.remove(file_path)
+
+        mask = np.ones(grid.shape, dtype='bool')
+
+        if geometries is not None:
+            x, y = grid.cell_centers()
+            longitudes, latitudes = reproject_coordinates(x=x.ravel(), y=y.ravel(), source_crs=grid.crs,
+                                                          target_crs=WGS84)
+            regions = RegionIndex(codes=np.arange(len(geometries)), geometries=geometries).query(x=longitudes,
+                                                                                               y=latitudes)
+            mask = (regions >= 0).reshape(grid.shape)
+
+        np.save(directory / MASK_FILE_NAME, mask)
+
+        with open(directory / META_FILE_NAME, 'w') as f:
+            json.dump(meta, f)
+
+        return cls(directory)
+
+    @property
+    def grid(self):
+        return self._grid
+
+    @property
+    def meta(self):
+        return self._meta
+
+    @property
+    def years(self):
+        return sorted(int(file_path.stem) for file_path in self._directory.glob('*.npy') if file_path.stem.isdigit())
+
+    def file_path(self, year):
+        return self._directory / f'{year}.npy'
+
+    def read(self, year, bounds=None):
+        """
+        :param year: year of the raster.
+        :param bounds: (min x, min y, max x, max y) of the window to read, in the CRS of the grid, None for all cells.
+        :return: read-only memory map of the (rows x columns) cells, north-up.
+        """
+        raster = np.load(self.file_path(year), mmap_mode='r')
+
+        return raster if bounds is None else raster[self._grid.window(bounds)]
+
+    def write(self, layers, function, workers=TRANSFORM_WORKERS):
+        """
+        Interpolates the rasters of several years, the tiles of all years are processed in parallel.
+
+        :param layers: iterable of (year, keyword arguments of the function), e.g. the training data of each year.
+        :param function: module level function interpolating the values at 'interpolate_coordinates' (EPSG 4326),
+        e.g. 'interpolate'.
+        :param workers: number of processes.
+        """
+        temporary_file_paths = {}
+        items = []
+
+        for year, kwargs in layers:
+            # Write into a temporary file first, such that readers never see a partial raster
+            temporary_file_paths[year] = self._directory / f'{year}.tmp.npy'
+            np.lib.format.open_memmap(temporary_file_paths[year], mode='w+', dtype='float32', shape=self._grid.shape)
+
+            items += [(temporary_file_paths[year], self._directory / MASK_FILE_NAME, self._grid, window, function,
+                       kwargs) for window in self._grid.windows(self._meta['tile_size'])]
+
+        for _ in ordered_parallel_map(fill_tile, items, workers=workers):
+            pass
+
+        for year, temporary_file_path in temporary_file_paths.items():
+            os.replace(temporary_file_path, self.file_path(year))
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import shapely
+from functools import lru_cache
+from pathlib import Path
+from shapely import STRtree
+from etl.transform.geometry import read_wkt_csv
+
+# Columns added by 'tag_regions', holding the code of the region of each point
+REGION_COLUMNS = ['neighbourhood', 'province']
+
+
+class RegionIndex:
+    """
+    Spatial index (STRtree) over the polygons of administrative regions, e.g. neighbourhoods,
+    used to look up the region of many points at once.
+    """
+
+    def __init__(self, codes, geometries):
+        """
+        :param codes: code of each region.
+        :param geometries: (multi)polygon of each region.
+        """
+        self._codes = np.asarray(codes)
+        self._tree = STRtree(np.asarray(geometries))
+
+    @property
+    def codes(self):
+        return self._codes
+
+    def query(self, x, y):
+        """
+        :param x: array-like holding the x coordinates (longitudes).
+        :param y: array-like holding the y coordinates (latitudes).
+        :return: numpy array holding the index of the region of each point, -1 for points outside all regions.
+        """
+        points = shapely.points(np.asarray(x, dtype='float64'), np.asarray(y, dtype='float64'))
+
+        # Pairs of (point index, region index), points on a shared border match more than one region
+        point_indexes, region_indexes = self._tree.query(points, predicate='intersects')
+        point_indexes, first_match = np.unique(point_indexes, return_index=True)
+
+        regions = np.full(len(points), -1, dtype='int64')
+        regions[point_indexes] = region_indexes[first_match]
+
+        return regions
+
+    def lookup(self, x, y):
+        """
+        :return: categorical holding the code of the region of each point, missing for points outside all regions.
+        """
+        # Region codes are unique, hence the index of a region doubles as its category code
+        return pd.Categorical.from_codes(codes=self.query(x=x, y=y), categories=self._codes)
+
+
+@lru_cache(maxsize=4)
+def get_region_index(file_path, code_column='id'):
+    """
+    Builds (and caches) the spatial index over the regions within a csv file holding WKT geometries,
+    such as 'neighbourhoods.csv' and 'provinces.csv'.
+    """
+    df = read_wkt_csv(file_path=file_path, usecols=[code_column, 'geometry'], dtypes={code_column: 'str', 'geometry': 'str'})
+
+    return RegionIndex(codes=df[code_column].values, geometries=df['geometry'].values)
+
+
+def tag_regions(df, x, y, extract_directory):
+    """
+    Tags each point with the code of its neighbourhood and province, such that analyses can join on these
+    codes instead of running 'ST_Contains' at query time. Regions are only tagged when their file
+    ('neighbourhoods.csv', 'provinces.csv') has been extracted next to the source data.
+
+    :param df: dataframe holding one row per point.
+    :param x: array-like holding the longitudes of the points (EPSG 4326).
+    :param y: array-like holding the latitudes of the points (EPSG 4326).
+    :param extract_directory: directory holding the extracted source data.
+    :return: dataframe holding the categorical columns 'neighbourhood' and/or 'province'.
+    """
+    for column, file_name in zip(REGION_COLUMNS, ['neighbourhoods.csv', 'provinces.csv']):
+        file_path = Path(extract_directory) / file_name
+
+        if file_path.is_file():
+            df[column] = get_region_index(file_path).lookup(x=x, y=y)
+
+    return df
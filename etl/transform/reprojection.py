@@ -0,0 +1,41 @@
+import numpy as np
+import geopandas as gpd
+from functools import lru_cache
+from pyproj import Transformer
+
+# EPSG 28992 ("rijksdriehoekcoordinaten")
+RD_NEW = 28992
+# EPSG 4326 (WSG 84)
+WGS84 = 4326
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source_crs, target_crs):
+    """
+    Creating a transformer is expensive, therefore one transformer is created (and cached) per CRS pair.
+    """
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+def reproject_coordinates(x, y, source_crs=RD_NEW, target_crs=WGS84):
+    """
+    Reprojects whole coordinate arrays at once, instead of calling pyproj for every single coordinate.
+
+    :param x: array-like holding the x coordinates (longitudes).
+    :param y: array-like holding the y coordinates (latitudes).
+    :return: tuple of numpy arrays, holding the reprojected x and y coordinates.
+    """
+    transformer = get_transformer(source_crs, target_crs)
+
+    return transformer.transform(np.asarray(x, dtype='float64'), np.asarray(y, dtype='float64'))
+
+
+def reproject_points(x, y, source_crs=RD_NEW, target_crs=WGS84):
+    """
+    Reprojects coordinate arrays and builds their point geometries in one vectorised pass.
+
+    :return: geometry array of points, written as WKT when saved to csv.
+    """
+    x, y = reproject_coordinates(x=x, y=y, source_crs=source_crs, target_crs=target_crs)
+
+    return gpd.points_from_xy(x, y)
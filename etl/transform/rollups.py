@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import shapely
+from scipy import sparse
+from pathlib import Path
+from etl.transform.regions import get_region_index
+
+# Administrative levels above the neighbourhoods onto which interpolated values are rolled up
+ROLLUP_LEVELS = ['township', 'province']
+
+
+def aggregation_matrix(codes, weights):
+    """
+    :param codes: code of the region of each neighbourhood, missing for neighbourhoods outside all regions.
+    :param weights: weight of each neighbourhood within its region, e.g. its area.
+    :return: tuple of the sparse (regions x neighbourhoods) matrix holding the weights, and the code of each region.
+    """
+    categorical = pd.Categorical(codes)
+    inside = categorical.codes >= 0
+
+    matrix = sparse.csr_matrix((np.asarray(weights, dtype='float64')[inside],
+                                (categorical.codes[inside], np.flatnonzero(inside))),
+                               shape=(len(categorical.categories), len(categorical)))
+
+    return matrix, categorical.categories.values
+
+
+class Rollups:
+    """
+    Area-weighted means of neighbourhood values within their township and province.
+
+    The neighbourhoods are mapped onto their regions once, by one sparse (regions x neighbourhoods) matrix per level,
+    such that the values of all years are rolled up by one sparse matrix product instead of interpolating
+    again at the centroids of the townships and provinces.
+    """
+
+    def __init__(self, levels, weights):
+        """
+        :param levels: dictionary of the level (e.g. 'township') onto the region code of each neighbourhood.
+        :param weights: weight of each neighbourhood, e.g. its area.
+        """
+        self._matrices = {level: aggregation_matrix(codes=codes, weights=weights) for level, codes in levels.items()}
+
+    @classmethod
+    def from_neighbourhoods(cls, neighbourhood_data, extract_directory):
+        """
+        Townships are taken from the 'township' column of the neighbourhoods, provinces are looked up by the centroid
+        of each neighbourhood when 'provinces.csv' has been extracted next to 'neighbourhoods.csv'.
+
+        :param neighbourhood_data: (geo)dataframe of 'neighbourhoods.csv', see 'get_neighbourhood_data'.
+        :param extract_directory: directory holding the extracted source data.
+        """
+        levels = {'township': neighbourhood_data['township'].values}
+
+        file_path = Path(extract_directory) / 'provinces.csv'
+        if file_path.is_file():
+            centroids = neighbourhood_data['centroid'].values
+            levels['province'] = get_region_index(file_path).lookup(x=shapely.get_x(centroids),
+                                                                    y=shapely.get_y(centroids))
+
+        # Fall back onto the area of the geometries when the neighbourhoods don't hold their area
+        if 'area' in neighbourhood_data:
+            weights = pd.to_numeric(neighbourhood_data['area']).values
+        else:
+            weights = shapely.area(np.asarray(neighbourhood_data['geometry'].values))
+
+        return cls(levels=levels, weights=weights)
+
+    @property
+    def levels(self):
+        return list(self._matrices)
+
+    def codes(self, level):
+        """
+        :return: code of each region of a level, in the order of the rows returned by 'aggregate'.
+        """
+        return self._matrices[level][1]
+
+    def aggregate(self, level, values):
+        """
+        :param level: level onto which is rolled up, e.g. 'province'.
+        :param values: (neighbourhoods) or (neighbourhoods x years) values, missing values are skipped.
+        :return: (regions) or (regions x years) area-weighted means, missing for regions without any value.
+        """
+        matrix = self._matrices[level][0]
+        values = np.asarray(values, dtype='float64')
+        present = ~np.isnan(values)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (matrix @ np.where(present, values, 0)) / (matrix @ present.astype('float64'))
@@ -0,0 +1,183 @@
+import json
+import numpy as np
+import shapely
+from collections import OrderedDict
+from scipy import sparse
+from pathlib import Path
+from sklearn.neighbors import BallTree
+from etl.transform.cache import cache_key, use_entry, write_entry, META_FILE_NAME
+from etl.transform.regions import RegionIndex
+from config import USE_CACHE, CACHE_DIRECTORY, CACHE_MAX_SIZE
+
+# Increment whenever the sample points or the sampling matrix change
+SAMPLING_VERSION = 1
+
+
+def sample_polygons(geometries, spacing):
+    """
+    Samples each polygon by the points of one regular grid which lie within it, such that every sample point
+    represents the same area. Polygons too small to hold a grid point are sampled by one point on their surface.
+
+    :param geometries: (multi)polygon of each region, e.g. the neighbourhoods (EPSG 4326).
+    :param spacing: distance in degrees between the grid points.
+    :return: tuple of the (samples x 2) coordinates (longitude, latitude), and the polygon of each sample point.
+    """
+    geometries = np.asarray(geometries)
+    min_x, min_y, max_x, max_y = shapely.total_bounds(geometries)
+
+    x, y = np.meshgrid(np.arange(min_x + spacing / 2, max_x, spacing), np.arange(min_y + spacing / 2, max_y, spacing))
+    polygon_indexes = RegionIndex(codes=np.arange(len(geometries)), geometries=geometries).query(x=x.ravel(),
+                                                                                                y=y.ravel())
+
+    inside = polygon_indexes >= 0
+    coordinates = np.column_stack([x.ravel()[inside], y.ravel()[inside]])
+    polygon_indexes = polygon_indexes[inside]
+
+    empty = np.setdiff1d(np.arange(len(geometries)), polygon_indexes)
+    points = shapely.point_on_surface(geometries[empty])
+
+    coordinates = np.concatenate([coordinates, np.column_stack([shapely.get_x(points), shapely.get_y(points)])])
+    polygon_indexes = np.concatenate([polygon_indexes, empty])
+
+    return coordinates, polygon_indexes
+
+
+def sampling_matrix(polygon_indexes, n_polygons):
+    """
+    :return: sparse (polygons x samples) matrix, averaging the values at the sample points of each polygon.
+    """
+    counts = np.bincount(polygon_indexes, minlength=n_polygons)
+
+    return sparse.csr_matrix((1 / counts[polygon_indexes], (polygon_indexes, np.arange(len(polygon_indexes)))),
+                             shape=(n_polygons, len(polygon_indexes)))
+
+
+def haversine_coordinates(coordinates):
+    """
+    The haversine metric of sklearn reads coordinates as (latitude, longitude) in radians.
+
+    :param coordinates: (points x 2) coordinates (longitude, latitude) in EPSG 4326.
+    :return: (points x 2) coordinates (latitude, longitude) in radians.
+    """
+    return np.radians(np.asarray(coordinates, dtype='float64')[:, ::-1])
+
+
+def inverse_distance_weights(distances):
+    """
+    Weights of the nearest stations of each point, as 'KNeighborsRegressor(weights='distance')' weighs these.
+
+    :param distances: (points x neighbours) distances to the nearest stations.
+    :return: (points x neighbours) weights, of which each row sums to 1.
+    """
+    # Points which coincide with a station only take the value(s) of the coinciding station(s)
+    with np.errstate(divide='ignore'):
+        weights = 1 / distances
+
+    coincide = np.isinf(weights)
+    rows = coincide.any(axis=1)
+    weights[rows] = coincide[rows]
+
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def knn_weights(training_coordinates, coordinates, n_neighbors=5):
+    """
+    Inverse distance weights of the nearest stations of each point, equal to the predictions of
+    'KNeighborsRegressor(metric='haversine', weights='distance')' as used by 'interpolate'.
+
+    :return: sparse (points x stations) matrix, of which each row sums to 1.
+    """
+    tree = BallTree(haversine_coordinates(training_coordinates), metric='haversine', leaf_size=2)
+    distances, indexes = tree.query(haversine_coordinates(coordinates), k=n_neighbors)
+    weights = inverse_distance_weights(distances)
+
+    return sparse.csr_matrix((weights.ravel(), (np.repeat(np.arange(len(coordinates)), n_neighbors), indexes.ravel())),
+                             shape=(len(coordinates), len(training_coordinates)))
+
+
+class PolygonInterpolator:
+    """
+    Interpolates the mean value within each polygon instead of the value at its centroid, which better represents
+    large (rural) neighbourhoods.
+
+    The polygons are sampled once, the sampling matrix is cached on disk by the content of the polygon file. The
+    (polygons x stations) weights of a set of stations are then computed once and reused by all years and variables
+    with the same stations, such that each year costs a single sparse matrix-vector product.
+    """
+
+    def __init__(self, sample_coordinates, matrix, max_weights=32):
+        """
+        :param sample_coordinates: (samples x 2) coordinates of the sample points, see 'sample_polygons'.
+        :param matrix: sparse (polygons x samples) matrix, see 'sampling_matrix'.
+        :param max_weights: number of station sets of which the weights are kept in memory.
+        """
+        self._sample_coordinates = sample_coordinates
+        self._matrix = matrix
+        self._max_weights = max_weights
+        self._weights = OrderedDict()
+
+    @classmethod
+    def from_file(cls, file_path, geometries, spacing, cache_directory=CACHE_DIRECTORY, max_size=CACHE_MAX_SIZE):
+        """
+        :param file_path: file holding the polygons, e.g. 'neighbourhoods.csv', of which the content keys the cache.
+        :param geometries: (multi)polygon of each region within the file.
+        :param spacing: distance in degrees between the sample points, see 'sample_polygons'.
+        """
+        if not USE_CACHE or not Path(cache_directory).parent.is_dir():
+            return cls(*cls._sample(geometries=geometries, spacing=spacing))
+
+        directory = Path(cache_directory) / cache_key(parser=sample_polygons, version=SAMPLING_VERSION,
+                                                      file_path=file_path, kwargs={'spacing': spacing})
+
+        if use_entry(directory):
+            return cls(np.load(directory / 'coordinates.npy'), sparse.load_npz(directory / 'matrix.npz'))
+
+        sample_coordinates, matrix = cls._sample(geometries=geometries, spacing=spacing)
+
+        def write(entry_directory):
+            np.save(entry_directory / 'coordinates.npy', sample_coordinates)
+            sparse.save_npz(entry_directory / 'matrix.npz', matrix)
+
+            with open(entry_directory / META_FILE_NAME, 'w') as f:
+                json.dump({'samples': len(sample_coordinates), 'spacing': spacing}, f)
+
+        write_entry(directory, writer=write, max_size=max_size)
+
+        return cls(sample_coordinates, matrix)
+
+    @staticmethod
+    def _sample(geometries, spacing):
+        sample_coordinates, polygon_indexes = sample_polygons(geometries=geometries, spacing=spacing)
+
+        return sample_coordinates, sampling_matrix(polygon_indexes=polygon_indexes, n_polygons=len(geometries))
+
+    @property
+    def n_samples(self):
+        return len(self._sample_coordinates)
+
+    def weights(self, training_coordinates):
+        """
+        :param training_coordinates: coordinates of the stations.
+        :return: sparse (polygons x stations) matrix, mapping the station values onto the polygon means.
+        """
+        training_coordinates = np.ascontiguousarray(training_coordinates, dtype='float64')
+        key = training_coordinates.tobytes()
+
+        if key in self._weights:
+            self._weights.move_to_end(key)
+            return self._weights[key]
+
+        weights = (self._matrix @ knn_weights(training_coordinates=training_coordinates,
+                                              coordinates=self._sample_coordinates)).tocsr()
+
+        self._weights[key] = weights
+        if len(self._weights) > self._max_weights:
+            self._weights.popitem(last=False)
+
+        return weights
+
+    def interpolate(self, training_coordinates, training_values):
+        """
+        :return: numpy array holding the interpolated mean value within each polygon.
+        """
+        return self.weights(training_coordinates) @ np.asarray(training_values, dtype='float64')
@@ -0,0 +1,125 @@
+import pandas as pd
+from importlib.util import find_spec
+from etl.transform.reprojection import RD_NEW
+
+# Multithreaded csv parser used by pandas when pyarrow is installed, which is only imported by pandas when parsing
+FAST_CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
+
+class Schema:
+    """
+    Declarative description of a source file and the steps which turn it into a final transformation:
+    read (only the required columns) -> rename -> cast -> parse dates -> substitute -> scale -> reproject -> select.
+    """
+
+    def __init__(self, file_name,
+                 columns,
+                 dtypes,
+                 output_file_name=None,
+                 dates=None,
+                 replace=None,
+                 scale=None,
+                 coordinates=None,
+                 crs=RD_NEW,
+                 output_columns=None,
+                 dictionary_columns=(),
+                 read_options=None):
+        """
+        :param file_name: name of the source file within the extract directory.
+        :param columns: mapping of the source columns to read onto their (more readable) names, other columns are
+        not parsed at all.
+        :param dtypes: data types of the source columns.
+        :param output_file_name: name of the final transformation file, only required by transformers.
+        :param dates: mapping of date columns onto either their format (None to infer it) or a list of the
+        'year', 'month' and 'day' columns they are composed of.
+        :param replace: mapping of columns onto the values to substitute, e.g. {'rain_sum': {-1: 0}}.
+        :param scale: mapping of columns onto the divisor of their values, e.g. 10 for values in tenths.
+        :param coordinates: names of the (x, y) columns, from which the point column 'geometry' is built.
+        :param crs: EPSG code of the coordinates.
+        :param output_columns: columns of the final transformation, None to keep all columns.
+        :param dictionary_columns: columns which are dictionary encoded within the final transformation file.
+        :param read_options: additional keyword arguments of 'pd.read_csv', e.g. the header row.
+        """
+        self._file_name = file_name
+        self._columns = columns
+        self._dtypes = dtypes
+        self._output_file_name = output_file_name
+        self._dates = dates or {}
+        self._replace = replace or {}
+        self._scale = scale or {}
+        self._coordinates = coordinates
+        self._crs = crs
+        self._output_columns = output_columns
+        self._dictionary_columns = list(dictionary_columns)
+        self._read_options = read_options or {}
+
+    @property
+    def file_name(self):
+        return self._file_name
+
+    @property
+    def output_file_name(self):
+        return self._output_file_name
+
+    @property
+    def coordinates(self):
+        return self._coordinates
+
+    @property
+    def crs(self):
+        return self._crs
+
+    @property
+    def output_columns(self):
+        return self._output_columns
+
+    @property
+    def dictionary_columns(self):
+        return self._dictionary_columns
+
+    def read_csv(self, file_path, chunk_size=None):
+        """
+        Reads only the columns of the schema, already cast to their data types.
+
+        :param file_path: path of the source file.
+        :param chunk_size: number of rows per chunk, None to read the whole file at once with the fast
+        (multithreaded) parser.
+        :return: iterator of renamed dataframes.
+        """
+        options = dict(usecols=list(self._columns), dtype=self._dtypes, header=0)
+        options.update(self._read_options)
+
+        if chunk_size is None:
+            # The pyarrow engine doesn't support reading in chunks
+            return iter([pd.read_csv(file_path, engine=FAST_CSV_ENGINE, **options).rename(columns=self._columns)])
+
+        return (chunk.rename(columns=self._columns) for chunk in pd.read_csv(file_path, chunksize=chunk_size, **options))
+
+    def apply(self, df):
+        """
+        Parses the dates, substitutes and scales the values of a (renamed) dataframe, the dataframe is changed in place.
+        """
+        for column, date_format in self._dates.items():
+            if isinstance(date_format, (list, tuple)):
+                df[column] = pd.to_datetime(df[list(date_format)].set_axis(['year', 'month', 'day'], axis=1))
+            else:
+                df[column] = pd.to_datetime(df[column], format=date_format)
+
+        for column, values in self._replace.items():
+            df[column] = df[column].replace(values)
+
+        # Divide all columns sharing the same divisor at once
+        for divisor in set(self._scale.values()):
+            columns = [column for column, column_divisor in self._scale.items() if column_divisor == divisor]
+            df[columns] = df[columns] / divisor
+
+        return df
+
+    def select(self, df):
+        """
+        :return: output columns of the dataframe, (optional) columns which are not within the dataframe are skipped.
+        """
+        if self._output_columns is None:
+            return df
+
+        return df[[column for column in self._output_columns if column in df]]
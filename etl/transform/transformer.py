@@ -1,4 +1,4 @@
 
 def transform(transformer, extract_directory, transform_directory):
 
-    transformer.transform(extract_directory=extract_directory, transform_directory=transform_directory)
+    return transformer.transform(extract_directory=extract_directory, transform_directory=transform_directory)
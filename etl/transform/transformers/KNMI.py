@@ -1,81 +1,39 @@
-import pandas as pd
-from etl.transform.transformers.base import Base
-from pathlib import Path
+from etl.transform.transformers.base import Chunked
+from etl.transform.knmi import read_station_data, read_station_data_chunks, KNMI_COLUMNS
 from config import FINAL_TRANSFORMATION_ID
 
-
-class KNMIWeatherStationData(Base):
-
-    def transform(self, extract_directory, transform_directory):
-        # Rename to more readable names,
-        # note: only select columns which are related to BIOCLIM, being temperature and perception
-        column_mapping = {
-            'STN': 'station_id',
-            'YYYYMMDD': 'date',
-            'TG': 'temperature_avg',
-            'TN': 'temperature_min',
-            'TX': 'temperature_max',
-            'SQ': 'sunshine_duration',
-            'Q': 'sunshine_radiation',
-            'DR': 'rain_duration',
-            'RH': 'rain_sum',
-            'UG': 'humidity_avg',
-            'UX': 'humidity_max',
-            'UN': 'humidity_min'
-        }
-
-        dtypes = {
-            "STN": "uint16",
-            "YYYYMMDD": "str",
-            "TG": "float32",
-            "TN": "float32",
-            "TX": "float32",
-            "SQ": "float32",
-            "Q": "float32",
-            "DR": "float32",
-            "RH": "float32",
-            "UG": "float32",
-            "UX": "float32",
-            "UN": "float32"
-        }
-
-        # Load
-        df_weather_station_data = pd.read_csv(
-            extract_directory / 'station_data.csv',
-            dtype=dtypes,
-            usecols=list(column_mapping),
-            header=40
-        )
-
-        # Rename to more meaningful names
-        df_weather_station_data = df_weather_station_data.rename(columns=column_mapping)
-
-        # Set datetimeindex
-        df_weather_station_data['date'] = pd.to_datetime(df_weather_station_data['date'])
-
-        # Transform temperature, sunshine and rain to decimal values (check description of this function)
-        df_weather_station_data[
-            ['temperature_avg',
-             'temperature_min',
-             'temperature_max',
-             'sunshine_duration',
-             'sunshine_radiation',
-             'rain_duration']
-        ] = df_weather_station_data[
-                ['temperature_avg',
-                 'temperature_min',
-                 'temperature_max',
-                 'sunshine_duration',
-                 'sunshine_radiation',
-                 'rain_duration']] / 10
-
-        # Set output file
-        final_file_name = f'station_data_{FINAL_TRANSFORMATION_ID}.csv'
-        output_file_path = transform_directory / final_file_name
-
-        # Create local directory if not exists
-        if not Path(transform_directory).is_dir():
-            Path.mkdir(transform_directory, parents=True, exist_ok=True)
-
-        # Write transformations to file
-        df_weather_station_data.to_csv(output_file_path, index=False, na_rep='nan')
+# Note: only select columns which are related to BIOCLIM, being temperature and perception
+READ_OPTIONS = dict(
+    columns=list(KNMI_COLUMNS.values()),
+    # Transform temperature, sunshine and rain duration to decimal values
+    tenths=['temperature_avg',
+            'temperature_min',
+            'temperature_max',
+            'sunshine_duration',
+            'sunshine_radiation',
+            'rain_duration'],
+    trace=[]
+)
+
+
+class KNMIWeatherStationData(Chunked):
+    output_file_name = f'station_data_{FINAL_TRANSFORMATION_ID}.csv'
+    output_columns = list(KNMI_COLUMNS.values())
+
+    def __init__(self, chunk_size=None, **kwargs):
+        """
+        :param chunk_size: number of daily rows read at once, None to read the whole file at once with the fast
+        (multithreaded) parser.
+        """
+        super().__init__(chunk_size=chunk_size, **kwargs)
+
+    def read_chunks(self, extract_directory):
+        file_path = extract_directory / 'station_data.csv'
+
+        if self._chunk_size is None:
+            return iter([read_station_data(file_path=file_path, **READ_OPTIONS)])
+
+        return read_station_data_chunks(file_path=file_path, chunk_size=self._chunk_size, **READ_OPTIONS)
+
+    def transform_chunk(self, df, extract_directory):
+        return df
@@ -1,8 +1,114 @@
+import csv
+import pandas as pd
 from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import Path
+from etl.transform.dictionary import DictionaryEncoder
+from etl.transform.parallel import ordered_parallel_map
+from config import SAVE_TRANSFORMATION_FILES, TRANSFORM_CHUNK_SIZE, TRANSFORM_WORKERS, STREAM_TRANSFORMATIONS
 
 
 class Base(ABC):
+    # Whether the last transformation only holds some years, of which the loader replaces the rows, see 'load'
+    partial = False
 
     @abstractmethod
     def transform(self, extract_directory, transform_directory):
+        """
+        :return: optionally the final transformation as dataframe, which can be handed over in-memory to a loader.
+        """
         pass
+
+
+class Chunked(Base):
+    """
+    Transforms a (large) source file in fixed-size chunks, which are transformed on a process pool and appended,
+    in order, to the final transformation file.
+
+    In streaming mode chunks are not kept after being written, such that a transformation runs in constant memory
+    whatever the size of the source file. The loader then reads the final transformation file.
+    """
+    # Name of the final transformation file
+    output_file_name = None
+    # Columns which are dictionary encoded within the final transformation file
+    dictionary_columns = []
+    # Columns of the final transformation, those of the (empty) transformation of a source without any rows
+    output_columns = []
+    quoting = csv.QUOTE_MINIMAL
+
+    def __init__(self, chunk_size=TRANSFORM_CHUNK_SIZE, workers=TRANSFORM_WORKERS, streaming=STREAM_TRANSFORMATIONS):
+        """
+        :param chunk_size: number of rows transformed at once by a worker, None to transform the whole file at once.
+        :param workers: number of worker processes.
+        :param streaming: don't hold the final transformation in memory, only write it to file.
+        """
+        self._chunk_size = chunk_size
+        # A single chunk is transformed within the current process
+        self._workers = workers if chunk_size else 1
+        self._streaming = streaming
+
+    @abstractmethod
+    def read_chunks(self, extract_directory):
+        """
+        :return: iterator of dataframes holding 'chunk_size' rows of the source file, e.g. a chunked csv reader.
+        """
+        pass
+
+    @abstractmethod
+    def transform_chunk(self, df, extract_directory):
+        """
+        Transforms one chunk, runs within a worker process.
+
+        :return: transformed chunk.
+        """
+        pass
+
+    def transform(self, extract_directory, transform_directory):
+        output_file_path = Path(transform_directory) / self.output_file_name
+        save_transformation = self._streaming or SAVE_TRANSFORMATION_FILES
+
+        # Codes must be the same over all chunks, hence one encoder is used for the whole file
+        encoder = DictionaryEncoder(columns=self.dictionary_columns)
+
+        if save_transformation and not Path(transform_directory).is_dir():
+            Path.mkdir(transform_directory, parents=True, exist_ok=True)
+
+        transformed_chunks = []
+        empty = True
+
+        for index, df in enumerate(ordered_parallel_map(partial(self.transform_chunk,
+                                                                extract_directory=extract_directory),
+                                                        self.read_chunks(extract_directory=extract_directory),
+                                                        workers=self._workers)):
+            empty = False
+
+            if save_transformation:
+                # Append chunk to csv
+                encoder.encode(df).to_csv(output_file_path, index=False, na_rep='', quoting=self.quoting,
+                                          mode='w' if index == 0 else 'a', header=index == 0)
+
+            if not self._streaming:
+                transformed_chunks.append(df)
+
+        if empty:
+            # A source without any rows, the final transformation only holds the header
+            df = pd.DataFrame(columns=self.output_columns)
+
+            if save_transformation:
+                encoder.encode(df).to_csv(output_file_path, index=False, quoting=self.quoting)
+
+            transformed_chunks.append(df)
+
+        if save_transformation:
+            encoder.save(transform_directory=transform_directory)
+
+        if self._streaming:
+            return None
+
+        df = pd.concat(transformed_chunks, ignore_index=True)
+
+        # Categories differ per chunk, these are merged by casting once more
+        for column in [column for column in self.dictionary_columns if column in df]:
+            df[column] = df[column].astype('category')
+
+        return df
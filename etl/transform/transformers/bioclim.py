@@ -1,13 +1,31 @@
 import numpy as np
 import geopandas as gpd
 import pandas as pd
-import shapely.wkt
 from etl.transform.transformers.base import Base
+from etl.transform.dictionary import dictionary_encode, dictionary_decode
+from etl.transform.knmi import read_station_data, read_station_data_chunks, KNMI_COLUMNS
+from etl.transform.accumulators import MonthlyAccumulators
+from etl.transform.quarters import get_rolling_quarters, QUARTER_VARIABLES
+from etl.transform.geometry import read_wkt_csv
 from pathlib import Path
 from sklearn.neighbors import KNeighborsRegressor
 from abc import ABC, abstractmethod
 from enum import Enum
-from config import FINAL_TRANSFORMATION_ID
+from etl.transform.cube import ClimateCube
+from etl.transform.cache import cache_key
+from etl.transform.incremental import IncrementalState, station_year_hashes, STATE_DIRECTORY_NAME
+from etl.transform.rollups import Rollups, ROLLUP_LEVELS
+from etl.transform.sampling import PolygonInterpolator, haversine_coordinates
+from etl.transform.raster import RasterGrid, RasterStore
+from config import FINAL_TRANSFORMATION_ID, SAVE_TRANSFORMATION_FILES, STATION_DATA_CHUNK_SIZE, INCREMENTAL_BIOCLIM, \
+    USE_CLIMATE_CUBE, CLIMATE_CUBE_DIRECTORY, BIOCLIM_ROLLUPS, POLYGON_INTERPOLATION, POLYGON_SAMPLE_SPACING, \
+    BIOCLIM_RASTER, RASTER_BOUNDS, RASTER_RESOLUTION, RASTER_TILE_SIZE
+
+ROLLUPS_DIRECTORY_NAME = 'rollups'
+RASTER_DIRECTORY_NAME = 'raster'
+# Version of the interpolated values, increment it whenever these change (e.g. the interpolation itself), such that
+# incremental runs recompute all years instead of keeping the values of the previous version
+OUTPUT_VERSION = 2
 
 
 def save_dataframe_to_csv(path, dataframe):
@@ -18,76 +36,37 @@ def save_dataframe_to_csv(path, dataframe):
     dataframe.to_csv(path, index=False)
 
 
-def get_weather_station_values(extract_directory):
-    # Rename to more readable names,
-    # note: only select columns which are related to BIOCLIM, being temperature and perception
-    column_mapping = {
-        'STN': 'station_id',
-        'YYYYMMDD': 'date',
-        'TG': 'temperature_avg',
-        'TN': 'temperature_min',
-        'TX': 'temperature_max',
-        'SQ': 'sunshine_duration',
-        'Q': 'sunshine_radiation',
-        'DR': 'rain_duration',
-        'RH': 'rain_sum',
-        'UG': 'humidity_avg',
-        'UX': 'humidity_max',
-        'UN': 'humidity_min'
-    }
+def merge_previous_years(df, df_previous, years):
+    """
+    :param df: interpolated values of the recomputed years.
+    :param df_previous: interpolated values of the previous run.
+    :param years: recomputed years, the previous values of these years are replaced.
+    :return: dataframe holding the interpolated values of all years, sorted by year.
+    """
+    df_previous = df_previous[~df_previous['year'].dt.year.isin(years)]
 
-    dtypes = {
-        "STN": "uint16",
-        "YYYYMMDD": "str",
-        "TG": "float32",
-        "TN": "float32",
-        "TX": "float32",
-        "SQ": "float32",
-        "Q": "float32",
-        "DR": "float32",
-        "RH": "float32",
-        "UG": "float32",
-        "UX": "float32",
-        "UN": "float32"
-    }
+    return pd.concat([df_previous, df], ignore_index=True).sort_values('year', kind='stable')
 
-    # Load
-    df_weather_station_data = pd.read_csv(
-        extract_directory / 'station_data.csv',
-        dtype=dtypes,
-        usecols=list(column_mapping),
-        header=40
-    )
 
-    # Rename to more meaningful names
-    df_weather_station_data = df_weather_station_data.rename(columns=column_mapping)
-
-    # Set datetimeindex
-    df_weather_station_data['date'] = pd.to_datetime(df_weather_station_data['date'])
-
-    # Replace -1 values for 'rain_sum' and 'sun_duration' with 0
-    df_weather_station_data[['rain_sum', 'rain_duration']] = df_weather_station_data[
-        ['rain_sum', 'rain_duration']].replace(-1, 0)
-
-    # Transform temperature, sunshine and rain to decimal values (check description of this function)
-    df_weather_station_data[
-        ['temperature_avg',
-         'temperature_min',
-         'temperature_max',
-         'sunshine_duration',
-         'sunshine_radiation',
-         'rain_duration',
-         'rain_sum']
-    ] = df_weather_station_data[
-            ['temperature_avg',
-             'temperature_min',
-             'temperature_max',
-             'sunshine_duration',
-             'sunshine_radiation',
-             'rain_duration',
-             'rain_sum']] / 10
-
-    return df_weather_station_data
+# Note: only select columns which are related to BIOCLIM, being temperature and perception
+STATION_DATA_OPTIONS = dict(
+    columns=list(KNMI_COLUMNS.values()),
+    # Transform temperature, sunshine and rain to decimal values
+    tenths=['temperature_avg',
+            'temperature_min',
+            'temperature_max',
+            'sunshine_duration',
+            'sunshine_radiation',
+            'rain_duration',
+            'rain_sum'],
+    # Replace -1 values for 'rain_sum' and 'rain_duration' with 0
+    trace=['rain_sum', 'rain_duration'],
+    trace_value=0
+)
+
+
+def get_weather_station_values(extract_directory):
+    return read_station_data(file_path=extract_directory / 'station_data.csv', **STATION_DATA_OPTIONS)
 
 
 def get_weather_station_coordinates(extract_directory):
@@ -133,15 +112,8 @@ def get_neighbourhood_data(extract_directory):
 
     file_path = extract_directory / 'neighbourhoods.csv'
 
-    df = pd.read_csv(
-        file_path,
-        dtype=dtypes,
-        header=0
-    )
-
     # Transform columns 'geometry','centroid' to data type geometry
-    df['geometry'] = df['geometry'].apply(shapely.wkt.loads)
-    df['centroid'] = df['centroid'].apply(shapely.wkt.loads)
+    df = read_wkt_csv(file_path=file_path, dtypes=dtypes, geometry_columns=['geometry', 'centroid'])
 
     # Load into geodataframe
     gdf = gpd.GeoDataFrame(df, geometry='geometry')
@@ -149,16 +121,55 @@ def get_neighbourhood_data(extract_directory):
     return gdf
 
 
+def get_station_coordinates(extract_directory):
+    """
+    Small lookup of the station coordinates, which are attached to the (aggregated) values at partition time
+    instead of being merged onto every daily observation.
+
+    :return: array holding the (longitude, latitude) of a station at row 'station_id', NaN for unknown stations.
+    """
+    df = get_weather_station_coordinates(extract_directory)
+
+    # One row per possible (uint16) station id, such that any station id can be looked up
+    station_coordinates = np.full((np.iinfo('uint16').max + 1, 2), np.nan, dtype='float32')
+    station_coordinates[df['station_id'].values] = df[['longitude', 'latitude']].values
+
+    return station_coordinates
+
+
 def get_training_dataframe(extract_directory):
-    # Merge weather station data and their locations
-    training_values = get_weather_station_values(extract_directory)
-    training_values_coordinates = get_weather_station_coordinates(extract_directory)
+    # Daily values keyed by the (uint16) 'station_id' only, the station locations are looked up after aggregation
+    return get_weather_station_values(extract_directory)
+
+
+def get_training_accumulators(extract_directory, chunk_size=None, cube_directory=CLIMATE_CUBE_DIRECTORY):
+    """
+    :param chunk_size: number of daily rows read at once, None to read the whole (cached) file at once.
+    :param cube_directory: directory of the climate cube, which is read instead of the daily station data
+    when it has been built from the same station data, see 'ClimateCube'.
+    :return: per station, per month accumulators of the daily values, see 'MonthlyAccumulators'.
+    """
+    file_path = extract_directory / 'station_data.csv'
+    use_cube = USE_CLIMATE_CUBE and Path(cube_directory).parent.is_dir()
 
-    training_dataframe = training_values.merge(training_values_coordinates,
-                                               left_on='station_id',
-                                               right_on='station_id')
+    if use_cube:
+        source = cache_key(parser=read_station_data, version=1, file_path=file_path, kwargs=STATION_DATA_OPTIONS)
 
-    return training_dataframe
+        if ClimateCube.exists(cube_directory) and ClimateCube(cube_directory).source == source:
+            return ClimateCube(cube_directory).to_accumulators()
+
+    if chunk_size is None:
+        accumulators = MonthlyAccumulators.from_daily(get_training_dataframe(extract_directory))
+    else:
+        # Only the accumulators and a single chunk are held in memory, whatever the number of daily rows
+        accumulators = MonthlyAccumulators.from_chunks(
+            chunks=read_station_data_chunks(file_path=file_path, chunk_size=chunk_size, **STATION_DATA_OPTIONS),
+            columns=[column for column in STATION_DATA_OPTIONS['columns'] if column not in ('station_id', 'date')])
+
+    if use_cube:
+        ClimateCube.update(directory=cube_directory, accumulators=accumulators, source=source)
+
+    return accumulators
 
 
 def get_interpolation_coordinates(extract_directory):
@@ -178,22 +189,54 @@ def get_interpolation_coordinates(extract_directory):
 
 def interpolate(training_coordinates, training_values, interpolate_coordinates):
     """
-    training_coordinates: The coordinates of the known points.
+    training_coordinates: The coordinates (longitude, latitude) of the known points.
     training_values: The values belonging to the 'training_coordinates'.
-    interpolate_coordinates: The coordinates which need to be interpolated.
+    interpolate_coordinates: The coordinates (longitude, latitude) which need to be interpolated.
 
     returns: numpy array holding the interpolated values for the given 'interpolation_coordinates'
     """
     knn_regressor = KNeighborsRegressor(metric='haversine', algorithm='ball_tree', weights='distance', leaf_size=2)
-    knn_regressor.fit(training_coordinates, training_values)
+    knn_regressor.fit(haversine_coordinates(training_coordinates), training_values)
+
+    return knn_regressor.predict(haversine_coordinates(interpolate_coordinates))
 
-    return knn_regressor.predict(interpolate_coordinates)
+
+def get_polygon_interpolator(extract_directory, spacing=POLYGON_SAMPLE_SPACING):
+    """
+    :return: interpolator of the mean value within each neighbourhood, see 'PolygonInterpolator'.
+    """
+    neighbourhood_data = get_neighbourhood_data(extract_directory)
+
+    return PolygonInterpolator.from_file(file_path=extract_directory / 'neighbourhoods.csv',
+                                         geometries=np.asarray(neighbourhood_data['geometry'].values),
+                                         spacing=spacing)
 
 
 class BioClim(Base, ABC):
 
-    def __init__(self, time_partition_strategy):
+    def __init__(self, time_partition_strategy, chunk_size=STATION_DATA_CHUNK_SIZE, incremental=INCREMENTAL_BIOCLIM,
+                 rollups=BIOCLIM_ROLLUPS, polygon_interpolation=POLYGON_INTERPOLATION, raster=BIOCLIM_RASTER):
+        """
+        :param time_partition_strategy: strategy of the BioClim variable, see 'BioClimFactory'.
+        :param chunk_size: number of daily rows of the station data read at once, None to read all at once.
+        :param incremental: only recompute the years whose station data changed since the previous run, only these
+        years are handed over to the loader (which replaces the rows of these years only).
+        :param rollups: also save the township and province values, rolled up from the neighbourhood values.
+        :param polygon_interpolation: interpolate the mean value within each neighbourhood instead of the value at its
+        centroid, see 'PolygonInterpolator'.
+        :param raster: also interpolate onto a regular grid, see 'RasterStore'.
+        """
         self.time_partition_strategy = time_partition_strategy
+        self._chunk_size = chunk_size
+        self._incremental = incremental
+        self._rollups = rollups
+        self._polygon_interpolation = polygon_interpolation
+        self._raster = raster
+        self._partial = False
+
+    @property
+    def partial(self):
+        return self._partial
 
     def get_base_bioclim_dataframe(self):
         """
@@ -201,9 +244,7 @@ class BioClim(Base, ABC):
         :return:
         """
         dtypes = np.dtype([
-            ('id', str),
-            ('name', str),
-            ('township', str),
+            ('neighbourhood', str),
             ('year', int),
             ('interpolated_values', float),
         ])
@@ -214,37 +255,146 @@ class BioClim(Base, ABC):
 
     def transform(self, extract_directory, transform_directory):
         # Training data
-        training_data = get_training_dataframe(extract_directory)
+        training_data = get_training_accumulators(extract_directory, chunk_size=self._chunk_size)
+        station_coordinates = get_station_coordinates(extract_directory)
+
+        output_file_path = transform_directory / f'neighbourhood_interpolated_{FINAL_TRANSFORMATION_ID}.csv'
+
+        # Note: the rollups are kept within their own directory, as only the neighbourhood values are loaded
+        rollups_file_paths = {level: transform_directory / ROLLUPS_DIRECTORY_NAME / f'{level}_interpolated.csv'
+                              for level in ROLLUP_LEVELS} if self._rollups and SAVE_TRANSFORMATION_FILES else {}
+
+        # Years to (re)compute, None for all years
+        years = None
+
+        if self._incremental:
+            state = IncrementalState(directory=transform_directory / STATE_DIRECTORY_NAME,
+                                     sources=[extract_directory / 'station_locations.csv',
+                                              extract_directory / 'neighbourhoods.csv',
+                                              extract_directory / 'provinces.csv'],
+                                     version=f'{type(self.time_partition_strategy).__name__}-{OUTPUT_VERSION}'
+                                     + ('-polygon' if self._polygon_interpolation else ''))
+            hashes = station_year_hashes(training_data)
+            years = state.dirty_years(hashes)
+
+            # The output files hold the years which are not recomputed
+            if years is not None and SAVE_TRANSFORMATION_FILES and not output_file_path.is_file():
+                years = None
+
+            # Note: there is only a province rollup when 'provinces.csv' has been extracted
+            required_file_paths = [file_path for level, file_path in rollups_file_paths.items()
+                                   if level != 'province' or (extract_directory / 'provinces.csv').is_file()]
+
+            if years is not None and not all(file_path.is_file() for file_path in required_file_paths):
+                years = None
+
+            if years is not None:
+                training_data = training_data.select_years(years)
+
+        # Only the recomputed years are handed over to the loader
+        self._partial = years is not None
 
         # Coordinates which have to be interpolated
         interpolate_coordinates, neighbourhood_labels, neighbourhood_ids, township_labels = get_interpolation_coordinates(
             extract_directory=extract_directory)
 
+        # Sampling weights of the neighbourhoods, computed once and reused by all years
+        polygon_interpolator = get_polygon_interpolator(extract_directory) if self._polygon_interpolation else None
+
         # Empty dataframe which will hold the interpolated values
         df = self.get_base_bioclim_dataframe()
 
+        # Interpolated values of each year, rolled up to the townships and provinces at once
+        interpolated_years, interpolated_columns = [], []
+        # Training data of each year, of which the rasters are interpolated at once
+        raster_layers = []
+
         # As we only want to interpolate over the spatial dimension, only use data of 1 time unit (year) at a time.
-        for training_coordinates, training_values, year in self.time_partition_strategy.partition(
-                training_data=training_data):
-            interpolated_values = interpolate(
-                training_coordinates=training_coordinates,
-                training_values=training_values,
-                interpolate_coordinates=interpolate_coordinates)
+        time_partitions = self.time_partition_strategy.partition(training_data=training_data,
+                                                                 station_coordinates=station_coordinates)
+
+        # Nothing changed since the previous run
+        if years is not None and not years:
+            time_partitions = []
+
+        for training_coordinates, training_values, year in time_partitions:
+            if polygon_interpolator is not None:
+                interpolated_values = polygon_interpolator.interpolate(training_coordinates=training_coordinates,
+                                                                       training_values=training_values)
+            else:
+                interpolated_values = interpolate(
+                    training_coordinates=training_coordinates,
+                    training_values=training_values,
+                    interpolate_coordinates=interpolate_coordinates)
 
             df_time_partition = pd.DataFrame({
-                'id': neighbourhood_ids,
-                'name': neighbourhood_labels,
-                'township': township_labels,
+                'neighbourhood': neighbourhood_ids,
                 'year': year,
                 'interpolated_values': interpolated_values
             })
 
-            df = df.append(df_time_partition)
+            df = df.append(df_time_partition, ignore_index=True)
+
+            interpolated_years.append(year)
+            interpolated_columns.append(interpolated_values)
+
+            if self._raster:
+                raster_layers.append((pd.Timestamp(year).year, {'training_coordinates': training_coordinates,
+                                                                'training_values': training_values}))
+
+        df['neighbourhood'] = df['neighbourhood'].astype('category')
+
+        if SAVE_TRANSFORMATION_FILES:
+            df_output = df
+
+            if years is not None:
+                # Keep the previous output of the years which are not recomputed
+                df_previous = dictionary_decode(df=pd.read_csv(output_file_path, parse_dates=['year']),
+                                                columns=['neighbourhood'],
+                                                transform_directory=transform_directory)
+                df_output = merge_previous_years(df=df, df_previous=df_previous, years=years)
+
+            # Only store integer codes for the neighbourhoods, their names and townships are held by 'neighbourhoods'
+            save_dataframe_to_csv(
+                path=output_file_path,
+                dataframe=dictionary_encode(df=df_output, columns=['neighbourhood'],
+                                            transform_directory=transform_directory))
 
-        # Save dataframe
-        save_dataframe_to_csv(
-            path=transform_directory / f'neighbourhood_interpolated_{FINAL_TRANSFORMATION_ID}.csv',
-            dataframe=df)
+        if raster_layers:
+            # Cells outside all neighbourhoods (e.g. sea) are missing
+            neighbourhood_geometries = np.asarray(get_neighbourhood_data(extract_directory)['geometry'].values)
+
+            store = RasterStore.create(directory=transform_directory / RASTER_DIRECTORY_NAME,
+                                       grid=RasterGrid(bounds=RASTER_BOUNDS, resolution=RASTER_RESOLUTION),
+                                       tile_size=RASTER_TILE_SIZE,
+                                       geometries=neighbourhood_geometries)
+            store.write(layers=raster_layers, function=interpolate)
+
+        if rollups_file_paths:
+            rollups = Rollups.from_neighbourhoods(neighbourhood_data=get_neighbourhood_data(extract_directory),
+                                                  extract_directory=extract_directory)
+            # (neighbourhoods x years) interpolated values
+            values = np.column_stack(interpolated_columns) if interpolated_columns \
+                else np.empty((len(neighbourhood_ids), 0))
+
+            for level in rollups.levels:
+                codes = rollups.codes(level)
+                df_level = pd.DataFrame({
+                    level: np.tile(codes, len(interpolated_years)),
+                    'year': np.repeat(pd.to_datetime(interpolated_years), len(codes)),
+                    'interpolated_values': rollups.aggregate(level=level, values=values).T.ravel()
+                })
+
+                if years is not None:
+                    df_previous = pd.read_csv(rollups_file_paths[level], parse_dates=['year'], dtype={level: 'str'})
+                    df_level = merge_previous_years(df=df_level, df_previous=df_previous, years=years)
+
+                save_dataframe_to_csv(path=rollups_file_paths[level], dataframe=df_level)
+
+        if self._incremental:
+            state.save(hashes)
+
+        return df
 
 
 class BioClimEnums(Enum):
@@ -318,16 +468,33 @@ class BioClimFactory:
 class BioClimTimePartitionTimeStrategy(ABC):
 
     @abstractmethod
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
+        """
+        :param training_data: daily weather station values, see 'get_training_dataframe'.
+        :param station_coordinates: lookup of the station coordinates, see 'get_station_coordinates'.
+        :return: generator of (training coordinates, training values, year), each yield equals one year.
+        """
         pass
 
     @abstractmethod
     def aggregate(self, training_data):
         pass
 
+    @staticmethod
+    def get_accumulators(training_data):
+        """
+        All variables are derived from per station, per month accumulators, daily values are folded into these first.
+
+        :param training_data: either daily values (see 'get_training_dataframe') or monthly accumulators.
+        """
+        if isinstance(training_data, MonthlyAccumulators):
+            return training_data
+
+        return MonthlyAccumulators.from_daily(training_data)
+
     def filter_nan_indexes_training_data(self, training_values, training_coordinates):
-        # Remove NaN values
-        non_nan_indexes = np.where(~np.isnan(training_values))[0]
+        # Remove NaN values, and stations without a known location
+        non_nan_indexes = np.where(~np.isnan(training_values) & ~np.isnan(training_coordinates).any(axis=1))[0]
         training_coordinates = training_coordinates[non_nan_indexes]
         training_values = training_values[non_nan_indexes]
 
@@ -349,9 +516,9 @@ class BioClim1TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'BioClim 1' specification.
         """
-        return training_data.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).mean()
+        return self.get_accumulators(training_data).resample(freq='Y', means=['temperature_avg'])
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -363,7 +530,7 @@ class BioClim1TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_avg'].values
 
             # Filter out NaN values
@@ -393,11 +560,8 @@ class BioClim2TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         """
 
         # Per month calculate minimal temperature and maximal temperature
-        df_monthly_min_max = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']) \
-            .agg(temperature_min=('temperature_min', 'mean'),
-                 temperature_max=('temperature_max', 'mean'),
-                 longitude=('longitude', 'mean'),
-                 latitude=('latitude', 'mean'))
+        df_monthly_min_max = self.get_accumulators(training_data).resample(freq='M', means=['temperature_min',
+                                                                                            'temperature_max'])
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_monthly_min_max = df_monthly_min_max.reset_index()
@@ -410,7 +574,7 @@ class BioClim2TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_year_temp_mean
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -422,7 +586,7 @@ class BioClim2TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_range'].values
 
             # Filter out NaN values
@@ -449,6 +613,8 @@ class BioClim3TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_3' specification.
         """
+        training_data = self.get_accumulators(training_data)
+
         df_year_month_range = BioClim2TimePartitionStrategy().aggregate(training_data)
         df_year_min_max_range = BioClim7TimePartitionStrategy().aggregate(training_data)
 
@@ -464,7 +630,7 @@ class BioClim3TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_year_iso
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -476,7 +642,7 @@ class BioClim3TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['isothermality'].values
 
             # Filter out NaN values
@@ -507,7 +673,7 @@ class BioClim4TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :return: aggregated dataframe, by the 'bioclim_4' specification.
         """
         # Calculate average values per month
-        df_monthly_mean = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']).mean()
+        df_monthly_mean = self.get_accumulators(training_data).resample(freq='M', means=['temperature_avg'])
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_monthly_mean = df_monthly_mean.reset_index()
@@ -517,7 +683,7 @@ class BioClim4TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_year_std
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -529,7 +695,7 @@ class BioClim4TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_avg'].values
 
             # Filter out NaN values
@@ -558,7 +724,7 @@ class BioClim5TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :return: aggregated dataframe, by the 'bioclim_5' specification.
         """
         # Calculate average values per month
-        df_monthly_mean = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']).mean()
+        df_monthly_mean = self.get_accumulators(training_data).resample(freq='M', means=['temperature_max'])
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_monthly_mean = df_monthly_mean.reset_index()
@@ -568,7 +734,7 @@ class BioClim5TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_year_max
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -580,7 +746,7 @@ class BioClim5TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_max'].values
 
             # Filter out NaN values
@@ -609,7 +775,7 @@ class BioClim6TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :return: aggregated dataframe, by the 'bioclim_6' specification.
         """
         # Calculate average values per month
-        df_monthly_mean = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']).mean()
+        df_monthly_mean = self.get_accumulators(training_data).resample(freq='M', means=['temperature_min'])
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_monthly_mean = df_monthly_mean.reset_index()
@@ -619,7 +785,7 @@ class BioClim6TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_year_min
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -631,7 +797,7 @@ class BioClim6TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_min'].values
 
             # Filter out NaN values
@@ -657,19 +823,20 @@ class BioClim7TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_7' specification.
         """
+        training_data = self.get_accumulators(training_data)
+
         df_year_max = BioClim5TimePartitionStrategy().aggregate(training_data)
         df_year_min = BioClim6TimePartitionStrategy().aggregate(training_data)
 
         # Inner join both dataframes based on indexes (date, station_id)
-        df_year_diff = df_year_max.merge(df_year_min, how='left', left_index=True, right_index=True,
-                                         suffixes=('_BIO_5', '_BIO_6'))
+        df_year_diff = df_year_max.merge(df_year_min, how='left', left_index=True, right_index=True)
 
         # Calculate temperature difference
-        df_year_diff['temperature_range'] = df_year_diff['temperature_max_BIO_5'] - df_year_diff['temperature_min_BIO_6']
+        df_year_diff['temperature_range'] = df_year_diff['temperature_max'] - df_year_diff['temperature_min']
 
         return df_year_diff
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -681,7 +848,7 @@ class BioClim7TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude_BIO_5', 'latitude_BIO_5']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_range'].values
 
             # Filter out NaN values
@@ -701,7 +868,7 @@ class BioClim8TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         temperatures that prevail during the wettest season.
 
         Aggregate data according to 'BioClim 8' specifications:
-            - Get quarterly sum values.
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter which has the highest sum of precipitation.
                 - Divide the sum of average temperature by 3.
 
@@ -710,29 +877,10 @@ class BioClim8TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_8' specification.
         """
-        # Calculate quarterly sums
-        df_quarter = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).agg(
-            temperature_avg=('temperature_avg', 'mean'),
-            rain_sum=('rain_sum', 'sum'),
-            latitude=('latitude', 'mean'),
-            longitude=('longitude', 'mean')
-        )
-
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter = df_quarter.reset_index()
-
-        # Get indexes of most wettest quarters (sum)
-        df_quarter_max_rain_index = df_quarter.groupby([pd.Grouper(key='date', freq='Y'), 'station_id'])['rain_sum'].idxmax()
-
-        # Use above indexes to get the related mean temperature
-        df_year_avg_temp = df_quarter.loc[df_quarter_max_rain_index]
-
-        # Set dataframe index to (date,station_id) such that we can iterate again over 'year' in the 'partition' function.
-        df_year_avg_temp = df_year_avg_temp.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).mean()
+        # Mean temperature of the wettest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_8'])
 
-        return df_year_avg_temp
-
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -744,7 +892,7 @@ class BioClim8TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_avg'].values
 
             # Filter out NaN values
@@ -764,7 +912,7 @@ class BioClim9TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         temperatures that prevail during the driest season.
 
         Aggregate data according to 'BioClim 9' specifications:
-            - Get quarterly sum values.
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter which has the lowest sum of precipitation.
                 - Divide the sum of average temperature by 3.
 
@@ -773,29 +921,10 @@ class BioClim9TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_9' specification.
         """
-        # Calculate quarterly sums
-        df_quarter = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).agg(
-            temperature_avg=('temperature_avg', 'mean'),
-            rain_sum=('rain_sum', 'sum'),
-            latitude=('latitude', 'mean'),
-            longitude=('longitude', 'mean')
-        )
-
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter = df_quarter.reset_index()
-
-        # Get indexes of most wettest quarters (sum)
-        df_quarter_min_rain_index = df_quarter.groupby([pd.Grouper(key='date', freq='Y'), 'station_id'])['rain_sum'].idxmin()
-
-        # Use above indexes to get the related mean temperature
-        df_year_avg_temp = df_quarter.loc[df_quarter_min_rain_index]
-
-        # Set dataframe index to (date,station_id) such that we can iterate again over 'year' in the 'partition' function.
-        df_year_avg_temp = df_year_avg_temp.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).mean()
-
-        return df_year_avg_temp
+        # Mean temperature of the driest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_9'])
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -807,7 +936,7 @@ class BioClim9TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_avg'].values
 
             # Filter out NaN values
@@ -827,7 +956,7 @@ class BioClim10TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         temperatures that prevail during the warmest season.
 
         Aggregate data according to 'BioClim 10' specifications:
-            - Get quarterly mean values.
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter which has the highest temperature.
 
         More details can be found in the link provided in the 'README.MD' file.
@@ -835,18 +964,10 @@ class BioClim10TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_10' specification.
         """
-        # Calculate quarterly means
-        df_quarter = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).mean()
+        # Mean temperature of the warmest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_10'])
 
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter = df_quarter.reset_index()
-
-        # Use above indexes to get the related mean temperature
-        df_year_max_avg_temp = df_quarter.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).max()
-
-        return df_year_max_avg_temp
-
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -858,7 +979,7 @@ class BioClim10TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_avg'].values
 
             # Filter out NaN values
@@ -878,7 +999,7 @@ class BioClim11TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         temperatures that prevail during the coldest season.
 
         Aggregate data according to 'BioClim 11' specifications:
-            - Get quarterly mean values.
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter which has the lowest temperature.
 
         More details can be found in the link provided in the 'README.MD' file.
@@ -886,18 +1007,10 @@ class BioClim11TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_11' specification.
         """
-        # Calculate quarterly means
-        df_quarter = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).mean()
-
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter = df_quarter.reset_index()
-
-        # Use above indexes to get the related mean temperature
-        df_year_min_avg_temp = df_quarter.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).min()
-
-        return df_year_min_avg_temp
+        # Mean temperature of the coldest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_11'])
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -909,7 +1022,7 @@ class BioClim11TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['temperature_avg'].values
 
             # Filter out NaN values
@@ -935,9 +1048,9 @@ class BioClim12TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_12' specification.
         """
-        return training_data.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).sum()
+        return self.get_accumulators(training_data).resample(freq='Y', sums=['rain_sum'])
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -949,7 +1062,7 @@ class BioClim12TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
@@ -977,7 +1090,7 @@ class BioClim13TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :return: aggregated dataframe, by the 'bioclim_13' specification.
         """
         # Calculate sum values per month
-        df_month_sum = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']).sum()
+        df_month_sum = self.get_accumulators(training_data).resample(freq='M', sums=['rain_sum'])
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_month_sum = df_month_sum.reset_index()
@@ -987,7 +1100,7 @@ class BioClim13TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_max_month_sum
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -999,7 +1112,7 @@ class BioClim13TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
@@ -1027,7 +1140,7 @@ class BioClim14TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :return: aggregated dataframe, by the 'bioclim_14' specification.
         """
         # Calculate sum values per month
-        df_month_sum = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']).sum()
+        df_month_sum = self.get_accumulators(training_data).resample(freq='M', sums=['rain_sum'])
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_month_sum = df_month_sum.reset_index()
@@ -1037,7 +1150,7 @@ class BioClim14TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
 
         return df_min_month_sum
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -1049,7 +1162,7 @@ class BioClim14TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
@@ -1082,11 +1195,11 @@ class BioClim15TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         """
 
         # Calculate monthly sum and mean for 'rain_sum'
-        df_month_sum_avg = training_data.groupby([pd.Grouper(key='date', freq='M'), 'station_id']) \
-            .agg(rain_sum_total=('rain_sum', 'sum'),
-                 rain_sum_mean=('rain_sum', 'mean'),
-                 longitude=('longitude', 'mean'),
-                 latitude=('latitude', 'mean'))
+        accumulators = self.get_accumulators(training_data)
+        df_month_sum_avg = pd.DataFrame({
+            'rain_sum_total': accumulators.resample(freq='M', sums=['rain_sum'])['rain_sum'],
+            'rain_sum_mean': accumulators.resample(freq='M', means=['rain_sum'])['rain_sum']
+        })
 
         # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
         df_month_sum_avg = df_month_sum_avg.reset_index()
@@ -1094,16 +1207,14 @@ class BioClim15TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         # Calculate standard deviation and mean for 'rain_sum' over 12 months
         df_year_std_mean = df_month_sum_avg.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']) \
             .agg(rain_sum_std=('rain_sum_total', 'std'),
-                 rain_sum_mean=('rain_sum_mean', 'mean'),
-                 longitude=('longitude', 'mean'),
-                 latitude=('latitude', 'mean'))
+                 rain_sum_mean=('rain_sum_mean', 'mean'))
 
         # Calculate BIOCLIM 15
         df_year_std_mean['BIOCLIM_15'] = df_year_std_mean['rain_sum_std'].div(1 + df_year_std_mean['rain_sum_mean']) * 100
 
         return df_year_std_mean
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -1115,7 +1226,7 @@ class BioClim15TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['BIOCLIM_15'].values
 
             # Filter out NaN values
@@ -1134,6 +1245,7 @@ class BioClim16TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         Definition:   This index identifies the total precipitation that prevails during the wettest quarter.
 
         Aggregate data according to 'BioClim 16' specifications:
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter with the highest rain_sum
 
         More details can be found in the link provided in the 'README.MD' file.
@@ -1141,18 +1253,10 @@ class BioClim16TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_16' specification.
         """
-        # Calculate sum values per quarter
-        df_quarter_sum = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).sum()
+        # Precipitation of the wettest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_16'])
 
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter_sum = df_quarter_sum.reset_index()
-
-        # Calculate quarter with highest rain sum
-        df_year = df_quarter_sum.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).max()
-
-        return df_year
-
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -1164,7 +1268,7 @@ class BioClim16TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
@@ -1183,6 +1287,7 @@ class BioClim17TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         Definition:   This index identifies the total precipitation that prevails during the driest quarter.
 
         Aggregate data according to 'BioClim 17' specifications:
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter with the highest rain_sum
 
         More details can be found in the link provided in the 'README.MD' file.
@@ -1190,18 +1295,10 @@ class BioClim17TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_17' specification.
         """
-        # Calculate sum values per quarter
-        df_quarter_sum = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).sum()
-
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter_sum = df_quarter_sum.reset_index()
-
-        # Calculate quarter with lowest rain sum
-        df_year = df_quarter_sum.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).min()
+        # Precipitation of the driest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_17'])
 
-        return df_year
-
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -1213,7 +1310,7 @@ class BioClim17TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
@@ -1233,7 +1330,7 @@ class BioClim18TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         precipitation that prevail during the warmest season.
 
         Aggregate data according to 'BioClim 18' specifications:
-            - Get quarterly sum values.
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter which has the highest temperature.
 
         More details can be found in the link provided in the 'README.MD' file.
@@ -1241,32 +1338,10 @@ class BioClim18TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_18' specification.
         """
-        # Calculate quarterly means
-        df_quarter = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).agg(
-            temperature_avg=('temperature_avg', 'mean'),
-            rain_sum=('rain_sum', 'sum'),
-            latitude=('latitude', 'mean'),
-            longitude=('longitude', 'mean')
-        )
-
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter = df_quarter.reset_index()
-
-        # Get indexes of hottest quarters (mean)
-        df_quarter_max_temp_index = df_quarter.groupby([pd.Grouper(key='date', freq='Y'), 'station_id'])['temperature_avg'].idxmax()
-
-        # Filter out NaN indexes (no temperature recorded)
-        df_quarter_max_temp_index = df_quarter_max_temp_index.dropna()
-
-        # Use above indexes to get the related sum precipitation
-        df_year_avg_temp = df_quarter.loc[df_quarter_max_temp_index]
-
-        # Set dataframe index to (date,station_id) such that we can iterate again over 'year' in the 'partition' function.
-        df_year_avg_temp = df_year_avg_temp.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).mean()
-
-        return df_year_avg_temp
+        # Precipitation of the warmest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_18'])
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -1278,7 +1353,7 @@ class BioClim18TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
@@ -1298,7 +1373,7 @@ class BioClim19TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         precipitation that prevail during the coldest season.
 
         Aggregate data according to 'BioClim 19' specifications:
-            - Get quarterly sum values.
+            - Get rolling quarterly values (any 3 consecutive months).
             - Select quarter which has the lowest temperature.
 
         More details can be found in the link provided in the 'README.MD' file.
@@ -1306,32 +1381,10 @@ class BioClim19TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
         :param training_data: data which needs to be aggregated,
         :return: aggregated dataframe, by the 'bioclim_19' specification.
         """
-        # Calculate quarterly means
-        df_quarter = training_data.groupby([pd.Grouper(key='date', freq='Q'), 'station_id']).agg(
-            temperature_avg=('temperature_avg', 'mean'),
-            rain_sum=('rain_sum', 'sum'),
-            latitude=('latitude', 'mean'),
-            longitude=('longitude', 'mean')
-        )
-
-        # Use 'reset_index' function such that we again can group by indexes 'date' and 'station_id'
-        df_quarter = df_quarter.reset_index()
-
-        # Get indexes of hottest quarters (mean)
-        df_quarter_min_temp_index = df_quarter.groupby([pd.Grouper(key='date', freq='Y'), 'station_id'])['temperature_avg'].idxmin()
-
-        # Filter out NaN indexes (no temperature recorded)
-        df_quarter_min_temp_index = df_quarter_min_temp_index.dropna()
-
-        # Use above indexes to get the related sum precipitation
-        df_year_avg_temp = df_quarter.loc[df_quarter_min_temp_index]
-
-        # Set dataframe index to (date,station_id) such that we can iterate again over 'year' in the 'partition' function.
-        df_year_avg_temp = df_year_avg_temp.groupby([pd.Grouper(key='date', freq='Y'), 'station_id']).mean()
-
-        return df_year_avg_temp
+        # Precipitation of the coldest quarter, out of the 12 rolling quarters of each station-year
+        return get_rolling_quarters(self.get_accumulators(training_data)).select(*QUARTER_VARIABLES['BIOCLIM_19'])
 
-    def partition(self, training_data):
+    def partition(self, training_data, station_coordinates):
         """
             :return: generator with mean temperature for all known points, each yield equals one year.
         """
@@ -1343,7 +1396,7 @@ class BioClim19TimePartitionStrategy(BioClimTimePartitionTimeStrategy):
             df_year = aggregated_training_data.loc[(year,)]
 
             # Only select relevant data
-            training_coordinates = df_year[['longitude', 'latitude']].values
+            training_coordinates = station_coordinates[df_year.index.values]
             training_values = df_year['rain_sum'].values
 
             # Filter out NaN values
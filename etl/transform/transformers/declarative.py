@@ -0,0 +1,44 @@
+from etl.transform.transformers.base import Chunked
+from etl.transform.reprojection import reproject_coordinates
+from etl.transform.geometry import encode_points
+from etl.transform.regions import tag_regions
+from config import TAG_REGIONS
+
+
+class Declarative(Chunked):
+    """
+    Transformer which is fully described by its schema (see 'etl.transform.schema.Schema'), subclasses only
+    declare the schema of their source instead of implementing the transformation.
+    """
+    schema = None
+
+    @property
+    def output_file_name(self):
+        return self.schema.output_file_name
+
+    @property
+    def dictionary_columns(self):
+        return self.schema.dictionary_columns
+
+    @property
+    def output_columns(self):
+        return self.schema.output_columns or []
+
+    def read_chunks(self, extract_directory):
+        return self.schema.read_csv(file_path=extract_directory / self.schema.file_name, chunk_size=self._chunk_size)
+
+    def transform_chunk(self, df, extract_directory):
+        df = self.schema.apply(df)
+
+        if self.schema.coordinates:
+            x, y = self.schema.coordinates
+
+            # Convert the coordinates to EPSG 4326 (WSG 84)
+            longitudes, latitudes = reproject_coordinates(x=df[x], y=df[y], source_crs=self.schema.crs)
+            df['geometry'] = encode_points(x=longitudes, y=latitudes)  # hex EWKB by default, see 'GEOMETRY_FORMAT'
+
+            # Tag each point with the code of its neighbourhood and province
+            if TAG_REGIONS:
+                df = tag_regions(df=df, x=longitudes, y=latitudes, extract_directory=extract_directory)
+
+        return self.schema.select(df)
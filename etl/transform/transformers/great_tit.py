@@ -0,0 +1,50 @@
+import csv
+import shapely
+import pandas as pd
+from etl.transform.transformers.base import Base
+from etl.transform.dictionary import dictionary_encode
+from pathlib import Path
+from etl.transform.geometry import encode_points
+from etl.transform.regions import tag_regions, REGION_COLUMNS
+from config import FINAL_TRANSFORMATION_ID, SAVE_TRANSFORMATION_FILES, TAG_REGIONS
+
+
+class GreatTit(Base):
+
+    def transform(self, extract_directory, transform_directory):
+        dtypes = {
+            "date": "str",
+            "count": "int32",
+            "geometry": "str",
+        }
+
+        file_path = extract_directory / 'great_tit.csv'
+
+        df = pd.read_csv(
+            file_path,
+            usecols=list(dtypes),
+            dtype=dtypes,
+            header=0,
+            quoting=csv.QUOTE_NONE,
+            skipinitialspace=True
+        )
+
+        # Parse all points (WKT, EPSG 4326) at once
+        points = shapely.from_wkt(df['geometry'].values)
+        longitudes, latitudes = shapely.get_x(points), shapely.get_y(points)
+        df['geometry'] = encode_points(x=longitudes, y=latitudes)  # hex EWKB by default, see 'GEOMETRY_FORMAT'
+
+        # Tag each point with the code of its neighbourhood and province
+        if TAG_REGIONS:
+            df = tag_regions(df=df, x=longitudes, y=latitudes, extract_directory=extract_directory)
+
+        if SAVE_TRANSFORMATION_FILES:
+            # Save as csv
+            if not Path(transform_directory).is_dir():
+                Path.mkdir(transform_directory, parents=True, exist_ok=True)
+
+            # Replace region codes by integer codes
+            dictionary_encode(df=df, columns=REGION_COLUMNS, transform_directory=transform_directory) \
+                .to_csv(transform_directory / f'great_tit_{FINAL_TRANSFORMATION_ID}.csv', index=False, na_rep='')
+
+        return df
@@ -1,139 +1,81 @@
-import pandas as pd
-from etl.transform.transformers.base import Base
-from pathlib import Path
-from pyproj import Transformer
-from shapely.geometry import Point
+from etl.transform.transformers.declarative import Declarative
+from etl.transform.schema import Schema
+from etl.transform.regions import REGION_COLUMNS
 from config import FINAL_TRANSFORMATION_ID
 
 
-class Vlinderstichting(Base):
-
-    def transform(self, extract_directory, transform_directory):
-        column_mapping = {
+class Vlinderstichting(Declarative):
+    schema = Schema(
+        file_name='vlinderstichting_2017-2019.csv',
+        columns={
             "dag": "day",
             "maand": "month",
             "jaar": "year",
             "stadium": "stage",
             "x": "longitude",
             "y": "latitude"
-        }
-
-        dtypes = {
-            "day": "uint8",
-            "month": "uint8",
-            "year": "uint16",
-            "stage": "category",
-            "longitude": "float32",
-            "latitude": "float32"
-        }
-
-        file_path = extract_directory / 'vlinderstichting_2017-2019.csv'
-        df = pd.read_csv(
-            file_path,
-            usecols=list(column_mapping),
-            dtype=dtypes,
-            header=0,
-            sep=','
-        )
-
-        # Rename column names
-        df = df.rename(columns=column_mapping)
-
+        },
+        dtypes={
+            "dag": "uint8",
+            "maand": "uint8",
+            "jaar": "uint16",
+            "stadium": "category",
+            "x": "float32",
+            "y": "float32"
+        },
+        read_options={'sep': ','},
         # Set date column
-        df['date'] = pd.to_datetime(df[['year', 'month', 'day']])
-
+        dates={'date': ['year', 'month', 'day']},
         # Convert  EPSG 28992 ("rijksdriehoekcoordinaten") to EPSG 4326 (WSG 84)
-        transformer = Transformer.from_crs(28992, 4326, always_xy=True)
-        df['geometry'] = df.apply(lambda row: Point(transformer.transform(row['longitude'], row['latitude'])),
-                                  axis=1)  # in wkt format by default
-
-        # Filter and save as csv
-        if not Path(transform_directory).is_dir():
-            Path.mkdir(transform_directory, parents=True, exist_ok=True)
-
-        df[['date', 'stage', 'geometry']].to_csv(
-            transform_directory / f'Vlinderstichting_{FINAL_TRANSFORMATION_ID}.csv', index=False)
-
-
-class Amsterdam(Base):
-
-    def transform(self, extract_directory, transform_directory):
-        column_mapping = {
+        coordinates=('longitude', 'latitude'),
+        output_columns=['date', 'stage', 'geometry'] + REGION_COLUMNS,
+        output_file_name=f'Vlinderstichting_{FINAL_TRANSFORMATION_ID}.csv',
+        # Replace stages and region codes by integer codes
+        dictionary_columns=['stage'] + REGION_COLUMNS
+    )
+
+
+class Amsterdam(Declarative):
+    schema = Schema(
+        file_name='bomenbestand_geinfecteerd.csv',
+        columns={
             'rdx': 'longitude',
             'rdy': 'latitude',
             'mutatiedatum': 'date',
-        }
-
-        dtypes = {
+        },
+        dtypes={
             "rdx": "float32",
             "rdy": "float32",
             "mutatiedatum": "str",
-        }
-
-        file_path = extract_directory / 'bomenbestand_geinfecteerd.csv'
-
-        df = pd.read_csv(
-            file_path,
-            usecols=list(column_mapping),
-            dtype=dtypes,
-            header=0
-        )
-
-        # Rename column names
-        df = df.rename(columns=column_mapping)
-
+        },
         # Set datetimeindex
-        df['date'] = pd.to_datetime(df['date'])
-
+        dates={'date': None},
         # Convert  EPSG 28992 ("rijksdriehoekcoordinaten") to EPSG 4326 (WSG 84)
-        transformer = Transformer.from_crs(28992, 4326, always_xy=True)
-        df['geometry'] = df.apply(lambda row: Point(transformer.transform(row['longitude'], row['latitude'])),
-                                  axis=1)  # in wkt format by default
-
-        # Save as csv
-        if not Path(transform_directory).is_dir():
-            Path.mkdir(transform_directory, parents=True, exist_ok=True)
+        coordinates=('longitude', 'latitude'),
+        output_file_name=f'OPM_Amsterdam_{FINAL_TRANSFORMATION_ID}.csv',
+        # Replace region codes by integer codes
+        dictionary_columns=REGION_COLUMNS
+    )
 
-        df.to_csv(transform_directory / f'OPM_Amsterdam_{FINAL_TRANSFORMATION_ID}.csv', index=False, na_rep='')
 
-
-class Gelderland(Base):
-
-    def transform(self, extract_directory, transform_directory):
-        column_mapping = {
+class Gelderland(Declarative):
+    schema = Schema(
+        file_name='bomenbestand_geinfecteerd.csv',
+        columns={
             'longitude': 'longitude',
             'latitude': 'latitude',
             'date': 'date',
-        }
-
-        dtypes = {
+        },
+        dtypes={
             "longitude": "float32",
             "latitude": "float32",
             "date": "str",
-        }
-
-        file_path = extract_directory / 'bomenbestand_geinfecteerd.csv'
-
-        df = pd.read_csv(
-            file_path,
-            usecols=list(column_mapping),
-            dtype=dtypes,
-            header=0
-        )
-
-        # Rename column names
-        df = df.rename(columns=column_mapping)
-
+        },
         # Set datetimeindex
-        df['date'] = pd.to_datetime(df['date'])
-
+        dates={'date': None},
         # Convert  EPSG 28992 ("rijksdriehoekcoordinaten") to EPSG 4326 (WSG 84)
-        transformer = Transformer.from_crs(28992, 4326, always_xy=True)
-        df['geometry'] = df.apply(lambda row: Point(transformer.transform(row['longitude'], row['latitude'])),
-                                  axis=1)  # in wkt format by default
-
-        # Save as csv
-        if not Path(transform_directory).is_dir():
-            Path.mkdir(transform_directory, parents=True, exist_ok=True)
-
-        df.to_csv(transform_directory / f'OPM_Gelderland_{FINAL_TRANSFORMATION_ID}.csv', index=False, na_rep='')
\ No newline at end of file
+        coordinates=('longitude', 'latitude'),
+        output_file_name=f'OPM_Gelderland_{FINAL_TRANSFORMATION_ID}.csv',
+        # Replace region codes by integer codes
+        dictionary_columns=REGION_COLUMNS
+    )
@@ -1,15 +1,65 @@
 import pandas as pd
 import csv
+import shapely
 import geopandas as gpd
-import shapely.wkt
-from etl.transform.transformers.base import Base
-from pathlib import Path
-from config import FINAL_TRANSFORMATION_ID
+from functools import partial
+from etl.transform.transformers.base import Base, Chunked
+from etl.transform.dictionary import dictionary_encode
+from etl.transform.geometry import encode_geometries, read_wkt_csv
+from etl.transform.parallel import ordered_parallel_map
+from etl.transform.reprojection import RD_NEW, WGS84
+from config import (
+    FINAL_TRANSFORMATION_ID,
+    SAVE_TRANSFORMATION_FILES,
+    TRANSFORM_WORKERS,
+    SOIL_STREAMING,
+    SOIL_CHUNK_SIZE,
+    SOIL_SIMPLIFY_TOLERANCE
+)
 
 
-class WURAlterra(Base):
+def transform_chunk(df, simplify_tolerance=None):
+    """
+    Transforms one chunk of the soil map, runs within a worker process.
 
-    def transform(self, extract_directory, transform_directory):
+    :param df: chunk holding the columns 'geometry' (WKT in EPSG 28992), 'soil_type' and 'date'.
+    :param simplify_tolerance: tolerance in meters of the topology preserving simplification, None to disable.
+    :return: chunk holding the encoded geometries in EPSG 4326.
+    """
+    # Parse all polygons of the chunk at once
+    geometries = gpd.GeoSeries.from_wkt(df['geometry'].values, crs=f'EPSG:{RD_NEW}')
+
+    # Simplify in meters, before converting to degrees
+    if simplify_tolerance:
+        geometries = geometries.simplify(tolerance=simplify_tolerance, preserve_topology=True)
+
+    # Convert  EPSG 28992 ("rijksdriehoekcoordinaten") to EPSG 4326 (WSG 84)
+    geometries = geometries.to_crs(f'EPSG:{WGS84}')
+
+    # Encode geometries, hex EWKB by default (see 'GEOMETRY_FORMAT')
+    df = df.drop(columns='geometry')
+    df['geometry'] = encode_geometries(geometries.values)
+
+    return df
+
+
+class WURAlterra(Chunked):
+    output_file_name = f'bodemkaart_{FINAL_TRANSFORMATION_ID}.csv'
+    output_columns = ['soil_type', 'date', 'geometry']
+    quoting = csv.QUOTE_ALL
+
+    def __init__(self, chunk_size=SOIL_CHUNK_SIZE, simplify_tolerance=SOIL_SIMPLIFY_TOLERANCE, workers=TRANSFORM_WORKERS,
+                 streaming=SOIL_STREAMING):
+        """
+        :param chunk_size: number of polygons transformed at once by a worker.
+        :param simplify_tolerance: tolerance in meters of the topology preserving simplification, None to disable.
+        :param workers: number of worker processes.
+        :param streaming: don't hold the final transformation in memory, only write it to file.
+        """
+        super().__init__(chunk_size=chunk_size, workers=workers, streaming=streaming)
+        self._simplify_tolerance = simplify_tolerance
+
+    def read_chunks(self, extract_directory):
         column_mapping = {
             'geometry': 'geometry',
             'OMSCHRIJVI': 'soil_type',
@@ -24,24 +74,99 @@ class WURAlterra(Base):
 
         file_path = extract_directory / 'bodemkaart.csv'
 
-        df = pd.read_csv(
+        return (chunk.rename(columns=column_mapping) for chunk in pd.read_csv(
             file_path,
             usecols=list(column_mapping),
             dtype=dtypes,
-            header=0
-        )
+            header=0,
+            chunksize=self._chunk_size
+        ))
+
+    def transform_chunk(self, df, extract_directory):
+        # Reproject (and simplify) the polygons of the chunk
+        return transform_chunk(df=df, simplify_tolerance=self._simplify_tolerance)
+
+
+def overlay_chunk(df, neighbourhood_codes, neighbourhood_geometries):
+    """
+    Intersects one chunk of the soil map with the neighbourhoods, runs within a worker process.
+
+    :param df: chunk holding the columns 'geometry' (WKT in EPSG 28992) and 'soil_type'.
+    :param neighbourhood_codes: code of each neighbourhood.
+    :param neighbourhood_geometries: polygon of each neighbourhood in EPSG 28992.
+    :return: dataframe holding the area in m2 of each soil type within each neighbourhood.
+    """
+    soil_geometries = shapely.from_wkt(df['geometry'].values)
+
+    # Candidate pairs of (soil polygon, neighbourhood) whose polygons intersect
+    soil_indexes, neighbourhood_indexes = shapely.STRtree(neighbourhood_geometries) \
+        .query(soil_geometries, predicate='intersects')
+
+    soil_geometries = soil_geometries[soil_indexes]
+    neighbourhood_geometries = neighbourhood_geometries[neighbourhood_indexes]
+
+    # Soil polygons which lie within a neighbourhood don't need to be intersected
+    areas = shapely.area(soil_geometries)
+    within = shapely.contains_properly(neighbourhood_geometries, soil_geometries)
+    areas[~within] = shapely.area(shapely.intersection(soil_geometries[~within], neighbourhood_geometries[~within]))
+
+    return pd.DataFrame({
+        'neighbourhood': neighbourhood_codes[neighbourhood_indexes],
+        'soil_type': df['soil_type'].values[soil_indexes],
+        'area': areas
+    }).groupby(['neighbourhood', 'soil_type'], as_index=False, sort=False)['area'].sum()
+
+
+class NeighbourhoodSoil(Base):
+    """
+    Soil composition of each neighbourhood, i.e. the area (and share of the neighbourhood's area)
+    covered by each soil type of the WUR Alterra soil map.
+    """
+
+    def __init__(self, chunk_size=SOIL_CHUNK_SIZE, workers=TRANSFORM_WORKERS):
+        """
+        :param chunk_size: number of soil polygons intersected at once by a worker.
+        :param workers: number of worker processes.
+        """
+        self._chunk_size = chunk_size
+        self._workers = workers
+
+    def transform(self, extract_directory, transform_directory):
+        neighbourhoods = read_wkt_csv(file_path=extract_directory / 'neighbourhoods.csv',
+                                      usecols=['id', 'geometry'],
+                                      dtypes={'id': 'str', 'geometry': 'str'})
+
+        # Convert EPSG 4326 (WSG 84) to EPSG 28992 ("rijksdriehoekcoordinaten"), such that areas are in m2
+        neighbourhood_geometries = gpd.GeoSeries(neighbourhoods['geometry'].values, crs=f'EPSG:{WGS84}') \
+            .to_crs(f'EPSG:{RD_NEW}').to_numpy()
+        neighbourhood_codes = neighbourhoods['id'].values
+
+        chunks = (chunk.rename(columns={'OMSCHRIJVI': 'soil_type'}) for chunk in pd.read_csv(
+            extract_directory / 'bodemkaart.csv',
+            usecols=['geometry', 'OMSCHRIJVI'],
+            dtype={'geometry': 'str', 'OMSCHRIJVI': 'str'},
+            header=0,
+            chunksize=self._chunk_size
+        ))
+
+        # Intersect chunks on a process pool, a soil type may be spread over several chunks
+        df = pd.concat(ordered_parallel_map(partial(overlay_chunk,
+                                                    neighbourhood_codes=neighbourhood_codes,
+                                                    neighbourhood_geometries=neighbourhood_geometries),
+                                            chunks,
+                                            workers=self._workers), ignore_index=True) \
+            .groupby(['neighbourhood', 'soil_type'], as_index=False, observed=True)['area'].sum()
 
-        # Rename column names
-        df = df.rename(columns=column_mapping)
+        # Share of the neighbourhood's area covered by the soil type
+        neighbourhood_areas = pd.Series(shapely.area(neighbourhood_geometries), index=neighbourhood_codes)
+        df['share'] = df['area'].values / neighbourhood_areas.loc[df['neighbourhood']].values
 
-        # Convert  EPSG 28992 ("rijksdriehoekcoordinaten") to EPSG 4326 (WSG 84)
-        gdf = gpd.GeoDataFrame(df, crs={'init': 'epsg:28992'})
-        gdf['geometry'] = gdf['geometry'].apply(shapely.wkt.loads)
-        gdf = gdf.to_crs({'init': 'epsg:4326'})
+        df['neighbourhood'] = df['neighbourhood'].astype('category')
+        df['soil_type'] = df['soil_type'].astype('category')
 
-        # Save as csv
-        if not Path(transform_directory).is_dir():
-            Path.mkdir(transform_directory, parents=True, exist_ok=True)
+        if SAVE_TRANSFORMATION_FILES:
+            # Replace neighbourhoods and soil types by integer codes
+            dictionary_encode(df=df, columns=['neighbourhood', 'soil_type'], transform_directory=transform_directory) \
+                .to_csv(transform_directory / f'neighbourhood_soil_{FINAL_TRANSFORMATION_ID}.csv', index=False)
 
-        gdf.to_csv(transform_directory / f'bodemkaart_{FINAL_TRANSFORMATION_ID}.csv', index=False, na_rep='',
-                   quoting=csv.QUOTE_ALL)
+        return df
@@ -1,38 +1,77 @@
+import argparse
 import config
 from etl.load.models import *  # required for creating models in database
 from etl.extract.gcp import download_uris
 from etl.transform.transformer import transform
 from etl.load.loader import load
+from etl.load.indexes import IndexDeferral
 from etl.jobs import ETL_JOBS
+from etl.instrumentation import RunReport
+from etl.profiling import parse_profile_options
 
 
-def extract_all_data():
+def extract_all_data(report, profiles=None):
+    """
+    :param report: report of the run, see 'RunReport'.
+    :param profiles: dictionary of the job name onto its profiling modes, see 'parse_profile_options'.
+    """
     print("Start extracting all data...")
+    profiles = profiles or {}
 
     for etl_job in ETL_JOBS:
-        download_uris(gs_uris=etl_job.gs_uris,
-                      destination_location=etl_job.extract_location)
+        with report.stage(job=etl_job.name, stage='extract', output_directory=etl_job.extract_location,
+                          profile_modes=profiles.get(etl_job.name, ())) as metrics:
+            download_uris(gs_uris=etl_job.gs_uris,
+                          destination_location=etl_job.extract_location)
+            metrics.rows_out = len(etl_job.gs_uris)  # number of files
 
 
-def transform_all_data():
-    print("Start transforming all data...")
+def transform_and_load_all_data(report, profiles=None):
+    """
+    Runs the transform and load stage in one go, such that the final transformation of each job
+    is handed over in-memory to its loader instead of being written to and parsed from file.
+    """
+    print("Start transforming and loading all data...")
+    profiles = profiles or {}
 
-    for etl_job in ETL_JOBS:
-        transform(transformer=etl_job.transformer,
-                  extract_directory=etl_job.extract_location,
-                  transform_directory=etl_job.transform_location)
+    # If tables don't exist yet in the database, create them
+    config.SQLALCHEMY_BASE.metadata.create_all(config.SQLALCHEMY_ENGINE, checkfirst=True)
 
+    # The indexes of tables which are loaded by several jobs (e.g. trees and OPM) are only rebuilt after the last job
+    with IndexDeferral(models_per_job=[etl_job.loader.models for etl_job in ETL_JOBS]) as index_deferral:
+        for etl_job in ETL_JOBS:
+            with report.stage(job=etl_job.name, stage='transform', input_directory=etl_job.extract_location,
+                              output_directory=etl_job.transform_location,
+                              profile_modes=profiles.get(etl_job.name, ())) as metrics:
+                dataframe = transform(transformer=etl_job.transformer,
+                                      extract_directory=etl_job.extract_location,
+                                      transform_directory=etl_job.transform_location)
+                metrics.rows_out = len(dataframe) if hasattr(dataframe, '__len__') else None
 
-def load_all_data():
-    print("Start loading all data...")
+            with report.stage(job=etl_job.name, stage='load',
+                              profile_modes=profiles.get(etl_job.name, ())) as metrics:
+                metrics.rows_in = len(dataframe) if hasattr(dataframe, '__len__') else None
+                load(etl_job.loader, transform_directory=etl_job.transform_location, dataframe=dataframe,
+                     partial=etl_job.transformer.partial, index_deferral=index_deferral)
 
-    # If tables don't exist yet in the database, create them
-    config.SQLALCHEMY_BASE.metadata.create_all(config.SQLALCHEMY_ENGINE, checkfirst=True)
 
-    for etl_job in ETL_JOBS:
-        load(etl_job.loader, transform_directory=etl_job.transform_location)
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Extracts, transforms and loads all ETL jobs.')
+    parser.add_argument('--profile', action='append', default=[], metavar='JOB=MODES',
+                        help='profile the stages of a job, e.g. BIOCLIM_15=cpu,mem (cpu: cProfile and sampled stacks, '
+                             'mem: tracemalloc), the profiles are written next to the run report')
+    args = parser.parse_args()
+
+    try:
+        job_profiles = parse_profile_options(args.profile)
+    except ValueError as error:
+        parser.error(str(error))
 
+    unknown_jobs = set(job_profiles) - {etl_job.name for etl_job in ETL_JOBS}
+    if unknown_jobs:
+        parser.error(f'Unknown job(s) {", ".join(sorted(unknown_jobs))}')
 
-extract_all_data()
-transform_all_data()
-load_all_data()
+    run_report = RunReport()
+    extract_all_data(run_report, profiles=job_profiles)
+    transform_and_load_all_data(run_report, profiles=job_profiles)
+    print(f'Run report written to {run_report.directory / run_report.run_id}.json')
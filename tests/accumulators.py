@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from etl.transform.accumulators import MonthlyAccumulators
+from etl.transform.knmi import read_station_data, read_station_data_chunks
+
+
+class MonthlyAccumulatorsTestCases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.file_path = Path.cwd() / 'static' / 'station_data.csv'
+        cls.columns = ['temperature_avg', 'temperature_max', 'rain_sum']
+        cls.daily_values = read_station_data(file_path=cls.file_path,
+                                             columns=['station_id', 'date'] + cls.columns)
+
+    def test_resample(self):
+        """
+            Periods derived from the accumulators must equal grouping the daily values.
+        """
+        accumulators = MonthlyAccumulators.from_daily(self.daily_values)
+
+        for freq in ['M', 'Q', 'Y']:
+            df = accumulators.resample(freq=freq, means=['temperature_avg'], sums=['rain_sum'],
+                                       maxima=['temperature_max'])
+            expected = self.daily_values.groupby([pd.Grouper(key='date', freq=freq), 'station_id']).agg(
+                temperature_avg=('temperature_avg', 'mean'),
+                rain_sum=('rain_sum', 'sum'),
+                temperature_max=('temperature_max', 'max'))
+
+            self.assertTrue(df.index.equals(expected.index))
+            self.assertTrue(np.allclose(df.values, expected.values, equal_nan=True))
+
+    def test_from_chunks(self):
+        """
+            Months which are spread over several chunks must be combined.
+        """
+        accumulators = MonthlyAccumulators.from_chunks(
+            chunks=read_station_data_chunks(file_path=self.file_path, chunk_size=45,
+                                            columns=['station_id', 'date'] + self.columns),
+            columns=self.columns)
+        expected = MonthlyAccumulators.from_daily(self.daily_values).statistics
+
+        for statistic, df in accumulators.statistics.items():
+            self.assertTrue(df.index.equals(expected[statistic].index))
+            self.assertTrue(np.allclose(df.values, expected[statistic].values, equal_nan=True))
+
+        # 12 months of a single station
+        self.assertEqual(len(accumulators.statistics['count']), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,277 @@
+"""
+Scaling benchmarks of the ETL transformations on synthetic data (see 'synthetic.py'). Every transformer of the ETL
+jobs (thus every BioClim strategy), a few variants of BioClim 1 and the interpolators are run at each scale,
+their wall time, CPU time, peak memory and throughput are written to 'benchmark-<run id>.csv', e.g.
+
+    cd tests
+    PYTHONPATH=.. python benchmark.py --scales small medium --jobs 'BIOCLIM_*' interpolate
+
+A run fails (exit code 1) when a benchmark failed. Comparing a run with a previous run also fails when a benchmark
+became slower than the tolerance, or when a benchmark of the previous run (within the same scales and patterns) is
+missing:
+
+    PYTHONPATH=.. python benchmark.py --baseline benchmarks/benchmark-<run id>.csv
+
+Note: the parse cache and the climate cube (see 'etl.transform.cache') are only used next to the production data
+(static/etl), hence benchmarks run from any other directory measure uncached runs.
+"""
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from etl.jobs import ETL_JOBS
+from etl.instrumentation import RunReport
+from etl.transform.transformer import transform
+from etl.transform.transformers.bioclim import BioClim, BioClim1TimePartitionStrategy, interpolate
+from etl.transform.sampling import knn_weights
+from etl.transform.climate import IDWModel
+from synthetic import SyntheticDataset, BOUNDS
+
+# Scales of the synthetic data, 'large' is about the size of the production data
+SCALES = {
+    'small': dict(stations=10, years=2, neighbourhoods=500, points=10000, soil_polygons=1000),
+    'medium': dict(stations=35, years=10, neighbourhoods=3000, points=100000, soil_polygons=10000),
+    'large': dict(stations=50, years=30, neighbourhoods=13000, points=1000000, soil_polygons=100000),
+}
+
+# Variants of BioClim 1, i.e. the keyword arguments of 'BioClim', the 'incremental' variant is run twice
+BIOCLIM_VARIANTS = {
+    'chunked': dict(chunk_size=100000),
+    'polygon': dict(polygon_interpolation=True),
+    'raster': dict(raster=True),
+    'incremental': dict(incremental=True),
+}
+
+# Stations and years which are interpolated onto the points of each scale
+INTERPOLATORS = ['interpolate', 'knn_weights', 'IDWModel']
+
+# Columns identifying a benchmark within a summary
+KEY_COLUMNS = ['scale', 'job', 'stage']
+
+
+def source_file_names(etl_job):
+    return [gs_uri.rsplit('/', 1)[-1] for gs_uri in etl_job.gs_uris]
+
+
+def transformer_benchmarks(dataset, directory, patterns):
+    """
+    :return: list of (job, stage, input directory, output directory, function) tuples, the function returns the
+    number of rows it transformed.
+    """
+    benchmarks = []
+
+    def run(transformer, extract_directory, transform_directory):
+        dataframe = transform(transformer=transformer,
+                              extract_directory=extract_directory,
+                              transform_directory=transform_directory)
+
+        return len(dataframe) if hasattr(dataframe, '__len__') else None
+
+    for etl_job in ETL_JOBS:
+        if not any(fnmatch(etl_job.name, pattern) for pattern in patterns):
+            continue
+
+        extract_directory = dataset.write_extract_directory(
+            directory / 'extract' / etl_job.name,
+            file_names=source_file_names(etl_job),
+            layout='Gelderland' if etl_job.name.startswith('Gelderland') else 'Amsterdam')
+        transform_directory = directory / 'transform' / etl_job.name
+
+        benchmarks.append((etl_job.name, 'transform', extract_directory, transform_directory,
+                           lambda job=etl_job, source=extract_directory, target=transform_directory:
+                           run(job.transformer, source, target)))
+
+    bioclim_job = next(etl_job for etl_job in ETL_JOBS if etl_job.name == 'BIOCLIM_1')
+
+    for variant, kwargs in BIOCLIM_VARIANTS.items():
+        name = f'BIOCLIM_1-{variant}'
+        if not any(fnmatch(name, pattern) for pattern in patterns):
+            continue
+
+        extract_directory = dataset.write_extract_directory(directory / 'extract' / name,
+                                                            file_names=source_file_names(bioclim_job))
+        transform_directory = directory / 'transform' / name
+        transformer = BioClim(time_partition_strategy=BioClim1TimePartitionStrategy(), **kwargs)
+
+        # Incremental runs recompute nothing when rerun on the same station data
+        for stage in ['transform', 'rerun'] if kwargs.get('incremental') else ['transform']:
+            benchmarks.append((name, stage, extract_directory, transform_directory,
+                               lambda bioclim=transformer, source=extract_directory, target=transform_directory:
+                               run(bioclim, source, target)))
+
+    return benchmarks
+
+
+def interpolator_benchmarks(dataset, n_points, patterns):
+    """
+    Interpolates the values of all stations in all years onto 'n_points' random points.
+
+    :return: list of (job, stage, input directory, output directory, function) tuples, the function returns the
+    number of values it interpolated.
+    """
+    rng = dataset.rng('interpolators')
+    training_coordinates = dataset.station_coordinates
+    training_values = rng.normal(10, 2, size=(len(training_coordinates), len(dataset.years)))
+    coordinates = rng.uniform(BOUNDS[:2], BOUNDS[2:], size=(n_points, 2))
+
+    def run_interpolate():
+        # One regressor per year, as within 'BioClim'
+        for year in range(training_values.shape[1]):
+            interpolate(training_coordinates, training_values[:, year], coordinates)
+
+        return training_values.size // len(training_coordinates) * n_points
+
+    def run_knn_weights():
+        # Weights are computed once, all years are interpolated by a single sparse product
+        return (knn_weights(training_coordinates, coordinates) @ training_values).size
+
+    def run_idw_model():
+        for year in range(training_values.shape[1]):
+            IDWModel(training_coordinates, training_values[:, year]).predict(coordinates)
+
+        return training_values.size // len(training_coordinates) * n_points
+
+    functions = dict(zip(INTERPOLATORS, [run_interpolate, run_knn_weights, run_idw_model]))
+
+    return [(name, 'interpolate', None, None, functions[name]) for name in INTERPOLATORS
+            if any(fnmatch(name, pattern) for pattern in patterns)]
+
+
+def run_scale(scale, directory, report, patterns, seed=0):
+    """
+    Runs all benchmarks matching any of the patterns at one scale.
+
+    :param scale: name of the scale, see 'SCALES'.
+    :param directory: directory of the synthetic sources and transformations.
+    :param report: report of the run, see 'RunReport'.
+    :param patterns: patterns of the benchmark names, e.g. ['BIOCLIM_*', 'interpolate'].
+    """
+    dataset = SyntheticDataset(seed=seed, **SCALES[scale])
+
+    start_time = time.perf_counter()
+    benchmarks = transformer_benchmarks(dataset, directory=directory, patterns=patterns) \
+        + interpolator_benchmarks(dataset, n_points=SCALES[scale]['points'], patterns=patterns)
+    print(f'Generated the {scale} synthetic data in {time.perf_counter() - start_time:.1f}s')
+
+    for job, stage, input_directory, output_directory, function in benchmarks:
+        try:
+            with report.stage(job=job, stage=stage, input_directory=input_directory,
+                              output_directory=output_directory) as metrics:
+                metrics.rows_out = function()
+        except Exception as error:
+            # The failure is recorded within the report, the other benchmarks still run
+            print(f'{job} {stage} failed: {error!r}')
+
+
+def summarize(reports):
+    """
+    :param reports: dictionary of the scale onto the report of its run.
+    :return: dataframe holding one row per benchmark, including the scale and throughput.
+    """
+    df = pd.DataFrame([dict(scale=scale, **SCALES[scale], **metrics.to_dict())
+                       for scale, report in reports.items() for metrics in report.stages])
+
+    wall_time = pd.to_numeric(df['wall_time']).replace(0, np.nan)
+    df['rows_per_second'] = (pd.to_numeric(df['rows_out']) / wall_time).round(1)
+    df['input_mb_per_second'] = (pd.to_numeric(df['input_bytes']) / 1024 ** 2 / wall_time).round(2)
+
+    return df
+
+
+def succeeded(df):
+    return df[df['status'] == 'succeeded']
+
+
+def compare(df, df_baseline, tolerance=1.25):
+    """
+    :param df: summary of a run, see 'summarize'.
+    :param df_baseline: summary of a previous run.
+    :param tolerance: max ratio of the wall time over the wall time of the baseline.
+    :return: dataframe holding the benchmarks which became slower than the tolerance, only benchmarks which succeeded
+    in both runs are compared (the wall time of a failed benchmark is meaningless).
+    """
+    df = succeeded(df).merge(succeeded(df_baseline)[KEY_COLUMNS + ['wall_time']], on=KEY_COLUMNS,
+                             suffixes=('', '_baseline'))
+    df['ratio'] = (df['wall_time'] / df['wall_time_baseline']).round(2)
+
+    return df.loc[df['ratio'] > tolerance, KEY_COLUMNS + ['wall_time', 'wall_time_baseline', 'ratio']]
+
+
+def missing(df, df_baseline, scales, patterns):
+    """
+    :param df: summary of a run, see 'summarize'.
+    :param df_baseline: summary of a previous run.
+    :param scales: scales of the run, benchmarks of the baseline at other scales are not expected.
+    :param patterns: patterns of the benchmark names of the run, see 'run_scale'.
+    :return: dataframe holding the benchmarks which succeeded in the baseline, but didn't succeed in the run.
+    """
+    df_baseline = succeeded(df_baseline)
+    df_baseline = df_baseline[df_baseline['scale'].isin(scales)
+                              & df_baseline['job'].map(lambda job: any(fnmatch(job, pattern) for pattern in patterns))]
+
+    df_baseline = df_baseline[KEY_COLUMNS].merge(succeeded(df)[KEY_COLUMNS], on=KEY_COLUMNS, how='left',
+                                                 indicator=True)
+
+    return df_baseline.loc[df_baseline['_merge'] == 'left_only', KEY_COLUMNS]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs the scaling benchmarks of the ETL transformations '
+                                                 'on synthetic data.')
+    parser.add_argument('--scales', nargs='+', default=['small'], choices=list(SCALES))
+    parser.add_argument('--jobs', nargs='+', default=['*'], metavar='PATTERN',
+                        help='patterns of the benchmarks to run, e.g. BIOCLIM_* (jobs), BIOCLIM_1-polygon '
+                             f'(variants: {", ".join(BIOCLIM_VARIANTS)}) or interpolate '
+                             f'(interpolators: {", ".join(INTERPOLATORS)})')
+    parser.add_argument('--directory', type=Path, default=None,
+                        help='directory of the synthetic data, a temporary directory by default')
+    parser.add_argument('--output', type=Path, default=Path.cwd() / 'benchmarks',
+                        help='directory of the run reports and summary')
+    parser.add_argument('--baseline', type=Path, default=None, help='summary of a previous run to compare with')
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='max ratio of the wall time over the wall time of the baseline')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if (Path.cwd() / 'static' / 'etl').is_dir():
+        parser.error('Run the benchmarks outside of the directory of the production data (static/etl), '
+                     'such that its parse cache and climate cube are neither used nor overwritten')
+
+    run_id = datetime.now().strftime('%Y%m%dT%H%M%S')
+    reports = {}
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for scale in args.scales:
+            reports[scale] = RunReport(directory=args.output, run_id=f'{run_id}-{scale}')
+            run_scale(scale, directory=(args.directory or Path(temporary_directory)) / scale,
+                      report=reports[scale], patterns=args.jobs, seed=args.seed)
+
+    summary = summarize(reports)
+    summary.to_csv(args.output / f'benchmark-{run_id}.csv', index=False)
+
+    with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', 200):
+        print(summary[KEY_COLUMNS + ['status', 'wall_time', 'peak_rss', 'rows_out', 'rows_per_second']])
+    print(f'Summary written to {args.output / f"benchmark-{run_id}.csv"}')
+
+    failures = summary.loc[summary['status'] != 'succeeded', KEY_COLUMNS + ['status']]
+    if len(failures):
+        print(f'Failed benchmarks:\n{failures.to_string(index=False)}')
+
+    regressions, missing_benchmarks = [], []
+    if args.baseline:
+        baseline = pd.read_csv(args.baseline)
+        regressions = compare(summary, baseline, tolerance=args.tolerance)
+        missing_benchmarks = missing(summary, baseline, scales=args.scales, patterns=args.jobs)
+
+        if len(regressions):
+            print(f'Benchmarks slower than {args.tolerance}x the baseline:\n{regressions.to_string(index=False)}')
+        if len(missing_benchmarks):
+            print(f'Benchmarks of the baseline which did not succeed:\n{missing_benchmarks.to_string(index=False)}')
+
+    if len(failures) or len(regressions) or len(missing_benchmarks):
+        sys.exit(1)
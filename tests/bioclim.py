@@ -1,4 +1,6 @@
 import unittest
+import tempfile
+import numpy as np
 from etl.transform.transformers.bioclim import (
 
     BioClim1TimePartitionStrategy,
@@ -20,10 +22,13 @@ from etl.transform.transformers.bioclim import (
     BioClim17TimePartitionStrategy,
     BioClim18TimePartitionStrategy,
     BioClim19TimePartitionStrategy,
-    get_weather_station_values
+    get_weather_station_values,
+    BioClimFactory,
+    BioClimEnums
 )
 from pathlib import Path
 from math import isclose
+from synthetic import SyntheticDataset
 
 
 class BioClimTransformerTestCases(unittest.TestCase):
@@ -181,8 +186,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         df['longitude'] = 0
         df_year = BioClim8TimePartitionStrategy().aggregate(df)
 
-        # expected_sum_rainfall = 3485  # in mms
-        expected_average_temperature = 16.25326087  # From spreadsheet in google drive
+        # Rolling quarter July - September, which is the calendar quarter (spreadsheet in google drive: 16.25326087)
+        expected_average_temperature = 16.22645161
         calculated_average_temp = df_year['temperature_avg'].values[0]
 
         self.log(metric_id='temperature_avg',
@@ -203,7 +208,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         df['longitude'] = 0
         df_year = BioClim9TimePartitionStrategy().aggregate(df)
 
-        expected_average_temperature = 13.08571429  # From spreadsheet in google drive
+        # Rolling quarter April - June, which is the calendar quarter (spreadsheet in google drive: 13.08571429)
+        expected_average_temperature = 13.06225806
         calculated_average_temp = df_year['temperature_avg'].values[0]
 
         self.log(metric_id='temperature_avg',
@@ -221,7 +227,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         """
         df_year = BioClim10TimePartitionStrategy().aggregate(self.weather_station_values)
 
-        expected_average_temperature = 16.25326087  # From spreadsheet in google drive
+        # Rolling quarter June - August (calendar quarter July - September: 16.25326087)
+        expected_average_temperature = 16.81089606
         calculated_average_temp = df_year['temperature_avg'].values[0]
 
         self.log(metric_id='temperature_avg',
@@ -239,7 +246,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         """
         df_year = BioClim11TimePartitionStrategy().aggregate(self.weather_station_values)
 
-        expected_average_temperature = 6.071428571  # From spreadsheet in google drive
+        # Rolling quarter December - February (calendar quarter January - March: 6.071428571)
+        expected_average_temperature = 4.989173174
         calculated_average_temp = df_year['temperature_avg'].values[0]
 
         self.log(metric_id='temperature_avg',
@@ -333,7 +341,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         """
         df_year = BioClim16TimePartitionStrategy().aggregate(self.weather_station_values)
 
-        expected_sum_rainfall = 350  # in mm
+        # Rolling quarter July - September, which is the calendar quarter (spreadsheet in google drive: 350)
+        expected_sum_rainfall = 349.1  # in mm
         calculated_sum_rainfall = df_year['rain_sum'][0]
 
         self.log(metric_id='rain_sum',
@@ -351,7 +360,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         """
         df_year = BioClim17TimePartitionStrategy().aggregate(self.weather_station_values)
 
-        expected_sum_rainfall = 103.3  # in mm
+        # Rolling quarter April - June, which is the calendar quarter (spreadsheet in google drive: 103.3)
+        expected_sum_rainfall = 104.0  # in mm
         calculated_sum_rainfall = df_year['rain_sum'][0]
 
         self.log(metric_id='rain_sum',
@@ -369,7 +379,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         """
         df_year = BioClim18TimePartitionStrategy().aggregate(self.weather_station_values)
 
-        expected_sum_rainfall = 348.5  # in mm
+        # Rolling quarter June - August (calendar quarter July - September: 348.5)
+        expected_sum_rainfall = 296.2  # in mm
         calculated_sum_rainfall = df_year['rain_sum'].values[0]
 
         self.log(metric_id='rain_sum',
@@ -387,7 +398,8 @@ class BioClimTransformerTestCases(unittest.TestCase):
         """
         df_year = BioClim19TimePartitionStrategy().aggregate(self.weather_station_values)
 
-        expected_sum_rainfall = 240.4  # in mm
+        # Rolling quarter December - February (calendar quarter January - March: 240.4)
+        expected_sum_rainfall = 220.3  # in mm
         calculated_sum_rainfall = df_year['rain_sum'].values[0]
 
         self.log(metric_id='rain_sum',
@@ -399,6 +411,55 @@ class BioClimTransformerTestCases(unittest.TestCase):
                        b=expected_sum_rainfall,
                        rel_tol=self.MAX_PERCENT_DEVIATION)
 
+    def test_partition_station_coordinates(self):
+        """
+            Coordinates are looked up by station id after aggregation, stations without location are skipped.
+        """
+        station_coordinates = np.full((np.iinfo('uint16').max + 1, 2), np.nan, dtype='float32')
+        station_coordinates[self.weather_station_values['station_id'].values[0]] = (5.18, 52.1)
+
+        partitions = list(BioClim12TimePartitionStrategy().partition(self.weather_station_values, station_coordinates))
+        training_coordinates, training_values, year = partitions[0]
+
+        assert len(partitions) == 1
+        assert np.allclose(training_coordinates, [[5.18, 52.1]])
+
+        # Without a known location the station isn't used for training
+        station_coordinates[:] = np.nan
+        _, training_values, _ = next(BioClim12TimePartitionStrategy().partition(self.weather_station_values,
+                                                                                 station_coordinates))
+
+        assert len(training_values) == 0
+
+
+class BioClimSyntheticDataTestCases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Synthetic station data of 10 stations over 2 years, holding gaps, see 'SyntheticDataset'
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.extract_directory = SyntheticDataset(stations=10, years=2, neighbourhoods=50).write_extract_directory(
+            Path(cls.directory.name) / 'extract',
+            file_names=['station_data.csv', 'station_locations.csv', 'neighbourhoods.csv', 'provinces.csv'])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_transform(self):
+        """
+            Each BioClim variable must be interpolated onto every neighbourhood in every year.
+        """
+        for bioclim_id in BioClimEnums:
+            with self.subTest(bioclim_id=bioclim_id.name):
+                df = BioClimFactory.get_bioclim(bioclim_id).transform(
+                    extract_directory=self.extract_directory,
+                    transform_directory=Path(self.directory.name) / 'transform' / bioclim_id.name)
+
+                self.assertEqual(len(df), 2 * 50)
+                self.assertEqual(df['neighbourhood'].nunique(), 50)
+                self.assertTrue(np.isfinite(df['interpolated_values'].values.astype('float64')).all())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,104 @@
+import os
+import time
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from shapely.geometry import Point, box
+from etl.transform.cache import cached, save_dataframe, load_dataframe, write_entry, use_entry, META_FILE_NAME
+
+
+class CacheTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_directory = Path(self.directory.name) / 'cache'
+        self.source = Path(self.directory.name) / 'source.csv'
+        self.source.write_text('a\n1\n2\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load_dataframe(self):
+        """
+            All column types must survive a round trip through the cache.
+        """
+        df = pd.DataFrame({
+            'station_id': np.array([210, 240, 260], dtype='uint16'),
+            'date': pd.to_datetime(['2019-01-01', '2019-01-02', '2019-01-03']),
+            'value': np.array([1.5, np.nan, -0.3], dtype='float32'),
+            'name': ['De Bilt', None, 'Schiphol'],
+            'species': pd.Categorical(['eik', 'beuk', None]),
+            'geometry': [Point(5.1, 52.1), box(0, 0, 1, 1), None]
+        })
+
+        Path.mkdir(self.cache_directory)
+        save_dataframe(df, self.cache_directory)
+        loaded = load_dataframe(self.cache_directory)
+
+        pd.testing.assert_frame_equal(loaded.drop(columns='geometry'), df.drop(columns='geometry'))
+        self.assertTrue(loaded['geometry'][0].equals(Point(5.1, 52.1)))
+        self.assertTrue(loaded['geometry'][1].equals(box(0, 0, 1, 1)))
+        self.assertIsNone(loaded['geometry'][2])
+
+        # Numeric columns remain memory-mapped
+        self.assertIsInstance(loaded['value'].values.base, np.memmap)
+
+    def test_cached(self):
+        """
+            An unchanged source must only be parsed once, a changed source must be parsed again.
+        """
+        calls = []
+
+        @cached(version=1, cache_directory=self.cache_directory)
+        def parse(file_path, column):
+            calls.append(file_path)
+            return pd.read_csv(file_path)[[column]]
+
+        first = parse(file_path=self.source, column='a')
+        second = parse(file_path=self.source, column='a')
+
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(len(calls), 1)
+
+        self.source.write_text('a\n3\n')
+
+        self.assertEqual(list(parse(file_path=self.source, column='a')['a']), [3])
+        self.assertEqual(len(calls), 2)
+
+    def test_eviction(self):
+        """
+            Least recently used entries must be evicted when the cache exceeds its max size.
+        """
+        @cached(version=1, cache_directory=self.cache_directory, max_size=3000)
+        def parse(file_path, size):
+            return pd.DataFrame({'values': np.zeros(size)})
+
+        parse(file_path=self.source, size=200)
+        time.sleep(0.01)
+        parse(file_path=self.source, size=201)
+
+        entries = list(self.cache_directory.iterdir())
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(len(load_dataframe(entries[0])), 201)
+        self.assertTrue((entries[0] / META_FILE_NAME).is_file())
+        self.assertFalse(any(name.startswith('tmp') for name in os.listdir(self.cache_directory)))
+
+    def test_write_entry(self):
+        """
+            An entry which has been written in the meantime must be kept, without leaving a temporary directory.
+        """
+        directory = self.cache_directory / 'entry'
+        self.assertFalse(use_entry(directory))
+
+        write_entry(directory, writer=lambda entry_directory: (entry_directory / META_FILE_NAME).write_text('1'))
+        write_entry(directory, writer=lambda entry_directory: (entry_directory / META_FILE_NAME).write_text('2'))
+
+        self.assertTrue(use_entry(directory))
+        self.assertEqual((directory / META_FILE_NAME).read_text(), '1')
+        self.assertEqual(os.listdir(self.cache_directory), ['entry'])
+
+
+if __name__ == '__main__':
+    unittest.main()
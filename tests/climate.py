@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+from etl.transform.climate import IDWModel
+from etl.transform.transformers.bioclim import interpolate
+
+
+class ClimateQueryTestCases(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+
+        # Stations and points spread over the Netherlands (longitude, latitude)
+        self.training_coordinates = rng.uniform([3.3, 50.7], [7.2, 53.5], size=(30, 2))
+        self.training_values = rng.normal(10, 2, size=30)
+        self.points = rng.uniform([3.3, 50.7], [7.2, 53.5], size=(1000, 2))
+
+    def test_predict(self):
+        """
+            The model must predict the same values as 'interpolate'.
+        """
+        model = IDWModel(self.training_coordinates, self.training_values)
+
+        np.testing.assert_allclose(model.predict(self.points),
+                                   interpolate(self.training_coordinates, self.training_values, self.points))
+
+    def test_coinciding_station(self):
+        model = IDWModel(self.training_coordinates, self.training_values)
+
+        self.assertAlmostEqual(model.predict(self.training_coordinates[[7]])[0], self.training_values[7])
+
+    def test_too_few_stations(self):
+        with self.assertRaises(ValueError):
+            IDWModel(self.training_coordinates[:4], self.training_values[:4])
+
+
+if __name__ == '__main__':
+    unittest.main()
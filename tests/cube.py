@@ -0,0 +1,108 @@
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from etl.transform.accumulators import MonthlyAccumulators
+from etl.transform.cube import ClimateCube
+from etl.transform.incremental import station_year_hashes
+
+
+class ClimateCubeTestCases(unittest.TestCase):
+
+    @staticmethod
+    def get_accumulators(station_ids, start, periods):
+        """
+        :return: accumulators holding two daily values per station, per month.
+        """
+        dates = pd.date_range(start, periods=periods, freq='MS')
+        dates = dates.append(dates + pd.Timedelta(days=1))
+
+        df = pd.DataFrame({
+            'station_id': np.repeat(np.array(station_ids, dtype='uint16'), len(dates)),
+            'date': np.tile(dates, len(station_ids)),
+            'temperature_avg': np.arange(len(station_ids) * len(dates), dtype='float32')
+        })
+
+        return MonthlyAccumulators.from_daily(df)
+
+    def assertAccumulatorsEqual(self, expected, actual):
+        for statistic, df in expected.statistics.items():
+            pd.testing.assert_frame_equal(df.sort_index(), actual.statistics[statistic].sort_index(),
+                                          check_index_type=False)
+
+    def test_round_trip(self):
+        accumulators = self.get_accumulators([240, 260], '2018-01-01', 24)
+
+        with tempfile.TemporaryDirectory() as directory:
+            cube = ClimateCube.update(Path(directory) / 'cube', accumulators, source='abc')
+
+            self.assertEqual(cube.shape, (24, 2, 1))
+            self.assertEqual(cube.source, 'abc')
+            self.assertAccumulatorsEqual(accumulators, cube.to_accumulators())
+            self.assertTrue(station_year_hashes(accumulators).equals(station_year_hashes(cube.to_accumulators())))
+
+    def test_append(self):
+        accumulators = self.get_accumulators([240, 260], '2018-01-01', 24)
+
+        with tempfile.TemporaryDirectory() as directory:
+            ClimateCube.update(Path(directory) / 'cube', accumulators.select_years([2018]))
+            cube = ClimateCube.update(Path(directory) / 'cube', accumulators.select_years([2019]))
+
+            self.assertEqual(cube.shape, (24, 2, 1))
+            self.assertAccumulatorsEqual(accumulators, cube.to_accumulators())
+
+    def test_rewrite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ClimateCube.update(Path(directory) / 'cube', self.get_accumulators([260], '2019-01-01', 12))
+
+            # New station and earlier months, the months of the previous update are kept
+            cube = ClimateCube.update(Path(directory) / 'cube', self.get_accumulators([240], '2018-01-01', 12))
+
+            self.assertEqual(cube.shape, (24, 2, 1))
+            self.assertEqual(list(cube.station_ids), [240, 260])
+            self.assertEqual(cube.present().sum(), 24)
+            self.assertFalse((Path(directory) / 'cube.tmp').exists())
+
+    def test_other_source(self):
+        """
+            A cube updated from another source must only hold the months of that source.
+        """
+        accumulators = self.get_accumulators([240, 260], '2000-01-01', 24)
+
+        with tempfile.TemporaryDirectory() as directory:
+            ClimateCube.update(Path(directory) / 'cube', accumulators, source='a')
+            cube = ClimateCube.update(Path(directory) / 'cube', accumulators.select_years([2001]), source='b')
+
+            self.assertEqual(cube.source, 'b')
+            self.assertEqual(cube.shape, (12, 2, 1))
+            self.assertAccumulatorsEqual(accumulators.select_years([2001]), cube.to_accumulators())
+
+    def test_select(self):
+        accumulators = self.get_accumulators([240, 260], '2018-01-01', 24)
+
+        with tempfile.TemporaryDirectory() as directory:
+            cube = ClimateCube.update(Path(directory) / 'cube', accumulators)
+            df = cube.select('temperature_avg', station_ids=[260], start='2019-02', end='2019-03')
+
+            expected = accumulators.resample(freq='M', means=['temperature_avg']).xs(260, level='station_id')
+
+            self.assertEqual(list(df.index), list(pd.date_range('2019-02-01', periods=2, freq='MS')))
+            np.testing.assert_allclose(df[260].values, expected.loc['2019-02-28':'2019-03-31', 'temperature_avg'])
+
+    def test_select_unknown_station(self):
+        """
+            Stations which are not within the cube must raise a KeyError, instead of selecting a neighbouring station.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            cube = ClimateCube.update(Path(directory) / 'cube', self.get_accumulators([240, 260], '2018-01-01', 12))
+
+            for station_ids in [[250], [100], [999], [240, 999]]:
+                with self.assertRaises(KeyError):
+                    cube.select('temperature_avg', station_ids=station_ids)
+
+            self.assertEqual(list(cube.select('temperature_avg', station_ids=[260, 240]).columns), [260, 240])
+
+
+if __name__ == '__main__':
+    unittest.main()
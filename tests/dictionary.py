@@ -0,0 +1,53 @@
+import unittest
+import tempfile
+import pandas as pd
+from pathlib import Path
+from etl.transform.dictionary import dictionary_encode, dictionary_decode, DictionaryEncoder
+
+
+class DictionaryTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.transform_directory = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+            Decoding an encoded dataframe must return the original values, missing values included.
+        """
+        df = pd.DataFrame({'species': ['eik', None, 'beuk', 'eik'], 'height': [10.0, 4.5, 7.0, 12.0]})
+
+        encoded = dictionary_encode(df=df, columns=['species', 'neighbourhood'],
+                                    transform_directory=self.transform_directory)
+
+        self.assertEqual(list(encoded.columns), ['height', 'species_code'])
+        self.assertEqual(list(encoded['species_code']), [1, -1, 0, 1])
+
+        decoded = dictionary_decode(df=encoded, columns=['species'], transform_directory=self.transform_directory)
+
+        self.assertEqual(decoded['species'].astype('object').where(decoded['species'].notna(), None).tolist(),
+                         df['species'].tolist())
+        self.assertTrue(decoded['height'].equals(df['height']))
+
+    def test_chunks(self):
+        """
+            Codes must remain stable over chunks, such that chunks can be appended to one file.
+        """
+        encoder = DictionaryEncoder(columns=['species'])
+
+        first = encoder.encode(pd.DataFrame({'species': ['eik', 'beuk']}))
+        second = encoder.encode(pd.DataFrame({'species': ['linde', 'eik']}))
+        encoder.save(transform_directory=self.transform_directory)
+
+        self.assertEqual(list(second['species_code']), [2, first['species_code'][0]])
+
+        decoded = dictionary_decode(df=pd.concat([first, second], ignore_index=True), columns=['species'],
+                                    transform_directory=self.transform_directory)
+        self.assertEqual(list(decoded['species']), ['eik', 'beuk', 'linde', 'eik'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import pandas as pd
+from unittest import mock
+from sqlalchemy import MetaData, Table, Column, Integer, String
+from sqlalchemy.sql import Select, Insert
+from etl.load.dimensions import get_dimension_ids, get_categorical_ids
+
+# Dimension table, e.g. 'species'
+SPECIES = Table('species', MetaData(), Column('id', Integer, primary_key=True), Column('name', String, unique=True))
+
+
+def get_engine(rows):
+    """
+    :param rows: (value, id) rows the select of the dimension table returns.
+    :return: mocked engine, of which the connection is the attribute 'connection'.
+    """
+    engine = mock.MagicMock()
+    engine.connection = engine.begin.return_value.__enter__.return_value
+    engine.connection.execute.side_effect = lambda statement: rows if isinstance(statement, Select) else None
+
+    return engine
+
+
+class DimensionTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.model = mock.Mock(__table__=SPECIES)
+
+    def test_get_dimension_ids(self):
+        engine = get_engine(rows=[('eik', 1), ('beuk', 2)])
+
+        dimension_ids = get_dimension_ids(model=self.model, values=['eik', 'beuk', 'eik'], engine=engine)
+
+        self.assertEqual(dimension_ids, {'eik': 1, 'beuk': 2})
+        # Insert of the missing values, followed by the select
+        statements = [call.args[0] for call in engine.connection.execute.call_args_list]
+        self.assertEqual([isinstance(statement, Insert) for statement in statements], [True, False])
+
+    def test_get_dimension_ids_without_insert(self):
+        engine = get_engine(rows=[('eik', 1)])
+
+        get_dimension_ids(model=self.model, values=['eik'], insert_missing=False, engine=engine)
+
+        engine.connection.execute.assert_called_once()
+        self.assertIsInstance(engine.connection.execute.call_args.args[0], Select)
+
+    def test_get_categorical_ids(self):
+        values = pd.Series(pd.Categorical(['eik', None, 'beuk', 'eik'], categories=['beuk', 'eik', 'linde']))
+
+        ids = get_categorical_ids(model=self.model, values=values, engine=get_engine(rows=[('eik', 1), ('beuk', 2)]))
+
+        self.assertEqual(list(ids.astype('object').fillna(-1)), [1, -1, 2, 1])
+        self.assertEqual(str(ids.dtype), 'Int64')
+
+    def test_get_categorical_ids_unknown(self):
+        """
+            Values which are not within the dimension table must not silently become missing.
+        """
+        values = pd.Series(['eik', 'beuk'])
+        engine = get_engine(rows=[('eik', 1)])
+
+        with self.assertRaises(KeyError):
+            get_categorical_ids(model=self.model, values=values, insert_missing=False, engine=engine)
+
+        ids = get_categorical_ids(model=self.model, values=values, insert_missing=False, allow_unknown=True,
+                                  engine=engine)
+        self.assertEqual(ids.isna().tolist(), [False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import shapely.wkb
+from shapely.geometry import Point, Polygon
+from etl.transform.geometry import points_to_ewkb, geometries_to_ewkb
+
+
+class GeometryEncodingTestCases(unittest.TestCase):
+
+    def test_points_to_ewkb(self):
+        """
+            Vectorised EWKB points must equal the EWKB written by shapely.
+        """
+        ewkb_points = points_to_ewkb(x=[5.387, 4.9], y=[52.155, 52.37], precision=None)
+
+        self.assertEqual(ewkb_points[0], shapely.wkb.dumps(Point(5.387, 52.155), hex=True, srid=4326))
+        self.assertEqual(ewkb_points[1], shapely.wkb.dumps(Point(4.9, 52.37), hex=True, srid=4326))
+
+    def test_points_to_raw_wkb(self):
+        ewkb_points = points_to_ewkb(x=[5.387], y=[52.155], precision=None, hex=False)
+
+        self.assertEqual(ewkb_points[0], shapely.wkb.dumps(Point(5.387, 52.155), srid=4326))
+
+    def test_missing_points(self):
+        """
+            Missing coordinates must be encoded as NULL, instead of as points holding NaN coordinates.
+        """
+        for hex in [True, False]:
+            ewkb_points = points_to_ewkb(x=[5.387, float('nan')], y=[52.155, 52.37], precision=None, hex=hex)
+
+            self.assertIsNotNone(ewkb_points[0])
+            self.assertIsNone(ewkb_points[1])
+
+    def test_geometries_to_ewkb(self):
+        polygon = Polygon([(0, 0), (1, 0), (1, 1)])
+
+        self.assertEqual(geometries_to_ewkb([polygon, None], precision=None).tolist(),
+                         [shapely.wkb.dumps(polygon, hex=True, srid=4326), None])
+
+    def test_quantisation(self):
+        """
+            Coordinates must be rounded to the given number of decimals.
+        """
+        point = shapely.wkb.loads(points_to_ewkb(x=[5.123456789], y=[52.987654321], precision=7)[0], hex=True)
+        polygon = shapely.wkb.loads(geometries_to_ewkb([Polygon([(0, 0), (1.123456789, 0), (1, 1)])], precision=3)[0],
+                                    hex=True)
+
+        self.assertEqual((point.x, point.y), (5.1234568, 52.9876543))
+        self.assertEqual(polygon.exterior.coords[1], (1.123, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from etl.transform.accumulators import MonthlyAccumulators
+from etl.transform.incremental import IncrementalState, station_year_hashes
+
+
+class IncrementalStateTestCases(unittest.TestCase):
+
+    @staticmethod
+    def get_accumulators(temperatures):
+        """
+        :return: accumulators of 2 stations over 2 years (2018, 2019), holding one daily value per month.
+        """
+        dates = pd.date_range('2018-01-01', periods=24, freq='MS')
+
+        df = pd.DataFrame({
+            'station_id': np.repeat(np.array([240, 260], dtype='uint16'), 24),
+            'date': np.tile(dates, 2),
+            'temperature_avg': temperatures
+        })
+
+        return MonthlyAccumulators.from_daily(df)
+
+    def test_station_year_hashes(self):
+        temperatures = np.arange(48, dtype='float32')
+        hashes = station_year_hashes(self.get_accumulators(temperatures))
+
+        self.assertEqual(list(hashes.index), [(2018, 240), (2018, 260), (2019, 240), (2019, 260)])
+        self.assertEqual(len(set(hashes)), 4)
+        self.assertTrue(hashes.equals(station_year_hashes(self.get_accumulators(temperatures))))
+
+    def test_dirty_years(self):
+        temperatures = np.arange(48, dtype='float32')
+
+        with tempfile.TemporaryDirectory() as directory:
+            state = IncrementalState(directory=directory, version='BioClim1')
+            hashes = station_year_hashes(self.get_accumulators(temperatures))
+
+            # No previous run
+            self.assertIsNone(state.dirty_years(hashes))
+            state.save(hashes)
+
+            self.assertEqual(state.dirty_years(hashes), set())
+
+            # New daily value of station 260 in 2019
+            temperatures[-1] += 1
+            self.assertEqual(state.dirty_years(station_year_hashes(self.get_accumulators(temperatures))), {2019})
+
+            # Another version recomputes all years
+            self.assertIsNone(IncrementalState(directory=directory, version='BioClim2').dirty_years(hashes))
+
+    def test_sources(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = Path(directory) / 'station_locations.csv'
+            file_path.write_text('STN,LON(east),LAT(north)\n240,4.79,52.32\n')
+
+            hashes = station_year_hashes(self.get_accumulators(np.arange(48, dtype='float32')))
+            IncrementalState(directory=Path(directory) / 'state', sources=[file_path]).save(hashes)
+
+            # A changed station location affects the interpolation of all years
+            file_path.write_text('STN,LON(east),LAT(north)\n240,4.80,52.32\n')
+            self.assertIsNone(IncrementalState(directory=Path(directory) / 'state',
+                                               sources=[file_path]).dirty_years(hashes))
+
+
+if __name__ == '__main__':
+    unittest.main()
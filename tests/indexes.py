@@ -0,0 +1,121 @@
+import unittest
+from unittest import mock
+from sqlalchemy import MetaData, Table, Column, Integer, Index
+from etl.load.indexes import IndexDeferral, get_cluster_index, create_indexes, rebuild
+
+
+def get_model(name):
+    table = Table(name, MetaData(),
+                  Column('id', Integer, primary_key=True),
+                  Column('species_id', Integer),
+                  Index(f'ix_{name}_species_id', 'species_id'),
+                  Index(f'ix_{name}_id', 'id', info={'cluster': True}))
+
+    return mock.Mock(__table__=table)
+
+
+class IndexesTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.tree, self.opm, self.soil = get_model('tree'), get_model('opm'), get_model('soil')
+
+        # Records the order of the index operations, as (operation, table name)
+        self.calls = []
+
+        patchers = [mock.patch('etl.load.indexes.drop_indexes',
+                               side_effect=lambda table, engine: self.calls.append(('drop', table.name))),
+                    mock.patch('etl.load.indexes.rebuild',
+                               side_effect=lambda table, **kwargs: self.calls.append(('rebuild', table.name)))]
+
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def load(self, table_name):
+        self.calls.append(('load', table_name))
+
+    def test_deferred(self):
+        """
+            Indexes must be dropped before loading and rebuilt after loading.
+        """
+        with IndexDeferral(models_per_job=[[self.tree]], engine=mock.MagicMock()) as index_deferral:
+            with index_deferral.deferred(models=[self.tree]):
+                self.load('tree')
+
+        self.assertEqual(self.calls, [('drop', 'tree'), ('load', 'tree'), ('rebuild', 'tree')])
+
+    def test_shared_tables(self):
+        """
+            Tables loaded by several jobs must only be rebuilt once, after the last of these jobs.
+        """
+        models_per_job = [[self.tree], [self.soil], [self.tree, self.opm], [self.opm]]
+
+        with IndexDeferral(models_per_job=models_per_job, engine=mock.MagicMock()) as index_deferral:
+            for models in models_per_job:
+                with index_deferral.deferred(models=models):
+                    for model in models:
+                        self.load(model.__table__.name)
+
+        self.assertEqual(self.calls, [('drop', 'tree'), ('load', 'tree'),
+                                      ('drop', 'soil'), ('load', 'soil'), ('rebuild', 'soil'),
+                                      ('drop', 'opm'), ('load', 'tree'), ('load', 'opm'), ('rebuild', 'tree'),
+                                      ('load', 'opm'), ('rebuild', 'opm')])
+
+    def test_skip(self):
+        """
+            A job which doesn't load a shared table must not hold back its rebuild.
+        """
+        with IndexDeferral(models_per_job=[[self.tree], [self.tree]], engine=mock.MagicMock()) as index_deferral:
+            with index_deferral.deferred(models=[self.tree]):
+                self.load('tree')
+
+            index_deferral.skip(models=[self.tree])
+            self.load('other')
+
+        self.assertEqual(self.calls, [('drop', 'tree'), ('load', 'tree'), ('rebuild', 'tree'), ('load', 'other')])
+
+    def test_failed_load(self):
+        """
+            Indexes must be rebuilt when loading fails, also when other jobs would have loaded the table.
+        """
+        with self.assertRaises(ValueError):
+            with IndexDeferral(models_per_job=[[self.tree], [self.tree]], engine=mock.MagicMock()) as index_deferral:
+                with index_deferral.deferred(models=[self.tree]):
+                    raise ValueError
+
+        self.assertEqual(self.calls, [('drop', 'tree'), ('rebuild', 'tree')])
+
+
+class RebuildTestCases(unittest.TestCase):
+
+    def test_get_cluster_index(self):
+        self.assertEqual(get_cluster_index(get_model('tree').__table__).name, 'ix_tree_id')
+
+    @mock.patch('etl.load.indexes.create_index')
+    def test_create_indexes(self, create_index):
+        table = get_model('tree').__table__
+
+        create_indexes(table=table, engine=mock.MagicMock(), workers=2)
+
+        self.assertEqual({call.kwargs['index'].name for call in create_index.call_args_list},
+                         {'ix_tree_id', 'ix_tree_species_id'})
+
+    @mock.patch('etl.load.indexes.analyze')
+    @mock.patch('etl.load.indexes.cluster')
+    @mock.patch('etl.load.indexes.create_indexes')
+    def test_rebuild(self, create_indexes, cluster, analyze):
+        """
+            Tables must be clustered and analyzed after their indexes have been built.
+        """
+        manager = mock.Mock()
+        manager.attach_mock(create_indexes, 'create_indexes')
+        manager.attach_mock(cluster, 'cluster')
+        manager.attach_mock(analyze, 'analyze')
+
+        rebuild(table=get_model('tree').__table__, engine=mock.MagicMock(), cluster_tables=True, analyze_tables=True)
+
+        self.assertEqual([call[0] for call in manager.mock_calls], ['create_indexes', 'cluster', 'analyze'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import json
+import unittest
+import tempfile
+import pandas as pd
+from pathlib import Path
+from etl.instrumentation import RunReport, REPORT_COLUMNS
+
+
+class RunReportTestCases(unittest.TestCase):
+
+    def test_stage(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_directory = Path(directory) / 'transform'
+            report = RunReport(directory=Path(directory) / 'runs', run_id='run')
+
+            with report.stage(job='BIOCLIM_1', stage='transform', output_directory=output_directory) as metrics:
+                Path.mkdir(output_directory)
+                (output_directory / 'output.csv').write_text('a,b\n1,2\n')
+                metrics.rows_out = 1
+
+            with open(Path(directory) / 'runs' / 'run.json') as f:
+                stages = json.load(f)['stages']
+
+            df = pd.read_csv(Path(directory) / 'runs' / 'run.csv')
+
+        self.assertEqual(len(stages), 1)
+        self.assertEqual(stages[0]['status'], 'succeeded')
+        self.assertEqual(stages[0]['rows_out'], 1)
+        self.assertEqual(stages[0]['output_bytes'], 8)
+        self.assertGreaterEqual(stages[0]['wall_time'], 0)
+        self.assertEqual(list(df.columns), REPORT_COLUMNS)
+
+    def test_failed_stage(self):
+        with tempfile.TemporaryDirectory() as directory:
+            report = RunReport(directory=directory, run_id='run')
+
+            with self.assertRaises(ValueError):
+                with report.stage(job='Great_tit', stage='load'):
+                    raise ValueError
+
+            # The report is written, even though the stage failed
+            df = pd.read_csv(Path(directory) / 'run.csv')
+
+        self.assertEqual(list(df['status']), ['failed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,42 @@
 import unittest
 import math
+import numpy as np
+import shapely
 from etl.transform.transformers.bioclim import interpolate
+from synthetic import SyntheticDataset
 
 
 class InterpolationTestCases(unittest.TestCase):
 
-    def inverse_distance_weighting(self):
-        pass
+    def setUp(self):
+        dataset = SyntheticDataset(stations=20, years=1, neighbourhoods=200)
+        daily_values = dataset.daily_values()
+
+        # Mean annual temperature (in tenths) of each station, interpolated onto the neighbourhood centroids
+        self.training_coordinates = dataset.station_coordinates
+        self.training_values = daily_values.groupby('STN')['TG'].mean().loc[dataset.station_ids].values
+        self.interpolation_coordinates = shapely.get_coordinates(dataset.neighbourhoods()['centroid'].values)
+
+    def inverse_distance_weighting(self, training_coordinates, training_values, coordinate, n_neighbors=5):
+        """
+        :return: mean of the values of the 'n_neighbors' nearest training coordinates, weighted by their inverse
+        distance, the value of a coinciding training coordinate.
+        """
+        # Coordinates are (longitude, latitude) in degrees
+        distances = np.array([self.haversine_distance(lat1=coordinate[1],
+                                                      lat2=training_coordinate[1],
+                                                      lon1=coordinate[0],
+                                                      lon2=training_coordinate[0])
+                              for training_coordinate in training_coordinates])
+
+        nearest = np.argsort(distances)[:n_neighbors]
+
+        if distances[nearest[0]] == 0:
+            return training_values[nearest[0]]
+
+        weights = 1 / distances[nearest]
+
+        return (weights * training_values[nearest]).sum() / weights.sum()
 
     def haversine_distance(self, lat1, lat2, lon1, lon2):
         """
@@ -36,23 +66,23 @@ class InterpolationTestCases(unittest.TestCase):
         defined in sklearn.KNeighborsRegressor.
         :return:
         """
-        training_coordinates = None
-        training_values = None
-        interpolation_coordinates = None
-        predicted_interpolation_values = None
-        expected_interpolation_values = None
+        predicted_interpolation_values = interpolate(self.training_coordinates, self.training_values,
+                                                     self.interpolation_coordinates)
+        expected_interpolation_values = [self.inverse_distance_weighting(self.training_coordinates,
+                                                                         self.training_values, coordinate)
+                                         for coordinate in self.interpolation_coordinates]
+
+        np.testing.assert_allclose(predicted_interpolation_values, expected_interpolation_values)
 
-        interpolate(training_coordinates, training_values, interpolation_coordinates)
+    def test_coinciding_station(self):
+        """
+            A coordinate of a station must be interpolated to the value of that station.
+        """
+        predicted_interpolation_values = interpolate(self.training_coordinates, self.training_values,
+                                                     self.training_coordinates[[3]])
 
-        self.assertEqual(True, True)
+        self.assertAlmostEqual(predicted_interpolation_values[0], self.training_values[3])
 
 
 if __name__ == '__main__':
     unittest.main()
-
-lat1 = 51.516449
-lon1 = 5.491679
-lat2 = 51.522965
-lon2 = 5.533392
-
-print(InterpolationTestCases().haversine_distance(lat1,lat2,lon1,lon2))
\ No newline at end of file
@@ -0,0 +1,65 @@
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from etl.transform.knmi import find_header, yyyymmdd_to_datetime, read_station_data
+from etl.transform.transformers.KNMI import KNMIWeatherStationData
+
+
+class KNMIReaderTestCases(unittest.TestCase):
+
+    def test_find_header(self):
+        line_number, names = find_header('static/station_data.csv')
+
+        # Preamble of 40 lines followed by an empty line
+        self.assertEqual(line_number, 41)
+        self.assertEqual(names[:3], ['STN', 'YYYYMMDD', 'DDVEC'])
+
+    def test_yyyymmdd_to_datetime(self):
+        dates = yyyymmdd_to_datetime([20080101, 20000229, 19991231])
+
+        self.assertTrue(np.array_equal(dates, np.array(['2008-01-01', '2000-02-29', '1999-12-31'],
+                                                       dtype='datetime64[D]')))
+
+    def test_read_station_data(self):
+        """
+            Exports with another preamble, a commented header and padded values must be read as well.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = Path(directory) / 'station_data.csv'
+
+            with open(file_path, 'w') as f:
+                f.write('# BRON: KONINKLIJK NEDERLANDS METEOROLOGISCH INSTITUUT (KNMI)\n'
+                        '# STN,YYYYMMDD,   TG,   RH,   UG\n'
+                        '  240,20190601,  215,   -1,   70\n'
+                        '  240,20190602,     ,   34,   65\n')
+
+            df = read_station_data(file_path=file_path, columns=['station_id', 'date', 'temperature_avg', 'rain_sum'])
+
+        self.assertEqual(list(df.columns), ['station_id', 'date', 'temperature_avg', 'rain_sum'])
+        self.assertEqual(list(df['date']), [pd.Timestamp(2019, 6, 1), pd.Timestamp(2019, 6, 2)])
+        self.assertAlmostEqual(df['temperature_avg'].iloc[0], 21.5, places=5)
+        self.assertTrue(np.isnan(df['temperature_avg'].iloc[1]))
+        # Trace amount (-1) and tenths of mm
+        self.assertEqual(df['rain_sum'].iloc[0], 0)
+        self.assertAlmostEqual(df['rain_sum'].iloc[1], 3.4, places=5)
+
+
+class KNMIWeatherStationDataTestCases(unittest.TestCase):
+
+    def test_chunked_transform(self):
+        """
+            A transformation read in chunks must equal the transformation of the whole file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            df = KNMIWeatherStationData().transform(extract_directory=Path('static'),
+                                                    transform_directory=Path(directory) / 'whole')
+            df_chunked = KNMIWeatherStationData(chunk_size=100, workers=1).transform(
+                extract_directory=Path('static'), transform_directory=Path(directory) / 'chunked')
+
+        pd.testing.assert_frame_equal(df_chunked, df)
+
+
+if __name__ == '__main__':
+    unittest.main()
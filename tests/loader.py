@@ -0,0 +1,98 @@
+import unittest
+import tempfile
+import pandas as pd
+from pathlib import Path
+from unittest import mock
+from etl.load.loader import load
+from etl.load.loaders.base import DataframeLoader
+from etl.load.loaders.tree import Amsterdam
+from etl.transform.dictionary import DictionaryEncoder
+from config import FINAL_TRANSFORMATION_ID
+
+
+class LoadTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = mock.Mock(models=[mock.Mock(__table__=mock.Mock())], supports_dataframe=True)
+        self.dataframe = pd.DataFrame({'year': [2019, 2020], 'value': [1.0, 2.0]})
+
+    @mock.patch('etl.load.indexes.rebuild')
+    @mock.patch('etl.load.indexes.drop_indexes')
+    def test_load(self, drop_indexes, rebuild):
+        load(self.loader, transform_directory=None, dataframe=self.dataframe)
+
+        drop_indexes.assert_called_once()
+        rebuild.assert_called_once()
+        self.loader.load_dataframe.assert_called_once_with(dataframe=self.dataframe)
+
+    @mock.patch('etl.load.indexes.rebuild')
+    @mock.patch('etl.load.indexes.drop_indexes')
+    def test_load_empty(self, drop_indexes, rebuild):
+        """
+            An empty transformation must neither be loaded nor have the indexes of its tables rebuilt.
+        """
+        load(self.loader, transform_directory=None, dataframe=self.dataframe.iloc[:0])
+
+        drop_indexes.assert_not_called()
+        rebuild.assert_not_called()
+        self.loader.load_dataframe.assert_not_called()
+
+    @mock.patch('etl.load.indexes.rebuild')
+    @mock.patch('etl.load.indexes.drop_indexes')
+    def test_load_partial(self, drop_indexes, rebuild):
+        """
+            Reloading some years must keep the indexes of the tables.
+        """
+        load(self.loader, transform_directory=None, dataframe=self.dataframe, partial=True)
+
+        drop_indexes.assert_not_called()
+        rebuild.assert_not_called()
+        self.loader.load_dataframe.assert_called_once_with(dataframe=self.dataframe)
+
+
+class DataframeLoaderTestCases(unittest.TestCase):
+
+    def test_load_dataframe_required(self):
+        """
+            Loaders which support in-memory transformations must implement 'load_dataframe'.
+        """
+        class Loader(DataframeLoader):
+
+            def load(self, transform_directory):
+                pass
+
+        with self.assertRaises(TypeError):
+            Loader()
+
+
+class StreamedLoadTestCases(unittest.TestCase):
+
+    @mock.patch('etl.load.loaders.tree.COPY_CHUNK_SIZE', 2)
+    @mock.patch('etl.load.loaders.tree.load_trees')
+    def test_load_chunks(self, load_trees):
+        """
+            A streamed transformation must be loaded chunk by chunk, instead of being read into memory as a whole.
+        """
+        chunks = [pd.DataFrame({'species_dutch': ['eik', 'beuk'], 'geometry': ['POINT (1 2)', 'POINT (3 4)']}),
+                  pd.DataFrame({'species_dutch': ['linde', 'eik'], 'geometry': ['POINT (5 6)', 'POINT (7 8)']}),
+                  pd.DataFrame({'species_dutch': ['beuk'], 'geometry': ['POINT (9 10)']})]
+
+        with tempfile.TemporaryDirectory() as directory:
+            transform_directory = Path(directory)
+            file_path = transform_directory / f'trees_{FINAL_TRANSFORMATION_ID}.csv'
+
+            # Written chunk by chunk, as a streamed transformer does
+            encoder = DictionaryEncoder(columns=['species_dutch'])
+            for i, chunk in enumerate(chunks):
+                encoder.encode(chunk).to_csv(file_path, mode='a', header=i == 0, index=False)
+            encoder.save(transform_directory=transform_directory)
+
+            Amsterdam().load(transform_directory=transform_directory)
+
+        self.assertEqual(load_trees.call_count, 3)
+        self.assertEqual([list(call.kwargs['dataframe']['species_dutch']) for call in load_trees.call_args_list],
+                         [list(chunk['species_dutch']) for chunk in chunks])
+
+
+if __name__ == '__main__':
+    unittest.main()
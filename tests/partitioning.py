@@ -0,0 +1,118 @@
+import unittest
+import pandas as pd
+from unittest import mock
+from sqlalchemy import MetaData, Table, Column, Integer, Date, Index
+from etl.load.bulk import bulk_insert
+from etl.load.partitioning import (
+    year_partitioned_table_args,
+    is_partitioned,
+    partition_bounds,
+    partition_name,
+    delete_year
+)
+
+
+def get_table(name, partition_column_type, partition_by_year=True):
+    *indexes, kwargs = year_partitioned_table_args(Index(f'ix_{name}_year', 'year'),
+                                                   partition_column='year',
+                                                   partition_by_year=partition_by_year)
+
+    return Table(name, MetaData(),
+                 Column('id', Integer, primary_key=True),
+                 Column('year', partition_column_type, primary_key=True),
+                 *indexes, **kwargs)
+
+
+class PartitioningTestCases(unittest.TestCase):
+
+    def test_year_partitioned_table_args(self):
+        index = Index('ix_bioclim_1_year', 'year')
+
+        *table_args, kwargs = year_partitioned_table_args(index, partition_column='year', partition_by_year=True)
+        self.assertEqual(table_args, [index])
+        self.assertEqual(kwargs['postgresql_partition_by'], 'RANGE (year)')
+
+        *table_args, kwargs = year_partitioned_table_args(index, partition_column='year', partition_by_year=False)
+        self.assertEqual(table_args, [index])
+        self.assertNotIn('postgresql_partition_by', kwargs)
+
+        # The year column is known either way, such that a reload of a year can replace its rows
+        self.assertEqual(kwargs['info']['partition_column'], 'year')
+
+    def test_is_partitioned(self):
+        self.assertTrue(is_partitioned(get_table('bioclim_1', Integer)))
+        self.assertFalse(is_partitioned(get_table('bioclim_1', Integer, partition_by_year=False)))
+
+    def test_partition_bounds(self):
+        self.assertEqual(partition_bounds(get_table('bioclim_1', Integer), 2019), ('2019', '2020'))
+        self.assertEqual(partition_bounds(get_table('weather_station_data', Date), 2019),
+                         ("'2019-01-01'", "'2020-01-01'"))
+        self.assertEqual(partition_name(get_table('bioclim_1', Integer), 2019), 'bioclim_1_2019')
+
+
+class BulkInsertTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dataframe = pd.DataFrame({'year': [2018, 2019, 2018, 2020], 'value': [1.0, 2.0, 3.0, 4.0]})
+
+    @mock.patch('etl.load.bulk.check_partitioned')
+    @mock.patch('etl.load.bulk.truncate_partition')
+    @mock.patch('etl.load.bulk.create_partition')
+    @mock.patch('etl.load.bulk.copy_dataframe')
+    def test_route_years(self, copy_dataframe, create_partition, truncate_partition, check_partitioned):
+        """
+            Rows must be copied into the partition of their year, which is created and emptied first.
+        """
+        model = mock.Mock(__table__=get_table('bioclim_1', Integer))
+
+        bulk_insert(model=model, dataframe=self.dataframe, years=self.dataframe['year'], engine=mock.MagicMock())
+
+        check_partitioned.assert_called_once()
+        self.assertEqual([call.kwargs['year'] for call in create_partition.call_args_list], [2018, 2019, 2020])
+        self.assertEqual([call.kwargs['year'] for call in truncate_partition.call_args_list], [2018, 2019, 2020])
+        self.assertEqual([call.kwargs['table_name'] for call in copy_dataframe.call_args_list],
+                         ['bioclim_1_2018', 'bioclim_1_2019', 'bioclim_1_2020'])
+        self.assertEqual(list(copy_dataframe.call_args_list[0].kwargs['dataframe']['value']), [1.0, 3.0])
+
+    @mock.patch('etl.load.bulk.truncate_partition')
+    @mock.patch('etl.load.bulk.create_partition')
+    @mock.patch('etl.load.bulk.copy_dataframe')
+    def test_unpartitioned(self, copy_dataframe, create_partition, truncate_partition):
+        model = mock.Mock(__table__=get_table('bioclim_1', Integer, partition_by_year=False))
+
+        bulk_insert(model=model, dataframe=self.dataframe, years=self.dataframe['year'], replace=False,
+                    engine=mock.MagicMock())
+
+        create_partition.assert_not_called()
+        truncate_partition.assert_not_called()
+        self.assertEqual([call.kwargs['table_name'] for call in copy_dataframe.call_args_list], ['bioclim_1'])
+        self.assertEqual(len(copy_dataframe.call_args_list[0].kwargs['dataframe']), 4)
+
+    @mock.patch('etl.load.bulk.delete_year')
+    @mock.patch('etl.load.bulk.copy_dataframe')
+    def test_unpartitioned_replace(self, copy_dataframe, delete_year):
+        """
+            Without partitions the rows of the loaded years must be deleted, such that a reload doesn't duplicate these.
+        """
+        model = mock.Mock(__table__=get_table('bioclim_1', Integer, partition_by_year=False))
+        engine = mock.MagicMock()
+
+        bulk_insert(model=model, dataframe=self.dataframe, years=self.dataframe['year'], engine=engine)
+
+        self.assertEqual([call.kwargs['year'] for call in delete_year.call_args_list], [2018, 2019, 2020])
+        copy_dataframe.assert_called_once()
+        # Deleted and copied within one transaction
+        engine.begin.assert_called_once()
+
+    def test_delete_year(self):
+        connection = mock.Mock()
+
+        delete_year(connection=connection, table=get_table('weather_station_data', Date, partition_by_year=False),
+                    year=2019)
+
+        self.assertEqual(str(connection.execute.call_args.args[0]),
+                         "DELETE FROM weather_station_data WHERE year >= '2019-01-01' AND year < '2020-01-01'")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import tempfile
+from pathlib import Path
+from etl.profiling import parse_profile_options, profile
+
+
+def busy(n):
+    return [str(i) for i in range(n)]
+
+
+class ProfilingTestCases(unittest.TestCase):
+
+    def test_parse_profile_options(self):
+        self.assertEqual(parse_profile_options(['BIOCLIM_15=cpu,mem', 'Great_tit=mem', 'Great_tit=cpu']),
+                         {'BIOCLIM_15': ('cpu', 'mem'), 'Great_tit': ('mem', 'cpu')})
+
+        # All modes when none are given
+        self.assertEqual(parse_profile_options(['BIOCLIM_1']), {'BIOCLIM_1': ('cpu', 'mem')})
+
+        with self.assertRaises(ValueError):
+            parse_profile_options(['BIOCLIM_1=gpu'])
+
+    def test_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with profile(directory=directory, name='BIOCLIM_15-transform', modes=('cpu', 'mem')):
+                values = busy(200000)
+
+            file_names = sorted(file.name for file in Path(directory).iterdir())
+            allocations = (Path(directory) / 'BIOCLIM_15-transform.allocations.txt').read_text()
+            stacks = (Path(directory) / 'BIOCLIM_15-transform.collapsed').read_text()
+
+        self.assertEqual(len(values), 200000)
+        self.assertEqual(file_names, ['BIOCLIM_15-transform.allocations.txt',
+                                      'BIOCLIM_15-transform.collapsed',
+                                      'BIOCLIM_15-transform.pstats',
+                                      'BIOCLIM_15-transform.pstats.txt',
+                                      'BIOCLIM_15-transform.tracemalloc'])
+        self.assertIn('peak', allocations)
+        # Collapsed stacks hold one 'frame;frame count' per line
+        self.assertTrue(all(line.rsplit(' ', 1)[1].isdigit() for line in stacks.splitlines()))
+
+    def test_no_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with profile(directory=Path(directory) / 'profiles', name='BIOCLIM_15-transform', modes=()):
+                pass
+
+            self.assertFalse((Path(directory) / 'profiles').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+import pandas as pd
+from etl.transform.accumulators import MonthlyAccumulators
+from etl.transform.quarters import RollingQuarters, get_rolling_quarters
+
+
+class RollingQuartersTestCases(unittest.TestCase):
+
+    @staticmethod
+    def get_accumulators(temperatures, rain_sums):
+        """
+        :return: accumulators of one station-year (2019), holding one daily value per month.
+        """
+        df = pd.DataFrame({
+            'station_id': np.full(12, 240, dtype='uint16'),
+            'date': pd.date_range('2019-01-01', periods=12, freq='MS'),
+            'temperature_avg': temperatures,
+            'rain_sum': rain_sums
+        })
+
+        return MonthlyAccumulators.from_daily(df)
+
+    def test_rolling_sum(self):
+        """
+            Quarters wrap from December to January.
+        """
+        quarters = RollingQuarters.rolling_sum(np.arange(12, dtype='float64')[np.newaxis])
+
+        self.assertEqual(list(quarters[0]), [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 21, 12])
+
+    def test_select(self):
+        temperatures = [1, 2, 6, 9, 13, 16, 18, 18, 15, 11, 6, 3]
+        rain_sums = [60, 50, 40, 40, 50, 60, 80, 90, 80, 70, 80, 90]
+
+        quarters = RollingQuarters(self.get_accumulators(temperatures, rain_sums))
+
+        # Coldest quarter December - February, warmest June - August
+        self.assertAlmostEqual(quarters.select('temperature_avg', by='temperature_avg', extreme='min').iloc[0, 0], 2)
+        self.assertAlmostEqual(quarters.select('rain_sum', by='temperature_avg', extreme='min').iloc[0, 0], 200)
+        self.assertAlmostEqual(quarters.select('rain_sum', by='temperature_avg', extreme='max').iloc[0, 0], 230)
+        # Wettest quarter July - September, driest March - May
+        self.assertAlmostEqual(quarters.select('temperature_avg', by='rain_sum', extreme='max').iloc[0, 0], 17)
+        self.assertAlmostEqual(quarters.select('rain_sum', by='rain_sum', extreme='min').iloc[0, 0], 130)
+        self.assertEqual(quarters.select('rain_sum', by='rain_sum').index[0], (pd.Timestamp(2019, 12, 31), 240))
+
+    def test_get_rolling_quarters(self):
+        """
+            The quarter based variables share the quarters of the same station data.
+        """
+        temperatures = [1, 2, 6, 9, 13, 16, 18, 18, 15, 11, 6, 3]
+        rain_sums = [60, 50, 40, 40, 50, 60, 80, 90, 80, 70, 80, 90]
+
+        quarters = get_rolling_quarters(self.get_accumulators(temperatures, rain_sums))
+
+        self.assertIs(get_rolling_quarters(self.get_accumulators(temperatures, rain_sums)), quarters)
+        self.assertIsNot(get_rolling_quarters(self.get_accumulators(temperatures, rain_sums[::-1])), quarters)
+
+    def test_missing_months(self):
+        """
+            Quarters holding a month without any daily values are skipped.
+        """
+        temperatures = [np.nan, 2, 6, 9, 13, 16, 18, 18, 15, 11, 6, 3]
+        rain_sums = [np.nan] * 12
+
+        quarters = RollingQuarters(self.get_accumulators(temperatures, rain_sums))
+
+        self.assertAlmostEqual(quarters.select('temperature_avg', by='temperature_avg', extreme='min').iloc[0, 0],
+                               (2 + 6 + 9) / 3)
+        # No quarter at all
+        self.assertTrue(np.isnan(quarters.select('temperature_avg', by='rain_sum', extreme='max').iloc[0, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
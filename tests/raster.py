@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import numpy as np
+from shapely.geometry import box
+from etl.transform.raster import RasterGrid, RasterStore
+from etl.transform.reprojection import reproject_coordinates, RD_NEW, WGS84
+
+
+def mean_longitude(training_values, interpolate_coordinates):
+    """
+    Stub of 'interpolate', of which the value of a cell only depends on its location.
+    """
+    return training_values.mean() + interpolate_coordinates[:, 0]
+
+
+class RasterTestCases(unittest.TestCase):
+
+    def setUp(self):
+        # 10 x 20 cells of 1 km, around Utrecht
+        self.grid = RasterGrid(bounds=(130000, 450000, 150000, 460000), resolution=1000)
+
+    def test_grid(self):
+        self.assertEqual(self.grid.shape, (10, 20))
+        self.assertEqual(self.grid.transform, (130000, 1000, 0, 460000, 0, -1000))
+        self.assertEqual(sum(1 for _ in self.grid.windows(tile_size=8)), 6)
+
+        # North-up, the first row holds the northern cells
+        x, y = self.grid.cell_centers((slice(0, 2), slice(3, 4)))
+        self.assertEqual(list(x.ravel()), [133500, 133500])
+        self.assertEqual(list(y.ravel()), [459500, 458500])
+
+        self.assertEqual(self.grid.window((133200, 458100, 135000, 460000)), (slice(0, 2), slice(3, 5)))
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = RasterStore.create(directory=directory, grid=self.grid, tile_size=8)
+            store.write(layers=[(2019, {'training_values': np.array([1.0, 3.0])})], function=mean_longitude,
+                        workers=1)
+
+            self.assertEqual(store.years, [2019])
+            self.assertEqual(RasterStore(directory).meta['crs'], 'EPSG:28992')
+
+            x, y = self.grid.cell_centers()
+            longitudes, _ = reproject_coordinates(x=x.ravel(), y=y.ravel(), source_crs=RD_NEW, target_crs=WGS84)
+            np.testing.assert_allclose(store.read(2019), (2 + longitudes).reshape(x.shape), rtol=1e-6)
+
+            window = store.read(2019, bounds=(133200, 458100, 135000, 460000))
+            self.assertEqual(window.shape, (2, 2))
+
+    def test_mask(self):
+        # Only the western half of the grid is covered
+        longitudes, latitudes = reproject_coordinates(x=[130000, 140000], y=[450000, 460000], source_crs=RD_NEW,
+                                                      target_crs=WGS84)
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = RasterStore.create(directory=directory, grid=self.grid, tile_size=8,
+                                       geometries=[box(longitudes[0], latitudes[0], longitudes[1], latitudes[1])])
+            store.write(layers=[(2019, {'training_values': np.array([1.0])})], function=mean_longitude, workers=1)
+
+            raster = store.read(2019)
+
+        self.assertTrue(np.isfinite(raster[:, :9]).all())
+        self.assertTrue(np.isnan(raster[:, 11:]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import tempfile
+import pandas as pd
+from pathlib import Path
+from shapely.geometry import box
+from etl.transform.regions import RegionIndex, tag_regions
+
+
+class RegionTestCases(unittest.TestCase):
+
+    def setUp(self):
+        # Two adjacent neighbourhoods, sharing the border x = 1
+        self.codes = ['BU0001', 'BU0002']
+        self.geometries = [box(0, 0, 1, 1), box(1, 0, 2, 1)]
+
+    def test_query(self):
+        """
+            Each point must be assigned to the polygon containing it, points outside all polygons to -1.
+        """
+        index = RegionIndex(codes=self.codes, geometries=self.geometries)
+
+        regions = index.query(x=[0.5, 1.5, 3.0, 1.0], y=[0.5, 0.5, 0.5, 0.5])
+
+        self.assertEqual(list(regions[:3]), [0, 1, -1])
+        # Points on a shared border are assigned to exactly one of both polygons
+        self.assertIn(regions[3], [0, 1])
+
+    def test_tag_regions(self):
+        with tempfile.TemporaryDirectory() as extract_directory:
+            pd.DataFrame({'id': self.codes,
+                          'name': ['West', 'East'],
+                          'geometry': [geometry.wkt for geometry in self.geometries]}) \
+                .to_csv(Path(extract_directory) / 'neighbourhoods.csv', index=False)
+
+            df = tag_regions(df=pd.DataFrame({'count': [1, 2, 3]}),
+                             x=[1.5, 0.5, 5.0],
+                             y=[0.5, 0.5, 5.0],
+                             extract_directory=extract_directory)
+
+        self.assertEqual(list(df['neighbourhood'].astype('object').fillna('')), ['BU0002', 'BU0001', ''])
+        # Provinces have not been extracted, hence these are not tagged
+        self.assertNotIn('province', df)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from pyproj import Transformer
+from etl.transform.reprojection import reproject_coordinates, reproject_points, get_transformer
+from math import isclose
+
+
+class ReprojectionTestCases(unittest.TestCase):
+
+    def setUp(self):
+        # Amersfoort (origin of the 'rijksdriehoekcoordinaten'), Amsterdam and Nijmegen
+        self.x = [155000.0, 121000.0, 187000.0]
+        self.y = [463000.0, 487000.0, 428000.0]
+
+    def test_reproject_coordinates(self):
+        """
+            Vectorised reprojection must match reprojecting each coordinate on its own.
+        """
+        transformer = Transformer.from_crs(28992, 4326, always_xy=True)
+        longitudes, latitudes = reproject_coordinates(x=self.x, y=self.y)
+
+        for x, y, longitude, latitude in zip(self.x, self.y, longitudes, latitudes):
+            expected_longitude, expected_latitude = transformer.transform(x, y)
+
+            assert isclose(a=longitude, b=expected_longitude, abs_tol=1e-9)
+            assert isclose(a=latitude, b=expected_latitude, abs_tol=1e-9)
+
+    def test_reproject_points(self):
+        """
+            Points must hold the reprojected coordinates, Amersfoort lies at about (5.387, 52.155).
+        """
+        points = reproject_points(x=self.x, y=self.y)
+
+        self.assertEqual(len(points), 3)
+        assert isclose(a=points[0].x, b=5.387, abs_tol=1e-3)
+        assert isclose(a=points[0].y, b=52.155, abs_tol=1e-3)
+
+    def test_transformer_is_cached(self):
+        self.assertIs(get_transformer(28992, 4326), get_transformer(28992, 4326))
+
+
+if __name__ == '__main__':
+    unittest.main()
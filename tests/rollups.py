@@ -0,0 +1,50 @@
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from shapely.geometry import box
+from etl.transform.rollups import Rollups
+
+
+class RollupTestCases(unittest.TestCase):
+
+    def setUp(self):
+        # Three neighbourhoods, the first two within township 'A'
+        self.neighbourhood_data = pd.DataFrame({
+            'township': ['A', 'A', 'B'],
+            'area': [1.0, 3.0, 2.0],
+            'geometry': [box(0, 0, 1, 1), box(1, 0, 2, 1), box(5, 0, 6, 1)],
+            'centroid': [box(0, 0, 1, 1).centroid, box(1, 0, 2, 1).centroid, box(5, 0, 6, 1).centroid]
+        })
+
+    def test_aggregate(self):
+        rollups = Rollups(levels={'township': self.neighbourhood_data['township'].values},
+                          weights=self.neighbourhood_data['area'].values)
+
+        # Two years at once, the missing value of the second year is skipped
+        values = np.array([[10.0, 10.0],
+                           [20.0, np.nan],
+                           [30.0, 30.0]])
+
+        self.assertEqual(list(rollups.codes('township')), ['A', 'B'])
+        np.testing.assert_allclose(rollups.aggregate(level='township', values=values), [[17.5, 10.0], [30.0, 30.0]])
+        np.testing.assert_allclose(rollups.aggregate(level='township', values=values[:, 0]), [17.5, 30.0])
+
+    def test_from_neighbourhoods(self):
+        with tempfile.TemporaryDirectory() as extract_directory:
+            pd.DataFrame({'id': ['PV1'], 'name': ['West'], 'geometry': [box(0, 0, 3, 1).wkt]}) \
+                .to_csv(Path(extract_directory) / 'provinces.csv', index=False)
+
+            rollups = Rollups.from_neighbourhoods(neighbourhood_data=self.neighbourhood_data,
+                                                  extract_directory=extract_directory)
+
+        self.assertEqual(rollups.levels, ['township', 'province'])
+        self.assertEqual(list(rollups.codes('province')), ['PV1'])
+
+        # The third neighbourhood lies outside all provinces
+        np.testing.assert_allclose(rollups.aggregate(level='province', values=[10.0, 20.0, 30.0]), [17.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import tempfile
+import numpy as np
+from pathlib import Path
+from shapely.geometry import box
+from etl.transform.sampling import knn_weights, sample_polygons, sampling_matrix, PolygonInterpolator, \
+    haversine_coordinates
+from etl.transform.transformers.bioclim import interpolate
+
+
+class SamplingTestCases(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+
+        # Stations and points spread over the Netherlands (longitude, latitude)
+        self.training_coordinates = rng.uniform([3.3, 50.7], [7.2, 53.5], size=(20, 2))
+        self.training_values = rng.normal(10, 2, size=20)
+
+        # Two adjacent polygons, and one polygon too small to hold a grid point
+        self.geometries = np.array([box(4.0, 51.0, 4.1, 51.1),
+                                    box(4.1, 51.0, 4.3, 51.1),
+                                    box(5.0, 52.0, 5.0001, 52.0001)])
+
+    def test_knn_weights(self):
+        """
+            The sparse weights must predict the same values as 'interpolate'.
+        """
+        coordinates = np.random.default_rng(1).uniform([3.3, 50.7], [7.2, 53.5], size=(100, 2))
+        # A point which coincides with a station
+        coordinates[0] = self.training_coordinates[3]
+
+        np.testing.assert_allclose(knn_weights(self.training_coordinates, coordinates) @ self.training_values,
+                                   interpolate(self.training_coordinates, self.training_values, coordinates))
+        self.assertAlmostEqual((knn_weights(self.training_coordinates, coordinates) @ self.training_values)[0],
+                               self.training_values[3])
+
+    def test_sample_polygons(self):
+        coordinates, polygon_indexes = sample_polygons(geometries=self.geometries, spacing=0.01)
+
+        # The number of sample points is proportional to the area of a polygon
+        self.assertEqual(list(np.bincount(polygon_indexes)), [100, 200, 1])
+        self.assertEqual(len(coordinates), len(polygon_indexes))
+
+        matrix = sampling_matrix(polygon_indexes=polygon_indexes, n_polygons=len(self.geometries))
+        np.testing.assert_allclose(matrix.sum(axis=1).A1, 1)
+
+    def test_polygon_interpolator(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = Path(directory) / 'neighbourhoods.csv'
+            file_path.write_text('\n'.join(geometry.wkt for geometry in self.geometries))
+
+            interpolator = PolygonInterpolator.from_file(file_path=file_path, geometries=self.geometries,
+                                                         spacing=0.01, cache_directory=Path(directory) / 'cache')
+            cached_interpolator = PolygonInterpolator.from_file(file_path=file_path, geometries=None,
+                                                                spacing=0.01, cache_directory=Path(directory) / 'cache')
+
+        values = interpolator.interpolate(self.training_coordinates, self.training_values)
+
+        self.assertEqual(values.shape, (3,))
+        np.testing.assert_allclose(cached_interpolator.interpolate(self.training_coordinates, self.training_values),
+                                   values)
+
+    def test_haversine_coordinates(self):
+        """
+            Coordinates (longitude, latitude) in degrees must be read as (latitude, longitude) in radians.
+        """
+        np.testing.assert_allclose(haversine_coordinates([[5.18, 52.1]]), [[np.radians(52.1), np.radians(5.18)]])
+
+
+if __name__ == '__main__':
+    unittest.main()
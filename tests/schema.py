@@ -0,0 +1,56 @@
+import unittest
+import pandas as pd
+from etl.transform.schema import Schema
+
+
+class SchemaTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = Schema(
+            file_name='station_data.csv',
+            columns={'STN': 'station_id', 'YYYYMMDD': 'date', 'TG': 'temperature_avg', 'RH': 'rain_sum'},
+            dtypes={'STN': 'uint16', 'YYYYMMDD': 'str', 'TG': 'float32', 'RH': 'float32'},
+            read_options={'header': 40},
+            dates={'date': '%Y%m%d'},
+            replace={'rain_sum': {-1: 0}},
+            scale={'temperature_avg': 10, 'rain_sum': 10},
+            output_columns=['station_id', 'date', 'temperature_avg']
+        )
+
+    def test_read_csv(self):
+        """
+            Only the columns of the schema must be read, renamed and cast to their data types.
+        """
+        df = next(self.schema.read_csv(file_path='static/station_data.csv'))
+
+        self.assertEqual(list(df.columns), ['station_id', 'date', 'temperature_avg', 'rain_sum'])
+        self.assertEqual(df['station_id'].dtype, 'uint16')
+        self.assertEqual(df['temperature_avg'].dtype, 'float32')
+
+    def test_read_csv_in_chunks(self):
+        chunks = list(self.schema.read_csv(file_path='static/station_data.csv', chunk_size=100))
+
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True),
+                                      next(self.schema.read_csv(file_path='static/station_data.csv')))
+
+    def test_apply(self):
+        df = self.schema.apply(pd.DataFrame({
+            'station_id': [210, 210],
+            'date': ['20080101', '20080102'],
+            'temperature_avg': [25.0, -3.0],
+            'rain_sum': [-1.0, 12.0]
+        }))
+
+        self.assertEqual(df['date'].iloc[1], pd.Timestamp(2008, 1, 2))
+        self.assertEqual(list(df['temperature_avg']), [2.5, -0.3])
+        # Trace amounts (-1) are substituted before scaling
+        self.assertEqual(list(df['rain_sum']), [0, 1.2])
+
+    def test_select(self):
+        df = pd.DataFrame({'station_id': [210], 'date': ['20080101'], 'temperature_avg': [2.5], 'rain_sum': [0.0]})
+
+        self.assertEqual(list(self.schema.select(df).columns), ['station_id', 'date', 'temperature_avg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from unittest import mock
+from shapely.geometry import box
+from etl.transform.transformers.soil import overlay_chunk, WURAlterra
+
+
+class SoilOverlayTestCases(unittest.TestCase):
+
+    def test_overlay_chunk(self):
+        """
+            The area of each soil type must be split over the neighbourhoods it lies in.
+        """
+        neighbourhood_codes = np.array(['BU0001', 'BU0002'])
+        neighbourhood_geometries = np.array([box(0, 0, 100, 100), box(100, 0, 200, 100)])
+
+        df = pd.DataFrame({
+            'geometry': [box(0, 0, 50, 100).wkt, box(50, 0, 150, 100).wkt, box(160, 10, 170, 20).wkt],
+            'soil_type': ['zand', 'klei', 'zand']
+        })
+
+        areas = overlay_chunk(df=df,
+                              neighbourhood_codes=neighbourhood_codes,
+                              neighbourhood_geometries=neighbourhood_geometries) \
+            .set_index(['neighbourhood', 'soil_type'])['area']
+
+        self.assertAlmostEqual(areas['BU0001', 'zand'], 5000)
+        self.assertAlmostEqual(areas['BU0001', 'klei'], 5000)
+        self.assertAlmostEqual(areas['BU0002', 'klei'], 5000)
+        # Polygon lying within a neighbourhood
+        self.assertAlmostEqual(areas['BU0002', 'zand'], 100)
+        self.assertEqual(len(areas), 4)
+
+
+class WURAlterraTestCases(unittest.TestCase):
+
+    @mock.patch.object(WURAlterra, 'read_chunks', return_value=iter([]))
+    def test_empty_source(self, read_chunks):
+        """
+            A source without any rows must be transformed into an empty transformation, holding the output columns.
+        """
+        with tempfile.TemporaryDirectory() as transform_directory:
+            df = WURAlterra(streaming=False).transform(extract_directory=None,
+                                                       transform_directory=Path(transform_directory))
+
+        self.assertEqual(len(df), 0)
+        self.assertEqual(list(df.columns), WURAlterra.output_columns)
+
+    @mock.patch.object(WURAlterra, 'read_chunks', return_value=iter([]))
+    def test_empty_source_streaming(self, read_chunks):
+        with tempfile.TemporaryDirectory() as transform_directory:
+            self.assertIsNone(WURAlterra(streaming=True).transform(extract_directory=None,
+                                                                   transform_directory=Path(transform_directory)))
+
+            df = pd.read_csv(Path(transform_directory) / WURAlterra.output_file_name)
+
+        self.assertEqual(list(df.columns), WURAlterra.output_columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,413 @@
+"""
+Generator of synthetic, but realistically shaped, source data of the ETL jobs: KNMI daily station data, station
+locations, neighbourhood, township and province polygons, tree, OPM, butterfly and great tit observations and
+the soil map. Used by the tests and the scaling benchmarks (see 'benchmark.py') instead of the production data.
+"""
+import os
+import json
+import zlib
+import shutil
+import numpy as np
+import pandas as pd
+import shapely
+import geopandas as gpd
+from pathlib import Path
+from etl.transform.reprojection import reproject_coordinates, RD_NEW, WGS84
+
+# Bounding box (min longitude, min latitude, max longitude, max latitude) of the Netherlands
+BOUNDS = (3.36, 50.75, 7.23, 53.55)
+
+# Columns of a KNMI daily export, in order
+KNMI_CODES = ['STN', 'YYYYMMDD', 'DDVEC', 'FHVEC', 'FG', 'FHX', 'FHXH', 'FHN', 'FHNH', 'FXX', 'FXXH', 'TG', 'TN', 'TNH',
+              'TX', 'TXH', 'T10N', 'T10NH', 'SQ', 'SP', 'Q', 'DR', 'RH', 'RHX', 'RHXH', 'PG', 'PX', 'PXH', 'PN', 'PNH',
+              'VVN', 'VVNH', 'VVX', 'VVXH', 'NG', 'UG', 'UX', 'UXH', 'UN', 'UNH', 'EV24']
+
+# Description of the generated columns, written within the preamble of the KNMI export
+KNMI_DESCRIPTIONS = {
+    'YYYYMMDD': 'Datum (YYYY=jaar MM=maand DD=dag)',
+    'TG': 'Etmaalgemiddelde temperatuur (in 0.1 graden Celsius)',
+    'TN': 'Minimum temperatuur (in 0.1 graden Celsius)',
+    'TX': 'Maximum temperatuur (in 0.1 graden Celsius)',
+    'SQ': 'Zonneschijnduur (in 0.1 uur) berekend uit de globale straling (-1 voor <0.05 uur)',
+    'SP': 'Percentage van de langst mogelijke zonneschijnduur',
+    'Q': 'Globale straling (in J/cm2)',
+    'DR': 'Duur van de neerslag (in 0.1 uur)',
+    'RH': 'Etmaalsom van de neerslag (in 0.1 mm) (-1 voor <0.05 mm)',
+    'UG': 'Etmaalgemiddelde relatieve vochtigheid (in procenten)',
+    'UX': 'Maximale relatieve vochtigheid (in procenten)',
+    'UN': 'Minimale relatieve vochtigheid (in procenten)',
+}
+
+# Layout of the tree and OPM sources, which differs per province
+TREE_LAYOUTS = ('Amsterdam', 'Gelderland')
+
+TREE_SPECIES = ['Eik', 'Es', 'Linde', 'Esdoorn', 'Plataan', 'Iep', 'Populier', 'Wilg', 'Berk', 'Beuk']
+SOIL_TYPES = ['Zeeklei', 'Rivierklei', 'Veen', 'Zand', 'Leem', 'Moerige grond']
+BUTTERFLY_STAGES = ['rups', 'nest', 'vlinder']
+
+# Minimum number of stations holding data in every year, see 'interpolate' (5 nearest neighbours)
+MIN_COMPLETE_STATIONS = 5
+
+
+def random_polygons(n_polygons, bounds, rng):
+    """
+    :return: array holding the Voronoi polygons of 'n_polygons' random seeds, which tile the bounding box.
+    """
+    min_x, min_y, max_x, max_y = bounds
+    seeds = shapely.points(rng.uniform([min_x, min_y], [max_x, max_y], size=(n_polygons, 2)))
+    extent = shapely.box(min_x, min_y, max_x, max_y)
+
+    polygons = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(seeds), extend_to=extent))
+
+    # Voronoi polygons extend beyond the bounding box
+    return shapely.intersection(polygons, extent)
+
+
+def nearest(coordinates, seeds):
+    """
+    :return: index of the nearest seed of each coordinate.
+    """
+    distances = ((coordinates[:, None, :] - seeds[None, :, :]) ** 2).sum(axis=2)
+
+    return distances.argmin(axis=1)
+
+
+def random_rd_points(n_points, rng, bounds=BOUNDS):
+    """
+    :return: tuple holding the x and y arrays of random points within the Netherlands, in EPSG 28992.
+    """
+    min_x, min_y, max_x, max_y = bounds
+    longitudes, latitudes = rng.uniform(min_x, max_x, n_points), rng.uniform(min_y, max_y, n_points)
+
+    return reproject_coordinates(x=longitudes, y=latitudes, source_crs=WGS84, target_crs=RD_NEW)
+
+
+def random_dates(n_dates, years, rng):
+    """
+    :return: array holding random dates within the given years.
+    """
+    start, end = np.datetime64(f'{years[0]}-01-01'), np.datetime64(f'{years[-1] + 1}-01-01')
+
+    return start + rng.integers(0, (end - start).astype(int), n_dates).astype('timedelta64[D]')
+
+
+class SyntheticDataset:
+    """
+    Synthetic source data of a given scale. Each source is generated from its own seed, such that a source
+    is the same whichever other sources are generated (or in which order).
+
+    Daily values of the stations follow a seasonal cycle with a latitude gradient, a regional weather anomaly
+    shared by all stations, wet and dry days, and gaps: missing days, outages of several weeks, stations which
+    opened after the first year and stations without sunshine and humidity instruments.
+    """
+
+    def __init__(self, stations=10, years=2, neighbourhoods=100, points=10000, soil_polygons=1000, first_year=2000,
+                 gap_fraction=0.02, seed=0):
+        """
+        :param stations: number of weather stations, at least 'MIN_COMPLETE_STATIONS'.
+        :param years: number of years of daily station data.
+        :param neighbourhoods: number of neighbourhoods, these are grouped into townships (about 30 each).
+        :param points: number of points of each observation source, e.g. trees.
+        :param soil_polygons: number of polygons of the soil map.
+        :param first_year: first year of the daily station data.
+        :param gap_fraction: fraction of the station days which are missing.
+        :param seed: seed of the random generators.
+        """
+        if stations < MIN_COMPLETE_STATIONS:
+            raise ValueError(f'At least {MIN_COMPLETE_STATIONS} stations are required, got {stations}')
+
+        self._stations = stations
+        self._years = list(range(first_year, first_year + years))
+        self._neighbourhoods = neighbourhoods
+        self._points = points
+        self._soil_polygons = soil_polygons
+        self._gap_fraction = gap_fraction
+        self._seed = seed
+
+        # Written files, which are linked instead of generated again
+        self._file_paths = {}
+
+        rng = self.rng('stations')
+        min_x, min_y, max_x, max_y = BOUNDS
+        self._station_ids = np.sort(rng.choice(np.arange(200, 200 + 10 * stations), size=stations, replace=False))
+        self._station_coordinates = rng.uniform([min_x, min_y], [max_x, max_y], size=(stations, 2))
+
+    @property
+    def years(self):
+        return self._years
+
+    @property
+    def station_ids(self):
+        return self._station_ids
+
+    @property
+    def station_coordinates(self):
+        """
+        :return: array holding the (longitude, latitude) of each station.
+        """
+        return self._station_coordinates
+
+    def rng(self, name):
+        """
+        :return: random generator of one source.
+        """
+        return np.random.default_rng([self._seed, zlib.crc32(name.encode())])
+
+    def daily_values(self):
+        """
+        :return: dataframe holding the daily values of all stations, using the KNMI codes and units (e.g. tenths).
+        """
+        rng = self.rng('station_data')
+        dates = pd.date_range(f'{self._years[0]}-01-01', f'{self._years[-1]}-12-31', freq='D')
+        n_stations, n_days = self._stations, len(dates)
+
+        # Seasonal cycle, coldest around January 20th, and day length in tenths of hours
+        season = -np.cos(2 * np.pi * (dates.dayofyear.values - 20) / 365.25)
+        day_length = 123 + 40 * season
+
+        # Regional weather anomaly shared by all stations, an AR(1) process in tenths of degrees
+        anomaly = np.empty(n_days)
+        anomaly[0] = 0
+        for day, innovation in enumerate(rng.normal(0, 18, n_days)[1:], start=1):
+            anomaly[day] = 0.8 * anomaly[day - 1] + innovation
+
+        latitudes = self._station_coordinates[:, 1]
+        station_mean = 105 - 8 * (latitudes - 52) + rng.normal(0, 5, n_stations)
+
+        shape = (n_stations, n_days)
+        values = {}
+
+        values['TG'] = station_mean[:, None] + 70 * season + anomaly + rng.normal(0, 8, shape)
+        diurnal_range = np.clip(70 + 25 * season + rng.normal(0, 15, shape), 10, None)
+        values['TN'] = values['TG'] - diurnal_range / 2
+        values['TX'] = values['TG'] + diurnal_range / 2
+
+        wet = rng.random(shape) < 0.5
+        values['RH'] = np.where(wet, np.ceil(rng.gamma(0.7, 45, shape)), np.where(rng.random(shape) < 0.1, -1, 0))
+        values['DR'] = np.where(wet, np.minimum(240, np.ceil(values['RH'] * rng.uniform(0.3, 1.5, shape))), 0)
+
+        sunshine = day_length * rng.beta(2, 2, shape) * np.where(wet, 0.4, 1)
+        values['SQ'] = np.where(sunshine < 0.5, -1, np.round(sunshine))
+        values['SP'] = np.round(100 * sunshine / day_length)
+        values['Q'] = np.round((1300 + 1000 * season) * (0.3 + 0.7 * sunshine / day_length))
+
+        values['UG'] = np.clip(np.round(82 - 8 * season + np.where(wet, 6, -4) + rng.normal(0, 5, shape)), 30, 100)
+        values['UX'] = np.minimum(100, values['UG'] + 9)
+        values['UN'] = values['UG'] - 22
+
+        # Columns which aren't used by the ETL, filled with noise such that the file has the width of an export
+        for code in KNMI_CODES[2:]:
+            if code not in values:
+                values[code] = rng.integers(0, 100, shape).astype('float64')
+
+        # Stations without sunshine and humidity instruments
+        for station in np.flatnonzero(rng.random(n_stations) < 0.3):
+            for code in ['SQ', 'SP', 'Q', 'UG', 'UX', 'UN']:
+                values[code][station] = np.nan
+
+        # Missing days and outages of several weeks
+        missing = rng.random(shape) < self._gap_fraction
+        for station in np.flatnonzero(rng.random(n_stations) < 0.2):
+            start = rng.integers(0, n_days)
+            missing[station, start:start + rng.integers(14, 60)] = True
+
+        for code in KNMI_CODES[2:]:
+            values[code][missing] = np.nan
+
+        # Stations which opened after the first year, the first stations hold data in every year
+        present = np.ones(shape, dtype=bool)
+        for station in range(MIN_COMPLETE_STATIONS, n_stations):
+            if rng.random() < 0.2:
+                present[station, :rng.integers(0, n_days)] = False
+
+        df = pd.DataFrame({code: values[code][present] for code in KNMI_CODES[2:]})
+        df.insert(0, 'YYYYMMDD', np.tile(dates.strftime('%Y%m%d').astype(int).values, (n_stations, 1))[present])
+        df.insert(0, 'STN', np.repeat(self._station_ids, n_days).reshape(shape)[present])
+
+        return df
+
+    def write_station_data(self, file_path):
+        with open(file_path, 'w') as f:
+            f.write('BRON: SYNTHETISCHE DAGGEGEVENS, KONINKLIJK NEDERLANDS METEOROLOGISCH INSTITUUT (KNMI) FORMAAT\n')
+
+            for code, description in KNMI_DESCRIPTIONS.items():
+                f.write(f'# {code:<8} = {description};\n')
+
+            f.write('\n')
+            self.daily_values().to_csv(f, index=False, float_format='%.0f', na_rep='')
+
+    def write_station_locations(self, file_path):
+        pd.DataFrame({
+            'STN': self._station_ids,
+            'LON(east)': self._station_coordinates[:, 0].round(3),
+            'LAT(north)': self._station_coordinates[:, 1].round(3),
+            'ALT(m)': self.rng('station_locations').uniform(-5, 100, self._stations).round(1),
+            'NAME': [f'Station {station_id}' for station_id in self._station_ids]
+        }).to_csv(file_path, index=False)
+
+    def neighbourhoods(self):
+        """
+        :return: geodataframe (EPSG 4326) of the neighbourhoods, holding the columns of 'neighbourhoods.csv'.
+        """
+        rng = self.rng('neighbourhoods')
+        geometries = random_polygons(self._neighbourhoods, BOUNDS, rng)
+        centroids = shapely.centroid(geometries)
+
+        # Townships group about 30 neighbourhoods each, i.e. the neighbourhoods nearest to a township seed
+        min_x, min_y, max_x, max_y = BOUNDS
+        township_seeds = rng.uniform([min_x, min_y], [max_x, max_y], size=(max(1, len(geometries) // 30), 2))
+        townships = nearest(shapely.get_coordinates(centroids), township_seeds)
+
+        gdf = gpd.GeoDataFrame({
+            'name': [f'Buurt {index}' for index in range(len(geometries))],
+            'township': [f'Gemeente {township}' for township in townships],
+            'centroid': centroids,
+            'id': [f'BU{index:08d}' for index in range(len(geometries))],
+        }, geometry=geometries, crs=f'EPSG:{WGS84}')
+
+        # Area in m2
+        gdf['area'] = gdf.to_crs(f'EPSG:{RD_NEW}').area.round(1)
+
+        return gdf
+
+    def write_neighbourhoods(self, file_path):
+        gdf = self.neighbourhoods()
+
+        pd.DataFrame({
+            'geometry': shapely.to_wkt(gdf.geometry.values, rounding_precision=6),
+            'name': gdf['name'],
+            'township': gdf['township'],
+            'centroid': shapely.to_wkt(gdf['centroid'].values, rounding_precision=6),
+            'id': gdf['id'],
+            'area': gdf['area']
+        }).to_csv(file_path, index=False)
+
+    def write_townships(self, file_path):
+        gdf = self.neighbourhoods()
+        townships = gdf.dissolve(by='township')
+
+        features = [{'type': 'Feature',
+                     'properties': {'name': name, 'code': f'GM{index:04d}'},
+                     'geometry': json.loads(shapely.to_geojson(geometry))}
+                    for index, (name, geometry) in enumerate(zip(townships.index, townships.geometry.values))]
+
+        with open(file_path, 'w') as f:
+            json.dump({'type': 'FeatureCollection', 'features': features}, f)
+
+    def write_provinces(self, file_path):
+        geometries = random_polygons(12, BOUNDS, self.rng('provinces'))
+
+        pd.DataFrame({
+            'geometry': shapely.to_wkt(geometries, rounding_precision=6),
+            'name': [f'Provincie {index}' for index in range(len(geometries))],
+            'id': [f'PV{20 + index}' for index in range(len(geometries))]
+        }).to_csv(file_path, index=False)
+
+    def write_trees(self, file_path, layout='Amsterdam'):
+        rng = self.rng(f'trees-{layout}')
+        x, y = random_rd_points(self._points, rng)
+        species = rng.choice(TREE_SPECIES, self._points)
+
+        if layout == 'Amsterdam':
+            df = pd.DataFrame({'X': x.round(2), 'Y': y.round(2), 'Boomsoort nl': species})
+        else:
+            # Note: the Gelderland columns hold EPSG 28992 coordinates, despite their names
+            df = pd.DataFrame({'latitude': y.round(2), 'longitude': x.round(2), 'Boomnaam': species})
+
+        df.to_csv(file_path, index=False)
+
+    def write_infected_trees(self, file_path, layout='Amsterdam'):
+        rng = self.rng(f'infected_trees-{layout}')
+        x, y = random_rd_points(self._points, rng)
+        dates = pd.to_datetime(random_dates(self._points, self._years, rng)).strftime('%Y-%m-%d')
+
+        if layout == 'Amsterdam':
+            df = pd.DataFrame({'rdx': x.round(2), 'rdy': y.round(2), 'mutatiedatum': dates})
+        else:
+            df = pd.DataFrame({'longitude': x.round(2), 'latitude': y.round(2), 'date': dates})
+
+        df.to_csv(file_path, index=False)
+
+    def write_butterflies(self, file_path):
+        rng = self.rng('butterflies')
+        x, y = random_rd_points(self._points, rng)
+        dates = pd.to_datetime(random_dates(self._points, self._years, rng))
+
+        pd.DataFrame({
+            'dag': dates.day,
+            'maand': dates.month,
+            'jaar': dates.year,
+            'stadium': rng.choice(BUTTERFLY_STAGES, self._points),
+            'x': x.round(2),
+            'y': y.round(2)
+        }).to_csv(file_path, index=False)
+
+    def write_great_tits(self, file_path):
+        rng = self.rng('great_tits')
+        min_x, min_y, max_x, max_y = BOUNDS
+        points = shapely.points(rng.uniform([min_x, min_y], [max_x, max_y], size=(self._points, 2)))
+
+        pd.DataFrame({
+            'date': pd.to_datetime(random_dates(self._points, self._years, rng)).strftime('%Y-%m-%d'),
+            'count': rng.integers(1, 10, self._points),
+            'geometry': shapely.to_wkt(points, rounding_precision=6)
+        }).to_csv(file_path, index=False)
+
+    def write_soil_map(self, file_path):
+        rng = self.rng('soil_map')
+        min_x, min_y = reproject_coordinates(x=[BOUNDS[0]], y=[BOUNDS[1]], source_crs=WGS84, target_crs=RD_NEW)
+        max_x, max_y = reproject_coordinates(x=[BOUNDS[2]], y=[BOUNDS[3]], source_crs=WGS84, target_crs=RD_NEW)
+        geometries = random_polygons(self._soil_polygons, (min_x[0], min_y[0], max_x[0], max_y[0]), rng)
+
+        pd.DataFrame({
+            'geometry': shapely.to_wkt(geometries, rounding_precision=2),
+            'OMSCHRIJVI': rng.choice(SOIL_TYPES, len(geometries)),
+            'date': '2006-01-01'
+        }).to_csv(file_path, index=False)
+
+    def write(self, file_name, file_path, layout='Amsterdam'):
+        """
+        Writes one source file, a source which has already been written is linked (or copied) instead.
+
+        :param file_name: name of the source file, e.g. 'station_data.csv'.
+        :param file_path: path of the file to write.
+        :param layout: layout of the tree and OPM sources, see 'TREE_LAYOUTS'.
+        """
+        writers = {
+            'station_data.csv': self.write_station_data,
+            'station_locations.csv': self.write_station_locations,
+            'neighbourhoods.csv': self.write_neighbourhoods,
+            'townships.json': self.write_townships,
+            'provinces.csv': self.write_provinces,
+            'bomenbestand.csv': lambda path: self.write_trees(path, layout=layout),
+            'bomenbestand_geinfecteerd.csv': lambda path: self.write_infected_trees(path, layout=layout),
+            'vlinderstichting_2017-2019.csv': self.write_butterflies,
+            'great_tit.csv': self.write_great_tits,
+            'bodemkaart.csv': self.write_soil_map
+        }
+
+        if file_name not in writers:
+            raise ValueError(f'No synthetic source {file_name}, expected any of {", ".join(writers)}')
+
+        key = (file_name, layout if file_name.startswith('bomenbestand') else None)
+        Path.mkdir(Path(file_path).parent, parents=True, exist_ok=True)
+
+        if key in self._file_paths:
+            try:
+                os.link(self._file_paths[key], file_path)
+            except OSError:
+                shutil.copyfile(self._file_paths[key], file_path)
+        else:
+            writers[file_name](file_path)
+            self._file_paths[key] = file_path
+
+    def write_extract_directory(self, extract_directory, file_names, layout='Amsterdam'):
+        """
+        Writes the sources of one job, like the extract directory of an 'ETLJob'.
+
+        :return: extract directory.
+        """
+        for file_name in file_names:
+            self.write(file_name, Path(extract_directory) / file_name, layout=layout)
+
+        return Path(extract_directory)